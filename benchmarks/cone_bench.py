@@ -0,0 +1,60 @@
+#!/usr/bin/python3
+"""
+Benchmark for compiled combinational cones.
+
+Builds a wide and deep block of combinational logic (a chain of XOR/AND/OR stages)
+fed by a test-bench that changes the inputs every cycle, then simulates it with
+and without compiled cones.
+
+Usage: python benchmarks/cone_bench.py [depth ...]
+"""
+import sys
+import os
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from timeit import default_timer
+from silicon import *
+
+def create_top(depth: int, cycle_cnt: int):
+    class Top(Module):
+        def body(self):
+            self.a = Wire(Unsigned(16))
+            self.b = Wire(Unsigned(16))
+            value = self.a
+            for idx in range(depth):
+                if idx % 3 == 0:
+                    value = value ^ self.b
+                elif idx % 3 == 1:
+                    value = value & ~self.a
+                else:
+                    value = value | self.b
+            self.result = Wire(Unsigned(16))
+            self.result <<= value
+
+        def simulate(self) -> TSimEvent:
+            for idx in range(cycle_cnt):
+                self.a <<= (idx * 7919) & 0xffff
+                self.b <<= (idx * 104729) & 0xffff
+                yield 10
+    return Top
+
+def run(depth: int, cycle_cnt: int, compile_cones: bool) -> float:
+    with Netlist().elaborate() as netlist:
+        create_top(depth, cycle_cnt)()
+    with open(os.devnull, "w") as vcd_stream:
+        start = default_timer()
+        with Simulator(netlist, vcd_stream, compile_cones=compile_cones) as context:
+            context.simulate()
+        return default_timer() - start
+
+def main(depths):
+    cycle_cnt = 2000
+    print(f"{'depth':>10} {'events [s]':>10} {'cones [s]':>10} {'speedup':>8}")
+    for depth in depths:
+        event_time = run(depth, cycle_cnt, False)
+        cone_time = run(depth, cycle_cnt, True)
+        print(f"{depth:>10} {event_time:>10.4f} {cone_time:>10.4f} {event_time/cone_time:>7.1f}x")
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) if len(sys.argv) > 1 else (4, 16, 64))
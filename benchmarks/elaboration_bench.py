@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+"""
+Benchmark for the phases of elaboration (see Netlist.phase_times).
+
+Elaborates a chain of pass-through modules, driven through a chain of wires. All the ports and wires
+end up on a single XNet, which spans as many junctions as the chain is long.
+
+Usage: python benchmarks/elaboration_bench.py [chain length ...]
+"""
+import sys
+import os
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from timeit import default_timer
+from silicon import *
+
+class PassThrough(Module):
+    data_in = Input(Unsigned(8))
+    data_out = Output(Unsigned(8))
+
+    def body(self):
+        self.data_out <<= self.data_in
+
+def create_top(chain_length: int):
+    class Top(Module):
+        data_in = Input(Unsigned(8))
+        data_out = Output(Unsigned(8))
+
+        def body(self):
+            value = self.data_in
+            for idx in range(chain_length):
+                setattr(self, f"w{idx}", Wire(Unsigned(8)))
+                getattr(self, f"w{idx}").__ilshift__(value)
+                value = getattr(self, f"w{idx}")
+            for idx in range(chain_length):
+                setattr(self, f"u_pass{idx}", PassThrough())
+                getattr(self, f"u_pass{idx}").data_in <<= value
+                value = getattr(self, f"u_pass{idx}").data_out
+            self.data_out <<= value
+    return Top
+
+def main(chain_lengths):
+    phases = None
+    for chain_length in chain_lengths:
+        # Elaboration prints a line for every module
+        with open(os.devnull, "w") as null_stream:
+            stdout = sys.stdout
+            sys.stdout = null_stream
+            try:
+                start = default_timer()
+                with Netlist().elaborate() as netlist:
+                    create_top(chain_length)()
+                total_time = default_timer() - start
+            finally:
+                sys.stdout = stdout
+        if phases is None:
+            phases = tuple(netlist.phase_times.keys())
+            print(f"{'length':>8} {'xnets':>6} " + " ".join(f"{phase:>18}" for phase in phases) + f" {'total':>8}")
+        print(f"{chain_length:8} {len(netlist.xnets):6} " + " ".join(f"{netlist.phase_times[phase]:18.3f}" for phase in phases) + f" {total_time:8.3f}")
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) if len(sys.argv) > 1 else (100, 300, 1000))
@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+"""
+Benchmark for re-using the elaboration of identical module instances (Module.cache_elaboration).
+
+Elaborates a chain of many instances of a generic module with a couple of different parameterizations
+with and without the elaboration cache and reports the time spent in elaboration. The generated RTL is
+compared as well: it should be the same either way.
+
+Usage: python benchmarks/elaboration_cache_bench.py [instance count] [depth]
+"""
+import sys
+import os
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from typing import Tuple
+from timeit import default_timer
+from silicon import *
+
+class Stage(GenericModule):
+    clk = ClkPort()
+    rst = RstPort()
+    data_out = Output(Unsigned(8))
+
+    def construct(self, depth: int):
+        self.data_in = Input(Unsigned(8))
+        self.depth = depth
+
+    def body(self):
+        value = self.data_in
+        for idx in range(self.depth):
+            value = Reg((value ^ (idx + 1))[7:0])
+        self.data_out <<= value
+
+def create_top(instance_cnt: int, depth: int):
+    class Top(Module):
+        clk = ClkPort()
+        rst = RstPort()
+        data_in = Input(Unsigned(8))
+        data_out = Output(Unsigned(8))
+
+        def body(self):
+            value = self.data_in
+            for idx in range(instance_cnt):
+                setattr(self, f"u_stage{idx}", Stage(depth if idx % 2 else depth + 1))
+                getattr(self, f"u_stage{idx}").data_in <<= value
+                value = getattr(self, f"u_stage{idx}").data_out
+            self.data_out <<= value
+    return Top
+
+def elaborate(instance_cnt: int, depth: int, cache: bool) -> Tuple[float, str]:
+    # Elaboration prints a line for every module
+    with open(os.devnull, "w") as null_stream:
+        stdout = sys.stdout
+        sys.stdout = null_stream
+        try:
+            with ScopedAttr(Stage, "cache_elaboration", cache):
+                start = default_timer()
+                with Netlist().elaborate() as netlist:
+                    create_top(instance_cnt, depth)()
+                elaboration_time = default_timer() - start
+            rtl = StrStream()
+            netlist.generate(SystemVerilog(stream_class=rtl))
+        finally:
+            sys.stdout = stdout
+    return elaboration_time, str(rtl)
+
+def main(instance_cnt: int, depth: int):
+    uncached_time, uncached_rtl = elaborate(instance_cnt, depth, False)
+    cached_time, cached_rtl = elaborate(instance_cnt, depth, True)
+
+    print(f"{instance_cnt} instances of depth {depth} and {depth+1}")
+    print(f"elaboration without cache: {uncached_time:.3f}s")
+    print(f"elaboration with cache:    {cached_time:.3f}s")
+    print(f"RTL {'matches' if uncached_rtl == cached_rtl else 'DIFFERS'}")
+
+if __name__ == "__main__":
+    instance_cnt = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    main(instance_cnt, depth)
@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+"""
+Benchmark for the persistent elaboration cache (see silicon/elaboration_cache.py).
+
+Elaborates a chain of many instances of a generic module through an ElaborationCache twice: the first
+run elaborates the design and stores the netlist, the second one loads it. Reports the time of both
+and the size of the stored netlist. The generated RTL is compared as well: it should be the same either way.
+
+Usage: python benchmarks/elaboration_store_bench.py [instance count] [depth]
+"""
+import sys
+import os
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from typing import Tuple
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+from silicon import *
+
+class Stage(GenericModule):
+    clk = ClkPort()
+    rst = RstPort()
+    data_out = Output(Unsigned(8))
+
+    def construct(self, depth: int):
+        self.data_in = Input(Unsigned(8))
+        self.depth = depth
+
+    def body(self):
+        value = self.data_in
+        for idx in range(self.depth):
+            value = Reg((value ^ (idx + 1))[7:0])
+        self.data_out <<= value
+
+class Top(GenericModule):
+    clk = ClkPort()
+    rst = RstPort()
+    data_in = Input(Unsigned(8))
+    data_out = Output(Unsigned(8))
+
+    def construct(self, instance_cnt: int, depth: int):
+        self.instance_cnt = instance_cnt
+        self.depth = depth
+
+    def body(self):
+        value = self.data_in
+        for idx in range(self.instance_cnt):
+            setattr(self, f"u_stage{idx}", Stage(self.depth if idx % 2 else self.depth + 1))
+            getattr(self, f"u_stage{idx}").data_in <<= value
+            value = getattr(self, f"u_stage{idx}").data_out
+        self.data_out <<= value
+
+def elaborate(cache: ElaborationCache, instance_cnt: int, depth: int) -> Tuple[float, Netlist, str]:
+    # Elaboration prints a line for every module
+    with open(os.devnull, "w") as null_stream:
+        stdout = sys.stdout
+        sys.stdout = null_stream
+        try:
+            start = default_timer()
+            netlist = cache.elaborate(Top, instance_cnt, depth)
+            elaboration_time = default_timer() - start
+            rtl = StrStream()
+            netlist.generate(SystemVerilog(stream_class=rtl))
+        finally:
+            sys.stdout = stdout
+    return elaboration_time, netlist, str(rtl)
+
+def main(instance_cnt: int, depth: int):
+    with TemporaryDirectory() as cache_dir:
+        cache = ElaborationCache(cache_dir, dump_stack_size=ElaborationCache.deep_stack_size)
+        elaboration_time, _, elaborated_rtl = elaborate(cache, instance_cnt, depth)
+        cached_time, netlist, cached_rtl = elaborate(cache, instance_cnt, depth)
+        entry_size = sum(entry.stat().st_size for entry in Path(cache_dir).iterdir())
+
+    print(f"{instance_cnt} instances of depth {depth} and {depth+1}")
+    print(f"elaboration (and store): {elaboration_time:.3f}s")
+    print(f"load from cache:         {cached_time:.3f}s (of which {netlist.phase_times['load']:.3f}s loading the netlist)")
+    print(f"stored netlist size:     {entry_size / 1024:.0f}kB")
+    print(f"RTL {'matches' if elaborated_rtl == cached_rtl else 'DIFFERS'}")
+
+if __name__ == "__main__":
+    instance_cnt = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    main(instance_cnt, depth)
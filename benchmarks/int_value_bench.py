@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+"""
+Benchmark for the simulation value representation of integer (precision 0) Number nets.
+
+Simulates a small datapath (an accumulator with masking and comparison logic) in the
+event-driven simulator and reports the run time and the number of Number.NetValue objects
+created per simulated cycle.
+
+Usage: python benchmarks/int_value_bench.py [cycle count]
+"""
+import sys
+import os
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from timeit import default_timer
+from silicon import *
+
+class Dut(Module):
+    clk = ClkPort()
+    rst = RstPort()
+    step = Input(Unsigned(4))
+    mask = Input(Unsigned(8))
+    acc = Output(Unsigned(8))
+    masked = Output(Unsigned(8))
+    is_big = Output(logic)
+
+    def body(self):
+        self.acc <<= Reg((self.acc + self.step)[7:0])
+        self.masked <<= (self.acc & self.mask) ^ concat(self.step, self.acc[3:0]) | (self.acc ^ self.mask)
+        self.is_big <<= (self.masked > self.mask) & ~self.acc[0]
+
+def create_test_bench(cycle_cnt: int):
+    class TestBench(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.step = Wire(Unsigned(4))
+            self.mask = Wire(Unsigned(8))
+            dut = Dut()
+            dut.step <<= self.step
+            dut.mask <<= self.mask
+
+        def simulate(self) -> TSimEvent:
+            self.clk <<= 0
+            self.rst <<= 1
+            for cycle in range(cycle_cnt):
+                if cycle == 2:
+                    self.rst <<= 0
+                self.step <<= (cycle * 7) & 15
+                self.mask <<= (cycle * 31) & 255
+                yield 5
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+    return TestBench
+
+def run(cycle_cnt: int, compile_cones: bool):
+    with Netlist().elaborate() as netlist:
+        create_test_bench(cycle_cnt)()
+
+    alloc_cnt = 0
+    original_init = Number.NetValue.__init__
+    def counting_init(self, *args, **kwargs):
+        nonlocal alloc_cnt
+        alloc_cnt += 1
+        original_init(self, *args, **kwargs)
+
+    Number.NetValue.__init__ = counting_init
+    try:
+        with open(os.devnull, "w") as vcd_stream:
+            start = default_timer()
+            with Simulator(netlist, vcd_stream, compile_cones=compile_cones) as context:
+                context.simulate()
+            run_time = default_timer() - start
+    finally:
+        Number.NetValue.__init__ = original_init
+    return run_time, alloc_cnt
+
+def main(cycle_cnt: int):
+    print(f"{'mode':>10} {'time [s]':>10} {'cycles/s':>10} {'NetValues/cycle':>16}")
+    for compile_cones in (False, True):
+        run_time, alloc_cnt = run(cycle_cnt, compile_cones)
+        print(f"{'cones' if compile_cones else 'events':>10} {run_time:>10.3f} {cycle_cnt/run_time:>10.0f} {alloc_cnt/cycle_cnt:>16.1f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
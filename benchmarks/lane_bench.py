@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+"""
+Benchmark for multi-lane simulation.
+
+Simulates the same small datapath (an accumulator with some masking logic) with N different
+stimulus sets: once as N serial CycleSimulator runs and once as a single LaneSimulator run with
+N lanes. The LaneSimulator is built on the CycleSimulator, so the difference is down to evaluating
+all lanes at once, with vectorized NumPy operations.
+
+Usage: python benchmarks/lane_bench.py [lane count ...]
+"""
+import sys
+import os
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from timeit import default_timer
+from silicon import *
+
+cycle_cnt = 200
+
+class Dut(Module):
+    clk = ClkPort()
+    rst = RstPort()
+    step = Input(Unsigned(4))
+    mask = Input(Unsigned(8))
+    acc = Output(Unsigned(8))
+    masked = Output(Unsigned(8))
+
+    def body(self):
+        self.acc <<= Reg((self.acc + self.step)[7:0])
+        self.masked <<= (self.acc & self.mask) ^ concat(self.step, self.acc[3:0]) | (self.acc ^ self.mask)
+
+def stimulus(lane: int, cycle: int):
+    return (cycle * 7 + lane * 13) & 15, (cycle * 31 + lane) & 255
+
+def elaborate(top_class):
+    with Netlist().elaborate() as netlist:
+        top = top_class()
+    return netlist, top
+
+def run_serial(lane_cnt: int) -> float:
+    netlist, top = elaborate(Dut)
+    with open(os.devnull, "w") as vcd_stream:
+        start = default_timer()
+        for lane in range(lane_cnt):
+            with CycleSimulator(netlist, vcd_stream) as context:
+                top.rst <<= 1
+                for cycle in range(cycle_cnt):
+                    if cycle == 2:
+                        top.rst <<= 0
+                    step, mask = stimulus(lane, cycle)
+                    top.step <<= step
+                    top.mask <<= mask
+                    context.run_cycles(1)
+        return default_timer() - start
+
+def run_lanes(lane_cnt: int) -> float:
+    netlist, top = elaborate(Dut)
+    with open(os.devnull, "w") as vcd_stream:
+        start = default_timer()
+        with LaneSimulator(netlist, vcd_stream, lane_cnt=lane_cnt) as context:
+            top.rst <<= 1
+            for cycle in range(cycle_cnt):
+                if cycle == 2:
+                    top.rst <<= 0
+                lane_stimulus = tuple(stimulus(lane, cycle) for lane in range(lane_cnt))
+                context.set_lanes(top.step, tuple(step for step, _ in lane_stimulus))
+                context.set_lanes(top.mask, tuple(mask for _, mask in lane_stimulus))
+                context.run_cycles(1)
+        return default_timer() - start
+
+def main(lane_cnts):
+    print(f"{'lanes':>10} {'serial [s]':>10} {'lanes [s]':>10} {'speedup':>8}")
+    for lane_cnt in lane_cnts:
+        serial_time = run_serial(lane_cnt)
+        lane_time = run_lanes(lane_cnt)
+        print(f"{lane_cnt:>10} {serial_time:>10.4f} {lane_time:>10.4f} {serial_time/lane_time:>7.1f}x")
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) if len(sys.argv) > 1 else (1, 8, 64, 256))
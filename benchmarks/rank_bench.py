@@ -0,0 +1,88 @@
+#!/usr/bin/python3
+"""
+Scaling benchmark for ranking (topologically sorting) the modules of a netlist.
+
+Elaborating a design of a million gates would take far longer than ranking it, so the synthetic
+netlists are built directly from minimal stand-ins of modules, ports and XNets, which provide just what
+Netlist._rank_netlist uses. Every gate is combinational, with two inputs driven by recent gates: the
+logic is as deep as it is wide, way deeper than Python's recursion limit.
+
+Usage: python benchmarks/rank_bench.py [gate count ...]
+"""
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from random import Random
+from timeit import default_timer
+from silicon import *
+
+class FakeXNet(object):
+    __slots__ = ("source", "sinks")
+    def __init__(self, source):
+        self.source = source
+        self.sinks = set()
+    def get_source(self):
+        return self.source
+    def is_sink(self, port) -> bool:
+        return port in self.sinks
+    def is_source(self, port) -> bool:
+        return port is self.source
+    def get_diagnostic_name(self, netlist) -> str:
+        return f"net of {self.source.module.name}"
+
+class FakePort(object):
+    __slots__ = ("module",)
+    def __init__(self, module):
+        self.module = module
+    def get_parent_module(self):
+        return self.module
+    def get_all_member_junctions(self, add_self: bool):
+        return (self,)
+    def is_composite(self) -> bool:
+        return False
+
+class FakeGate(object):
+    __slots__ = ("name", "ports")
+    def __init__(self, name: str):
+        self.name = name
+        self.ports = {}
+    def get_ports(self):
+        return self.ports
+    def is_combinational(self) -> bool:
+        return True
+
+def create_netlist(gate_cnt: int, width: int = 64) -> Netlist:
+    netlist = Netlist()
+    rng = Random(gate_cnt)
+    outputs = []
+    for idx in range(gate_cnt):
+        gate = FakeGate(f"g{idx}")
+        out_port = FakePort(gate)
+        gate.ports["out"] = out_port
+        for input_name in ("in_a", "in_b"):
+            if idx == 0:
+                continue
+            in_port = FakePort(gate)
+            gate.ports[input_name] = in_port
+            xnet = outputs[max(0, idx - 1 - rng.randrange(width))]
+            xnet.sinks.add(in_port)
+            netlist.junction_to_xnet_map[in_port] = xnet
+        xnet = FakeXNet(out_port)
+        netlist.junction_to_xnet_map[out_port] = xnet
+        outputs.append(xnet)
+        netlist.modules.add(gate)
+    return netlist
+
+def main(gate_cnts):
+    print("     gates   rank [s]  ns/gate  ranks")
+    for gate_cnt in gate_cnts:
+        netlist = create_netlist(gate_cnt)
+        start = default_timer()
+        rank_list, rank_map = netlist._rank_netlist()
+        rank_time = default_timer() - start
+        assert len(rank_map) == gate_cnt
+        print(f"{gate_cnt:10} {rank_time:10.3f} {rank_time / gate_cnt * 1e9:8.0f} {len(rank_list):6}")
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) if len(sys.argv) > 1 else (10000, 100000, 1000000))
@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""
+Benchmark for register wake-ups in the event-driven simulator.
+
+Simulates a bank of clock-enabled registers, of which only every 8th is written in any
+cycle, with every register simulated separately ('regs') and with register banking ('bank').
+Reports the run time and, for separately simulated registers, the number of register activations
+(times the simulator resumed a register) per cycle. Without wake filtering, every register is
+woken up on both clock edges.
+
+Usage: python benchmarks/reg_wake_bench.py [register count ...]
+"""
+import sys
+import os
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from timeit import default_timer
+from silicon import *
+
+cycle_cnt = 500
+
+def create_test_bench(reg_cnt: int):
+    class RegFile(Module):
+        clk = ClkPort()
+        rst = RstPort()
+        wr_en = Input(Unsigned(8))
+        wr_data = Input(Unsigned(8))
+
+        def body(self):
+            # Every register is enabled in one out of 8 cycles
+            en_bits = tuple(self.wr_en[bit] for bit in range(8))
+            for idx in range(reg_cnt):
+                setattr(self, f"r{idx}", Reg(self.wr_data, clock_en=en_bits[idx % 8]))
+
+    class TestBench(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.wr_en = Wire(Unsigned(8))
+            self.wr_data = Wire(Unsigned(8))
+            RegFile(wr_en=self.wr_en, wr_data=self.wr_data)
+
+        def simulate(self) -> TSimEvent:
+            self.clk <<= 0
+            self.rst <<= 1
+            for cycle in range(cycle_cnt):
+                if cycle == 2:
+                    self.rst <<= 0
+                self.wr_en <<= 1 << (cycle % 8)
+                self.wr_data <<= (cycle * 7) & 255
+                yield 5
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+    return TestBench
+
+def run(reg_cnt: int, bank_registers: bool):
+    with Netlist().elaborate() as netlist:
+        create_test_bench(reg_cnt)()
+
+    with open(os.devnull, "w") as vcd_stream:
+        start = default_timer()
+        with Simulator(netlist, vcd_stream, bank_registers=bank_registers) as context:
+            context.simulate()
+            activation_cnt = sum(context.get_activation_counts().values())
+        run_time = default_timer() - start
+    return run_time, activation_cnt
+
+def main(reg_cnts):
+    print(f"{'regs':>10} {'mode':>6} {'time [s]':>10} {'cycles/s':>10} {'wakes/cycle':>12} {'unfiltered':>12}")
+    for reg_cnt in reg_cnts:
+        for bank_registers in (False, True):
+            run_time, activation_cnt = run(reg_cnt, bank_registers)
+            wakes = "-" if bank_registers else f"{activation_cnt/cycle_cnt:.1f}"
+            print(f"{reg_cnt:>10} {'bank' if bank_registers else 'regs':>6} {run_time:>10.3f} {cycle_cnt/run_time:>10.0f} {wakes:>12} {2*reg_cnt:>12}")
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) if len(sys.argv) > 1 else (16, 64, 128))
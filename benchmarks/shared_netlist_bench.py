@@ -0,0 +1,105 @@
+#!/usr/bin/python3
+"""
+Benchmark for running many short test-benches on the same design.
+
+Compares elaborating the design for every test-bench with elaborating it only once and
+running all simulations on that netlist, one after the other, then in parallel threads.
+
+Usage: python benchmarks/shared_netlist_bench.py [test-bench count] [slice count]
+"""
+import sys
+import os
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+import threading
+from timeit import default_timer
+from silicon import *
+
+class Slice(Module):
+    clk = ClkPort()
+    rst = RstPort()
+    in_a = Input(Unsigned(8))
+    key = Input(Unsigned(8))
+    out_a = Output(Unsigned(8))
+
+    def body(self):
+        value = self.in_a
+        for idx in range(4):
+            value = Reg((value ^ idx) & ~self.key | (value & self.key))
+        self.out_a <<= value
+
+def create_top(slice_cnt: int):
+    class Top(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.in_a = Wire(Unsigned(8))
+            self.out_a = Wire(Unsigned(8))
+            value = self.in_a
+            for _ in range(slice_cnt):
+                value = Slice(value, self.in_a)
+            self.out_a <<= value
+
+        def simulate(self) -> TSimEvent:
+            seed = get_simulator(self).seed
+            self.clk <<= 0
+            self.rst <<= 1
+            for cycle in range(20):
+                if cycle == 2:
+                    self.rst <<= 0
+                self.in_a <<= (cycle * seed) & 0xff
+                yield 5
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+    return Top
+
+def elaborate(slice_cnt: int) -> Netlist:
+    with Netlist().elaborate() as netlist:
+        create_top(slice_cnt)()
+    return netlist
+
+def run_test(netlist: Netlist, seed: int) -> None:
+    simulator = Simulator(netlist, None)
+    simulator.seed = seed
+    with simulator as context:
+        context.simulate()
+
+def main(test_cnt: int, slice_cnt: int):
+    # Elaboration prints a line for every module
+    with open(os.devnull, "w") as null_stream:
+        stdout = sys.stdout
+        sys.stdout = null_stream
+        try:
+            start = default_timer()
+            for seed in range(test_cnt):
+                run_test(elaborate(slice_cnt), seed)
+            separate_time = default_timer() - start
+
+            start = default_timer()
+            netlist = elaborate(slice_cnt)
+            elaboration_time = default_timer() - start
+            for seed in range(test_cnt):
+                run_test(netlist, seed)
+            shared_time = default_timer() - start
+
+            start = default_timer()
+            threads = tuple(threading.Thread(target=run_test, args=(netlist, seed)) for seed in range(test_cnt))
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            threaded_time = default_timer() - start
+        finally:
+            sys.stdout = stdout
+
+    print(f"{test_cnt} test-benches, {len(netlist.xnets)} nets")
+    print(f"elaborated for every test-bench: {separate_time:.3f}s")
+    print(f"elaborated once:                 {shared_time:.3f}s (of which elaboration: {elaboration_time:.3f}s)")
+    print(f"elaborated once, threads:        {threaded_time:.3f}s (simulation only)")
+
+if __name__ == "__main__":
+    test_cnt = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    slice_cnt = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    main(test_cnt, slice_cnt)
@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""
+Benchmark for selecting signals by name on a large netlist.
+
+Builds a hierarchy of adder chains and measures the time it takes to register every net for tracing
+(which includes building the signal index), to select a subset of the nets by a glob pattern and
+to look up individual nets by their fully qualified name.
+
+Usage: python benchmarks/signal_index_bench.py [instance count]
+"""
+import sys
+import os
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from timeit import default_timer
+from silicon import *
+
+class Stage(Module):
+    data_in = Input(Unsigned(8))
+    data_out = Output(Unsigned(8))
+
+    def body(self):
+        self.sum = Wire(Unsigned(8))
+        self.sum <<= (self.data_in + 1)[7:0]
+        self.data_out <<= self.sum
+
+class Chain(Module):
+    data_in = Input(Unsigned(8))
+    data_out = Output(Unsigned(8))
+
+    def body(self):
+        # Stages are only referenced through attributes, so that each has exactly one name
+        for idx in range(8):
+            setattr(self, f"u_stage{idx}", Stage())
+            getattr(self, f"u_stage{idx}").data_in <<= self.data_in if idx == 0 else getattr(self, f"u_stage{idx-1}").data_out
+        self.data_out <<= self.u_stage7.data_out
+
+def create_top(instance_cnt: int):
+    class Top(Module):
+        def body(self):
+            self.data_in = Wire(Unsigned(8))
+            self.data_out = Wire(Unsigned(8))
+            for idx in range(instance_cnt):
+                setattr(self, f"u_chain{idx}", Chain())
+                getattr(self, f"u_chain{idx}").data_in <<= self.data_in if idx == 0 else getattr(self, f"u_chain{idx-1}").data_out
+            self.data_out <<= getattr(self, f"u_chain{instance_cnt-1}").data_out
+
+        def simulate(self) -> TSimEvent:
+            self.data_in <<= 0
+            yield 10
+    return Top
+
+def main(instance_cnt: int):
+    with Netlist().elaborate() as netlist:
+        create_top(instance_cnt)()
+    with open(os.devnull, "w") as vcd_stream:
+        with Simulator(netlist, vcd_stream) as context:
+            start = default_timer()
+            context.dump_signals()
+            dump_time = default_timer() - start
+            var_cnt = sum(len(vcd_vars) for vcd_vars in context.state_store.vcd_vars.values())
+
+    index = netlist.get_signal_index()
+    start = default_timer()
+    selected = index.glob("Top.u_chain1*.u_stage3.*")
+    glob_time = default_timer() - start
+
+    start = default_timer()
+    for idx in range(instance_cnt):
+        assert index.lookup(f"Top.u_chain{idx}.u_stage7.data_out") is not None
+    lookup_time = default_timer() - start
+
+    print(f"dump_signals: {var_cnt} nets in {dump_time:.3f}s")
+    print(f"glob:         {len(selected)} nets in {glob_time*1000:.2f}ms")
+    print(f"lookup:       {instance_cnt} lookups in {lookup_time*1000:.2f}ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,123 @@
+#!/usr/bin/python3
+"""
+Memory and throughput benchmark for the per-XNet simulation state.
+
+Memory: elaborates a synthetic design with a configurable number of nets (a chain of
+small register slices) and measures the memory allocated while the simulator sets up.
+
+Throughput: simulates the Z80 memory interface from the cpc6128 example with a test-bench
+that issues a stream of memory accesses.
+
+Usage: python benchmarks/sim_state_bench.py [slice count ...]
+"""
+import sys
+import os
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+sys.path.append(str(Path(__file__).parent / ".." / "examples" / "cpc6128"))
+sys.path.append(str(Path(__file__).parent / ".." / "unit_tests"))
+
+import tracemalloc
+from timeit import default_timer
+from silicon import *
+
+class Slice(Module):
+    clk = ClkPort()
+    rst = RstPort()
+    in_a = Input(Unsigned(8))
+    key = Input(Unsigned(8))
+    out_a = Output(Unsigned(8))
+
+    def body(self):
+        value = self.in_a
+        for idx in range(4):
+            value = Reg((value ^ idx) & ~self.key | (value & self.key))
+        self.out_a <<= value
+
+def create_wide_design(slice_cnt: int):
+    class Wide(Module):
+        clk = ClkPort()
+        rst = RstPort()
+        in_a = Input(Unsigned(8))
+        out_a = Output(Unsigned(8))
+
+        def body(self):
+            value = self.in_a
+            for _ in range(slice_cnt):
+                value = Slice(value, self.in_a)
+            self.out_a <<= value
+    return Wide
+
+def measure_memory(slice_cnt: int):
+    with Netlist().elaborate() as netlist:
+        create_wide_design(slice_cnt)()
+    xnet_cnt = len(netlist.xnets)
+    with open(os.devnull, "w") as vcd_stream:
+        tracemalloc.start()
+        start = tracemalloc.take_snapshot()
+        with Simulator(netlist, vcd_stream) as context:
+            end = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in end.compare_to(start, "filename"))
+    return xnet_cnt, allocated
+
+def measure_throughput(cycle_cnt: int) -> float:
+    from z80_mem_if import Z80MemIf
+
+    class TestBench(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.start = Wire(logic)
+            self.addr = Wire(Unsigned(16))
+            self.data_out = Wire(Unsigned(8))
+            self.prdata = Wire(Unsigned(8))
+            self.pready = Wire(logic)
+            dut = Z80MemIf()
+            dut.clk_en <<= 1
+            dut.start <<= self.start
+            dut.addr <<= self.addr
+            dut.data_out <<= self.data_out
+            dut.prdata <<= self.prdata
+            dut.pready <<= self.pready
+            dut.m1 <<= 0
+            dut.rfsh <<= 0
+            dut.io_not_mem <<= 0
+            dut.wr_not_rd <<= 1
+
+        def simulate(self) -> TSimEvent:
+            self.clk <<= 0
+            self.rst <<= 1
+            for cycle in range(cycle_cnt):
+                if cycle == 2:
+                    self.rst <<= 0
+                self.start <<= cycle % 3 == 0
+                self.addr <<= (cycle * 257) & 0xffff
+                self.data_out <<= cycle & 0xff
+                self.prdata <<= (cycle * 3) & 0xff
+                self.pready <<= cycle % 2
+                yield 5
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+
+    with Netlist().elaborate() as netlist:
+        TestBench()
+    with open(os.devnull, "w") as vcd_stream:
+        start = default_timer()
+        with Simulator(netlist, vcd_stream) as context:
+            context.dump_signals()
+            context.simulate()
+        return default_timer() - start
+
+def main(slice_cnts):
+    print(f"{'xnets':>10} {'setup [kB]':>12} {'bytes/xnet':>10}")
+    for slice_cnt in slice_cnts:
+        xnet_cnt, allocated = measure_memory(slice_cnt)
+        print(f"{xnet_cnt:>10} {allocated/1024:>12.1f} {allocated/xnet_cnt:>10.1f}")
+    cycle_cnt = 2000
+    run_time = measure_throughput(cycle_cnt)
+    print(f"Z80MemIf: {cycle_cnt} cycles in {run_time:.3f}s ({cycle_cnt/run_time:.0f} cycles/s)")
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) if len(sys.argv) > 1 else (10, 40, 100))
@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+"""
+Micro-benchmark for the simulator timeline backends.
+
+Simulates the scheduling pattern of a large testbench: a number of independent
+'clock generators' with different periods, each re-scheduling itself into the
+future after every tick. The number of pending timestamps is roughly the number
+of generators, which is what makes the list-based timeline slow.
+
+Usage: python benchmarks/timeline_bench.py [generator count ...]
+"""
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from timeit import default_timer
+from silicon.timeline import ListTimeline, HeapTimeline
+
+class _Event(object):
+    def __init__(self, when: int):
+        self.when = when
+        self.generators = []
+
+def run(timeline_class, generator_cnt: int, tick_cnt: int) -> float:
+    timeline = timeline_class()
+    for idx in range(generator_cnt):
+        timeline.get_event(idx + 1, _Event).generators.append(idx * 2 + 3)
+    start = default_timer()
+    for _ in range(tick_cnt):
+        event = timeline.pop()
+        for period in event.generators:
+            timeline.get_event(event.when + period, _Event).generators.append(period)
+    return default_timer() - start
+
+def main(generator_cnts):
+    tick_cnt = 20000
+    print(f"{'generators':>10} {'list [s]':>10} {'heap [s]':>10} {'speedup':>8}")
+    for generator_cnt in generator_cnts:
+        list_time = run(ListTimeline, generator_cnt, tick_cnt)
+        heap_time = run(HeapTimeline, generator_cnt, tick_cnt)
+        print(f"{generator_cnt:>10} {list_time:>10.4f} {heap_time:>10.4f} {list_time/heap_time:>7.1f}x")
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) if len(sys.argv) > 1 else (10, 100, 1000, 5000))
@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+"""
+Benchmark for the cost of waveform tracing in the event-driven simulator.
+
+Simulates a small datapath (an accumulator with masking and comparison logic) without a VCD file,
+with a VCD file but no traced nets and with every net traced. Full traces are written either directly
+or by the background writer thread, the latter both uncompressed and compressed. Full traces are also
+written in the binary waveform format (see silicon/waveform.py). Finally, every net is traced, but only
+in a short time window at the start of the simulation.
+
+Usage: python benchmarks/trace_bench.py [cycle count]
+"""
+import sys
+import os
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+from silicon import *
+
+class Dut(Module):
+    clk = ClkPort()
+    rst = RstPort()
+    step = Input(Unsigned(4))
+    mask = Input(Unsigned(8))
+    acc = Output(Unsigned(8))
+    masked = Output(Unsigned(8))
+    is_big = Output(logic)
+
+    def body(self):
+        self.acc <<= Reg((self.acc + self.step)[7:0])
+        self.masked <<= (self.acc & self.mask) ^ concat(self.step, self.acc[3:0]) | (self.acc ^ self.mask)
+        self.is_big <<= (self.masked > self.mask) & ~self.acc[0]
+
+def create_test_bench(cycle_cnt: int):
+    class TestBench(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.step = Wire(Unsigned(4))
+            self.mask = Wire(Unsigned(8))
+            dut = Dut()
+            dut.step <<= self.step
+            dut.mask <<= self.mask
+
+        def simulate(self) -> TSimEvent:
+            self.clk <<= 0
+            self.rst <<= 1
+            for cycle in range(cycle_cnt):
+                if cycle == 2:
+                    self.rst <<= 0
+                self.step <<= (cycle * 7) & 15
+                self.mask <<= (cycle * 31) & 255
+                yield 5
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+    return TestBench
+
+def run(cycle_cnt: int, mode: str) -> float:
+    with Netlist().elaborate() as netlist:
+        create_test_bench(cycle_cnt)()
+
+    if mode in ("gzip", "wave"):
+        # Compressed traces, written by the background thread, or binary waveforms
+        with TemporaryDirectory() as temp_dir:
+            trace_file = Path(temp_dir) / ("trace.vcd.gz" if mode == "gzip" else "trace.wave")
+            start = default_timer()
+            with Simulator(netlist, trace_file, background_trace=(mode == "gzip")) as context:
+                context.dump_signals()
+                context.simulate()
+            return default_timer() - start
+
+    with open(os.devnull, "w") as vcd_stream:
+        start = default_timer()
+        with Simulator(netlist, vcd_stream if mode != "off" else None, background_trace=(mode == "background")) as context:
+            if mode in ("all", "background", "window"):
+                context.dump_signals()
+            if mode == "window":
+                context.dump_window(0, 100)
+            context.simulate()
+        return default_timer() - start
+
+def main(cycle_cnt: int):
+    print(f"{'tracing':>10} {'time [s]':>10} {'cycles/s':>10}")
+    for mode in ("off", "none", "all", "background", "gzip", "wave", "window"):
+        run_time = run(cycle_cnt, mode)
+        print(f"{mode:>10} {run_time:>10.3f} {cycle_cnt/run_time:>10.0f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
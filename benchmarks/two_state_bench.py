@@ -0,0 +1,171 @@
+#!/usr/bin/python3
+"""
+Benchmark for two-state simulation.
+
+Simulates the Z80 ALU from the cpc6128 example (combinational, driven with a stream of random
+operands and operations) and a pipelined radix-2 FFT butterfly with twiddle-factor ROMs (fed with
+random samples), both in normal (X-aware) and in two-state simulation.
+
+Usage: python benchmarks/two_state_bench.py [cycle count]
+"""
+import sys
+import os
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+sys.path.append(str(Path(__file__).parent / ".." / "examples" / "cpc6128"))
+sys.path.append(str(Path(__file__).parent / ".." / "unit_tests"))
+
+import math
+from random import Random
+from timeit import default_timer
+from silicon import *
+
+def create_alu_test_bench(cycle_cnt: int):
+    from z80_alu import Z80Alu
+
+    ops = (
+        Z80Alu.opADD, Z80Alu.opADC, Z80Alu.opSUB, Z80Alu.opSBC, Z80Alu.opAND, Z80Alu.opXOR, Z80Alu.opOR, Z80Alu.opCP,
+        Z80Alu.opRLC, Z80Alu.opRRC, Z80Alu.opRL, Z80Alu.opRR, Z80Alu.opSLA, Z80Alu.opSRA, Z80Alu.opSLL, Z80Alu.opSRL,
+        Z80Alu.opMOV, Z80Alu.opINC
+    )
+
+    class TestBench(Module):
+        def body(self):
+            self.in_a = Wire(Unsigned(8))
+            self.in_b = Wire(Unsigned(8))
+            self.in_f = Wire(Unsigned(8))
+            self.op = Wire(Unsigned(7))
+            self.op_8080_shift = Wire(logic)
+            dut = Z80Alu()
+            dut.in_a <<= self.in_a
+            dut.in_b <<= self.in_b
+            dut.in_f <<= self.in_f
+            dut.op <<= self.op
+            dut.op_8080_shift <<= self.op_8080_shift
+            self.out_l = Wire(Unsigned(8))
+            self.out_h = Wire(Unsigned(8))
+            self.out_f = Wire(Unsigned(8))
+            self.out_l <<= dut.out_l
+            self.out_h <<= dut.out_h
+            self.out_f <<= dut.out_f
+
+        def simulate(self) -> TSimEvent:
+            rng = Random(42)
+            self.op_8080_shift <<= 0
+            for _ in range(cycle_cnt):
+                self.in_a <<= rng.randrange(256)
+                self.in_b <<= rng.randrange(256)
+                self.in_f <<= rng.randrange(256)
+                self.op <<= rng.choice(ops)
+                yield 10
+    return TestBench
+
+Sample = Signed(16)
+Twiddle = Unsigned(15) # cos/sin magnitudes in 1.14 fixed point
+
+class Butterfly(GenericModule):
+    """
+    A radix-2 FFT butterfly with a twiddle-factor ROM: a = x0 + x1 * w, b = x0 - x1 * w
+    """
+    clk = ClkPort()
+    rst = RstPort()
+    x0_real = Input(Sample)
+    x0_img = Input(Sample)
+    x1_real = Input(Sample)
+    x1_img = Input(Sample)
+    a_real = Output()
+    a_img = Output()
+    b_real = Output()
+    b_img = Output()
+
+    def construct(self, twiddle_bits: int):
+        self.twiddle_bits = twiddle_bits
+
+    def body(self):
+        def twiddle_rom(part):
+            def content(data_bits, addr_bits):
+                for idx in range(1 << self.twiddle_bits):
+                    angle = math.pi * idx / (1 << self.twiddle_bits)
+                    yield min(int(abs(part(angle)) * (1 << 14)), (1 << 15) - 1)
+            config = MemoryConfig(
+                (MemoryPortConfig(
+                    addr_type = Unsigned(self.twiddle_bits),
+                    data_type = Twiddle,
+                    registered_input = True,
+                    registered_output = False
+                ),),
+                init_content = content
+            )
+            mem = Memory(config)
+            mem.addr <<= self.twiddle_addr
+            return mem.data_out
+
+        self.twiddle_addr = Wire(Unsigned(self.twiddle_bits))
+        self.twiddle_addr <<= Reg((self.twiddle_addr + 1)[self.twiddle_bits-1:0])
+        w_real = twiddle_rom(math.cos)
+        w_img = twiddle_rom(math.sin)
+        # The ROM output is registered, so delay the inputs by a cycle as well
+        x0_real = Reg(self.x0_real)
+        x0_img = Reg(self.x0_img)
+        x1_real = Reg(self.x1_real)
+        x1_img = Reg(self.x1_img)
+        t_real = (x1_real * w_real - x1_img * w_img) >> 14
+        t_img = (x1_real * w_img + x1_img * w_real) >> 14
+        self.a_real <<= Reg(x0_real + t_real)
+        self.a_img <<= Reg(x0_img + t_img)
+        self.b_real <<= Reg(x0_real - t_real)
+        self.b_img <<= Reg(x0_img - t_img)
+
+def create_fft_test_bench(cycle_cnt: int):
+    class TestBench(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.x0_real = Wire(Sample)
+            self.x0_img = Wire(Sample)
+            self.x1_real = Wire(Sample)
+            self.x1_img = Wire(Sample)
+            dut = Butterfly(twiddle_bits=4)
+            dut.x0_real <<= self.x0_real
+            dut.x0_img <<= self.x0_img
+            dut.x1_real <<= self.x1_real
+            dut.x1_img <<= self.x1_img
+            self.a_real = Wire()
+            self.b_real = Wire()
+            self.a_real <<= dut.a_real
+            self.b_real <<= dut.b_real
+
+        def simulate(self) -> TSimEvent:
+            rng = Random(42)
+            self.clk <<= 0
+            self.rst <<= 1
+            for cycle in range(cycle_cnt):
+                if cycle == 2:
+                    self.rst <<= 0
+                for sample in (self.x0_real, self.x0_img, self.x1_real, self.x1_img):
+                    sample <<= rng.randrange(-1 << 15, 1 << 15)
+                yield 5
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+    return TestBench
+
+def run(test_bench, cycle_cnt: int, two_state: bool) -> float:
+    with Netlist().elaborate() as netlist:
+        test_bench(cycle_cnt)()
+    with open(os.devnull, "w") as vcd_stream:
+        start = default_timer()
+        with Simulator(netlist, vcd_stream, two_state=two_state) as context:
+            context.dump_signals()
+            context.simulate()
+        return default_timer() - start
+
+def main(cycle_cnt: int):
+    print(f"{'design':>10} {'normal [s]':>10} {'2-state [s]':>11} {'speedup':>8}")
+    for name, test_bench in (("Z80Alu", create_alu_test_bench), ("FFT", create_fft_test_bench)):
+        normal_time = run(test_bench, cycle_cnt, False)
+        two_state_time = run(test_bench, cycle_cnt, True)
+        print(f"{name:>10} {normal_time:>10.4f} {two_state_time:>11.4f} {normal_time/two_state_time:>7.2f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+"""
+Benchmark for sorting module instances into variants (the ones that share the same generated body).
+
+Elaborates a design with many instances of a generic module, with a number of different
+parameterizations, and reports the time spent on finding the variants. For comparison, the
+same is done without structural hashing (every variant of a class is a candidate for every
+instance, the way it used to be).
+
+Usage: python benchmarks/variant_bench.py [instance count] [variant count]
+"""
+import sys
+import os
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from silicon import *
+from silicon.module import Module as _Module
+
+class Narrow(GenericModule):
+    data_out = Output(Unsigned(8))
+
+    def construct(self, width: int):
+        self.data_in = Input(Unsigned(width))
+
+    def body(self):
+        self.data_out <<= self.data_in[7:0]
+
+def create_top(instance_cnt: int, variant_cnt: int):
+    class Top(Module):
+        data_in = Input(Unsigned(8))
+        data_out = Output(Unsigned(8))
+
+        def body(self):
+            for idx in range(instance_cnt):
+                setattr(self, f"u_narrow{idx}", Narrow(8 + idx % variant_cnt))
+                getattr(self, f"u_narrow{idx}").data_in <<= self.data_in if idx == 0 else getattr(self, f"u_narrow{idx-1}").data_out
+            self.data_out <<= getattr(self, f"u_narrow{instance_cnt-1}").data_out
+    return Top
+
+def elaborate(instance_cnt: int, variant_cnt: int) -> Netlist:
+    # Elaboration prints a line for every module
+    with open(os.devnull, "w") as null_stream:
+        stdout = sys.stdout
+        sys.stdout = null_stream
+        try:
+            with Netlist().elaborate() as netlist:
+                create_top(instance_cnt, variant_cnt)()
+        finally:
+            sys.stdout = stdout
+    return netlist
+
+def main(instance_cnt: int, variant_cnt: int):
+    netlist = elaborate(instance_cnt, variant_cnt)
+    hashed_time = netlist.phase_times["module variants"]
+    variants = len(netlist.module_variants[fully_qualified_name(netlist.top_level.u_narrow0)])
+
+    get_structural_hash = _Module.Impl.get_structural_hash
+    _Module.Impl.get_structural_hash = lambda self, netlist: 0
+    try:
+        netlist = elaborate(instance_cnt, variant_cnt)
+        linear_time = netlist.phase_times["module variants"]
+    finally:
+        _Module.Impl.get_structural_hash = get_structural_hash
+
+    print(f"{instance_cnt} instances, {variants} variants")
+    print(f"module variants with structural hashing: {hashed_time:.3f}s")
+    print(f"module variants with linear search:      {linear_time:.3f}s")
+
+if __name__ == "__main__":
+    instance_cnt = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    variant_cnt = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    main(instance_cnt, variant_cnt)
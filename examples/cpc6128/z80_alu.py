@@ -18,7 +18,7 @@ class Parity(Module):
     output_port = Output(logic)
 
     def body(self):
-        self.output_port = xor_gate(*self.input_port)
+        self.output_port <<= xor_gate(*self.input_port)
 
 class Z80Alu(Module):
     in_a = Input(TByte)
@@ -9,8 +9,15 @@ from .gates import *
 from .back_end import *
 from .adaptor import *
 from .primitives import *
-from .utils import get_common_net_type, explicit_adapt, cast, set_verbosity_level, VerbosityLevels, increment, decrement
+from .utils import get_common_net_type, explicit_adapt, cast, set_verbosity_level, VerbosityLevels, increment, decrement, StaticSensitivity
 from .simulator import Simulator, get_simulator
+from .four_state import XValue
+from .waveform import WaveformReader, convert_to_vcd
+from .wave_capture import WaveCapture, CapturedSignal
+from .sim_snapshot import SimSnapshot
+from .elaboration_cache import ElaborationCache
+from .cycle_simulator import CycleSimulator
+from .lane_simulator import LaneSimulator
 from .fsm import FSM
 from .composite import Reverse, Interface, Struct, Array, GenericMember
 from .memory import MemoryConfig, Memory, MemoryPortConfig
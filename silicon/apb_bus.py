@@ -52,6 +52,7 @@ def ApbIf(data_type: NetType, addr_type: NetType = None) -> type:
         return _apb_if_cache[key]
     type_name = f"ApbIf_D[{data_type.get_type_name()}]" if addr_type is None else f"ApbIf_D[{data_type.get_type_name()}]_A[{addr_type.get_type_name()}]"
     ApbIfType = type(type_name, (ApbBaseIf,), {})
+    ApbIfType._type_factory = (ApbIf, key)
     ApbIfType.add_member("pwdata", data_type)
     ApbIfType.add_member("prdata", Reverse(data_type))
     if addr_type is not None:
@@ -1,6 +1,7 @@
 from .exceptions import IVerilogException
 from .back_end import SystemVerilog, File, BackEnd
 from .netlist import Netlist
+from .elaboration_cache import ElaborationCache
 from .utils import ScopedAttr
 from typing import Callable, IO, Optional, Union, Dict
 import os
@@ -27,10 +28,10 @@ class Build:
         back_end: Optional[BackEnd] = None,
         name_prefix: Optional[str] = None,
         top_level_prefix: Optional[str] = None,
+        cache_dir: Optional[Union[str, 'Path']] = None,
     ) -> Netlist:
         Build.clear()
-        with Netlist().elaborate() as netlist:
-            top = top_class()
+        netlist = Build._elaborate(top_class, cache_dir)
 
         if back_end is None:
             back_end = SystemVerilog(stream_class = Build.RegisteredFile)
@@ -51,14 +52,22 @@ class Build:
         return netlist
 
     @staticmethod
-    def simulation(top_class: Callable, vcd_filename: str = None, *, add_unnamed_scopes: bool = False):
+    def simulation(top_class: Callable, vcd_filename: str = None, *, add_unnamed_scopes: bool = False, cache_dir: Optional[Union[str, 'Path']] = None):
         if vcd_filename is None:
             vcd_filename = top_class.__name__.lower()
         Build.clear()
-        with Netlist().elaborate() as netlist:
-            top = top_class()
+        netlist = Build._elaborate(top_class, cache_dir)
         netlist.simulate(vcd_filename, add_unnamed_scopes=add_unnamed_scopes)
 
+    @staticmethod
+    def _elaborate(top_class: Callable, cache_dir: Optional[Union[str, 'Path']]) -> Netlist:
+        # With a cache directory, the netlist is loaded from there if the design didn't change (see elaboration_cache.py)
+        if cache_dir is not None:
+            return ElaborationCache(cache_dir, dump_stack_size=ElaborationCache.deep_stack_size).elaborate(top_class)
+        with Netlist().elaborate() as netlist:
+            top_class()
+        return netlist
+
     @staticmethod
     def clear():
         Build._file_list.clear()
@@ -6,7 +6,7 @@ from .back_end import BackEnd
 from .exceptions import SimulationException, SyntaxErrorException
 from .module import Module, GenericModule, InlineExpression, InlineBlock, InlineStatement
 from .port import Input, Output, Junction
-from .utils import TSimEvent, adapt, Context, is_net_type
+from .utils import TSimEvent, StaticSensitivity, adapt, Context, is_net_type
 from collections import OrderedDict
 from .number import Unsigned, Number
 from .port import Wire
@@ -319,8 +319,9 @@ class Struct(Composite, support_reverse=False):
             return ret_val, op_precedence
 
         def simulate(self) -> TSimEvent:
+            sensitivity = StaticSensitivity(self.get_inputs().values())
             while True:
-                yield self.get_inputs().values()
+                yield sensitivity
                 xnets = self._impl.netlist.get_xnets_for_junction(self.input_port)
                 value = 0
                 for xnet, _ in xnets.values():
@@ -370,8 +371,9 @@ class Struct(Composite, support_reverse=False):
             return ret_val
 
         def simulate(self) -> TSimEvent:
+            sensitivity = StaticSensitivity(self.get_inputs().values())
             while True:
-                yield self.get_inputs().values()
+                yield sensitivity
                 members = self.output_port.get_all_member_junctions(add_self=False)
                 value = self.input_port.sim_value
                 for member in reversed(members):
@@ -508,8 +510,9 @@ class _ArrayType(Composite, support_reverse=False):
             for idx, (member) in reversed(enumerate(members)):
                 if idx >= self.key.start and idx <= self.key.end:
                     important_members.append(member)
+            sensitivity = StaticSensitivity(important_members)
             while True:
-                yield important_members
+                yield sensitivity
                 self.output_port <<= output_type(*important_members)
 
         def generate(self, netlist: 'Netlist', back_end: 'BackEnd') -> str:
@@ -655,8 +658,9 @@ class Array(NetTypeFactory, net_type=_ArrayType):
             return True
 
         def simulate(self) -> TSimEvent:
+            sensitivity = StaticSensitivity(self.get_inputs().values())
             while True:
-                yield self.get_inputs().values()
+                yield sensitivity
                 self.output_port <<= getattr(self.input_port.sim_value, self.member)
 
     class StructCombiner(GenericModule):
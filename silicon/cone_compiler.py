@@ -0,0 +1,245 @@
+from typing import Optional, List, Set, Dict, Tuple, Callable, Generator, Any, Sequence
+from collections import OrderedDict
+from .ordered_set import OrderedSet
+from .utils import StaticSensitivity, TSimEvent, adapt, is_net_value
+from .exceptions import AdaptTypeError
+from .four_state import XValue
+
+"""
+Levelized, compiled evaluation of combinational logic cones.
+
+In normal (event-driven) simulation every combinational primitive is its own generator. A value change
+at the input of a cone wakes up the first level of gates, which in turn schedule value changes that
+wake up the next level, and so on. Every one of these steps involves a generator context switch and
+a round trip through Event.value_changes.
+
+The ConeCompiler groups connected combinational modules that support Module.get_sim_function into cones.
+Each cone is turned into a single generated Python function that evaluates all the members in rank order,
+keeping intermediate values in local variables. The function is wrapped into a single generator, which
+listens on the inputs of the cone and runs once per activation.
+
+Every XNet computed inside a cone is still updated (through SimulatorContext.schedule_value_change)
+so that waveforms and sim_value queries on internal nets keep working.
+
+Merging modules into cones can create loops between cones and the (non-compiled) modules around them.
+These are broken up by dissolving the offending cones back into individual modules.
+"""
+
+class Cone(object):
+    """
+    A set of combinational modules that are evaluated together by a single generated function.
+    """
+    def __init__(self, members: Sequence['Module'], netlist: 'Netlist'):
+        rank_map = netlist.rank_map
+        self.members: Tuple['Module'] = tuple(sorted(members, key=lambda member: rank_map[member]))
+        self.netlist = netlist
+        self.rank: Optional[int] = None
+        self.source: Optional[str] = None # The generated source code, kept around for debugging
+        self.input_xnets: Tuple['XNet'] = None
+        self.output_xnets: Tuple['XNet'] = None
+
+    def _generate(self, sim_context: 'Simulator.SimulatorContext') -> Callable:
+        state_store = sim_context.state_store
+        namespace: Dict[str, Any] = {
+            "schedule": sim_context.schedule_value_change,
+            "values": state_store.values,
+            "four_state_value": state_store.get_four_state_value,
+            "to_none": _x_value_to_none
+        }
+        # In four-state simulation, inputs are read with their unknown bits, but only modules that are aware of those get them
+        four_state = sim_context.simulator.four_state
+        two_state = sim_context.simulator.two_state
+        local_names: Dict['XNet', str] = OrderedDict()
+        input_xnets: Dict['XNet', str] = OrderedDict()
+        output_xnets: List['XNet'] = []
+        body: List[str] = []
+
+        def get_local_name(xnet: 'XNet') -> str:
+            if xnet in local_names:
+                return local_names[xnet]
+            # Not computed in the cone: it's an input
+            if xnet not in input_xnets:
+                input_xnets[xnet] = f"i{len(input_xnets)}"
+            return input_xnets[xnet]
+
+        for idx, member in enumerate(self.members):
+            inputs, output, sim_function = member.get_two_state_sim_function() if two_state else member.get_sim_function()
+            if four_state and not getattr(member.__class__, "four_state_aware", False):
+                arg_names = ", ".join(f"to_none({get_local_name(input._xnet)})" for input in inputs)
+            else:
+                arg_names = ", ".join(get_local_name(input._xnet) for input in inputs)
+            output_xnet = output._xnet
+            namespace[f"f{idx}"] = sim_function
+            namespace[f"c{idx}"] = create_sim_value_converter(output)
+            namespace[f"x{idx}"] = output_xnet
+            local_names[output_xnet] = f"n{idx}"
+            output_xnets.append(output_xnet)
+            body.append(f"    n{idx} = c{idx}(f{idx}({arg_names}))")
+            body.append(f"    schedule(x{idx}, n{idx})")
+
+        lines = ["def evaluate():"]
+        for xnet, input_name in input_xnets.items():
+            if four_state:
+                lines.append(f"    {input_name} = four_state_value({xnet.sim_index})")
+            else:
+                lines.append(f"    {input_name} = values[{xnet.sim_index}]")
+        lines += body
+        self.source = "\n".join(lines) + "\n"
+        self.input_xnets = tuple(input_xnets.keys())
+        self.output_xnets = tuple(output_xnets)
+        exec(compile(self.source, f"<cone {self.members[0]._impl.get_diagnostic_name(add_location=False)}>", "exec"), namespace)
+        return namespace["evaluate"]
+
+    def simulate(self, sim_context: 'Simulator.SimulatorContext') -> TSimEvent:
+        evaluate = self._generate(sim_context)
+        sensitivity = StaticSensitivity(())
+        sensitivity.xnets = self.input_xnets
+        while True:
+            yield sensitivity
+            evaluate()
+
+def _x_value_to_none(value: Any) -> Any:
+    # Modules that don't know about four-state values see partially unknown values as None
+    return None if value.__class__ is XValue else value
+
+def create_sim_value_converter(output: 'Junction') -> Callable:
+    """
+    Returns a function that converts values the same way assignment (<<=) to 'output' would in simulation.
+    """
+    net_type = output.get_net_type()
+    adapt_from = net_type.adapt_from
+    def convert(value: Any) -> Any:
+        # For simulation values (raw ints, NetValues and X) 'adapt' boils down to a call to 'adapt_from' of the net type.
+        # Shortcut to that as this is the hottest path in compiled evaluation.
+        if value is None or value.__class__ is int or value.__class__ is XValue or is_net_value(value):
+            try:
+                return adapt_from(value, False, False, False)
+            except AdaptTypeError:
+                pass
+        elif hasattr(value, "sim_value"):
+            return value.sim_value
+        return adapt(value, net_type, implicit=False, force=False, allow_memberwise_adapt=False)
+    return convert
+
+class ConeCompiler(object):
+    """
+    Groups the combinational modules of a netlist into cones and ranks the resulting processes.
+
+    A process is either a Cone, or a module that is simulated through its 'simulate' method.
+    """
+    def __init__(self, netlist: 'Netlist'):
+        self.netlist = netlist
+
+    def _is_compilable(self, module: 'Module') -> bool:
+        if not module.is_combinational():
+            return False
+        sim_function = module.get_sim_function()
+        if sim_function is None:
+            return False
+        inputs, output, _ = sim_function
+        for port in inputs:
+            if port.is_composite():
+                return False
+        if output.is_composite():
+            return False
+        # The output must be the source of its XNet (or the single node on an undriven XNet).
+        # NOTE: junctions must be compared by identity: '==' on them creates a gate (or compares simulation values)
+        source = output._xnet.get_source()
+        if source is not output and source is not None:
+            return False
+        return True
+
+    def _get_driver_modules(self, module: 'Module') -> Set['Module']:
+        drivers = OrderedSet()
+        for port in module.get_ports().values():
+            for member in port.get_all_member_junctions(add_self=True):
+                if member.is_composite():
+                    continue
+                xnet = self.netlist.junction_to_xnet_map[member]
+                if not xnet.is_sink(member):
+                    continue
+                source = xnet.get_source()
+                if source is None or source.get_parent_module() is None:
+                    continue
+                drivers.add(source.get_parent_module())
+        return drivers
+
+    def compile(self) -> Tuple[Sequence[Cone], Dict['Module', int]]:
+        """
+        Returns the list of cones (with their ranks filled in) and the ranks of all non-compiled modules.
+        """
+        modules = self.netlist.modules
+        drivers = OrderedDict((module, self._get_driver_modules(module)) for module in modules)
+
+        # Group connected, compilable modules together using union-find
+        compilable = OrderedSet(module for module in modules if self._is_compilable(module))
+        parents: Dict['Module', 'Module'] = OrderedDict((module, module) for module in compilable)
+        def find(module: 'Module') -> 'Module':
+            while parents[module] is not module:
+                parents[module] = parents[parents[module]]
+                module = parents[module]
+            return module
+        for module in compilable:
+            for driver in drivers[module]:
+                if driver in compilable:
+                    parents[find(module)] = find(driver)
+        groups: Dict['Module', List['Module']] = OrderedDict()
+        for module in compilable:
+            groups.setdefault(find(module), []).append(module)
+        cones = OrderedSet(Cone(members, self.netlist) for members in groups.values())
+
+        while True:
+            process_of: Dict['Module', Any] = OrderedDict((module, module) for module in modules)
+            for cone in cones:
+                for member in cone.members:
+                    process_of[member] = cone
+            ranks, looped_processes = self._rank_processes(process_of, drivers)
+            looped_cones = tuple(process for process in looped_processes if isinstance(process, Cone))
+            if len(looped_cones) == 0:
+                break
+            # Dissolve cones that participate in loops: their members will be simulated individually.
+            for cone in looped_cones:
+                cones.remove(cone)
+
+        for cone in cones:
+            cone.rank = ranks[cone]
+        module_ranks = OrderedDict((module, ranks[module]) for module in modules if not isinstance(process_of[module], Cone))
+        return tuple(cones), module_ranks
+
+    def _rank_processes(self, process_of: Dict['Module', Any], drivers: Dict['Module', Set['Module']]) -> Tuple[Dict[Any, int], Sequence[Any]]:
+        """
+        Ranks the processes in topological order. Non-combinational processes are always rank 0.
+
+        Returns the rank map and all the processes that couldn't be ranked because they sit in a loop.
+        """
+        process_drivers: Dict[Any, Set[Any]] = OrderedDict()
+        for module, process in process_of.items():
+            if process not in process_drivers:
+                process_drivers[process] = OrderedSet()
+            if not module.is_combinational():
+                continue
+            for driver_module in drivers[module]:
+                driver = process_of[driver_module]
+                if driver is not process:
+                    process_drivers[process].add(driver)
+
+        fanouts: Dict[Any, List[Any]] = OrderedDict((process, []) for process in process_drivers.keys())
+        pending_cnt: Dict[Any, int] = OrderedDict()
+        for process, process_driver_set in process_drivers.items():
+            pending_cnt[process] = len(process_driver_set)
+            for driver in process_driver_set:
+                fanouts[driver].append(process)
+
+        ranks: Dict[Any, int] = OrderedDict()
+        ready = [process for process, cnt in pending_cnt.items() if cnt == 0]
+        for process in ready:
+            ranks[process] = 0
+        while len(ready) > 0:
+            process = ready.pop()
+            for fanout in fanouts[process]:
+                ranks[fanout] = max(ranks.get(fanout, 0), ranks[process] + 1)
+                pending_cnt[fanout] -= 1
+                if pending_cnt[fanout] == 0:
+                    ready.append(fanout)
+        looped = tuple(process for process, cnt in pending_cnt.items() if cnt != 0)
+        return ranks, looped
@@ -125,8 +125,10 @@ class NoneNetType(NetType):
 
             return self.output_port.get_net_type().get_unconnected_value(back_end), 0
 
-        def simulate(self) -> TSimEvent:
-            self.output_port <<= None
+        def simulate(self, simulator: 'Simulator') -> TSimEvent:
+            # In two-state simulation the output simply keeps the default value it starts with
+            if not simulator.two_state:
+                self.output_port <<= None
 
         def is_combinational(self) -> bool:
             """
@@ -0,0 +1,237 @@
+from typing import Optional, List, Tuple, Callable, Generator, IO, Union, Any, Sequence
+from inspect import isgenerator
+from .netlist import Netlist, XNet
+from .simulator import Simulator
+from .primitives import GenericReg, GenericLatch
+from .port import EdgeType
+from .utils import adapt
+from .cone_compiler import create_sim_value_converter
+from .register_bank import get_reg_descriptors
+from .exceptions import SimulationException
+
+"""
+A cycle-based simulator for single-clock, fully synchronous designs.
+
+The event-driven Simulator spends most of its time propagating value changes through combinational logic,
+one delta-cycle at a time. For synchronous designs that's unnecessary: between clock edges the only thing
+that matters is the settled value of every net. The CycleSimulator evaluates every combinational module
+exactly once, in netlist rank order, then updates all registers together on the clock edge.
+
+Restrictions (all of them raise a SimulationException during setup):
+    - All registers must be GenericReg instances, clocked by the same net, which is not driven by logic.
+    - Asynchronous resets are not supported.
+    - Latches are not supported.
+    - Non-combinational modules with custom 'simulate' methods (test-benches, memories, assertions)
+      are not supported. Stimulus is applied by assigning to nets between 'run_cycles' calls.
+
+Usage:
+
+    with CycleSimulator(netlist, "waves.vcd") as sim:
+        sim.dump_signals()
+        top.in_a <<= 3
+        sim.run_cycles(10)
+        print(top.out_a.sim_value)
+"""
+
+class CycleSimulator(Simulator):
+    class SimulatorContext(Simulator.SimulatorContext):
+        def __init__(self, simulator: 'CycleSimulator', vcd_stream: Optional[IO], timescale: str):
+            super().__init__(simulator, vcd_stream, timescale)
+            self.evaluators: List[Callable[[], None]] = [] # One entry for every combinational module, in rank order
+            # Registers are described by tuples of (output index, input index, reset index, reset value index, reset value, clock enable index).
+            # See get_reg_descriptors for details.
+            self.pos_regs: List[Tuple[int, ...]] = []
+            self.neg_regs: List[Tuple[int, ...]] = []
+            self.clock_xnet: Optional[XNet] = None
+            self.clock_values: Tuple[Any, Any] = (None, None) # Simulation values for low and high clock
+            self.clock_drives_logic = False # Set if the clock is used as data by combinational logic
+
+        def _setup(self) -> None:
+            netlist = self.simulator.netlist
+            self.state_store = self._create_state_store(netlist.xnets)
+            netlist._add_simulation(self)
+            self.state_store.freeze_static_fanout()
+
+            rank_map = netlist.rank_map
+            combinational_modules = []
+            clock_xnets = set()
+            for module in sorted(netlist.modules, key=lambda module: rank_map[module]):
+                if isinstance(module, GenericLatch):
+                    raise SimulationException(f"Latches are not supported by the cycle-based simulator", module._impl)
+                if isinstance(module, GenericReg):
+                    if not module.sync_reset and module.reset_port.has_driver():
+                        raise SimulationException(f"Asynchronous resets are not supported by the cycle-based simulator", module._impl)
+                    clock_xnets.add(netlist.get_xnet_for_junction(module.clock_port))
+                    self._add_reg(module)
+                    continue
+                if not hasattr(module, "simulate"):
+                    continue
+                if module.is_combinational():
+                    combinational_modules.append(module)
+                    continue
+                if self._start_simulate(module) is not None:
+                    raise SimulationException(f"Only registers and combinational modules are supported by the cycle-based simulator", module._impl)
+
+            if len(clock_xnets) > 1:
+                raise SimulationException(f"Multiple clocks are not supported by the cycle-based simulator. Clocks: {', '.join(xnet.get_diagnostic_name(netlist) for xnet in clock_xnets)}")
+            if len(clock_xnets) == 1:
+                self.clock_xnet = clock_xnets.pop()
+                clock_source = self.clock_xnet.get_source()
+                if clock_source is not None and clock_source.get_parent_module() in rank_map and clock_source.get_parent_module().is_combinational():
+                    raise SimulationException(f"Clocks, driven by logic are not supported by the cycle-based simulator", clock_source)
+                clock_type = self.clock_xnet.get_net_type()
+                self.clock_values = tuple(adapt(value, clock_type, implicit=False, force=False, allow_memberwise_adapt=False) for value in (0, 1))
+                self.state_store.set_value(self.clock_xnet.sim_index, self.clock_values[0], self.now, 0)
+
+            for module in combinational_modules:
+                self._add_evaluator(module)
+                for port in module.get_inputs().values():
+                    for member in port.get_all_member_junctions(add_self=True):
+                        if not member.is_composite() and netlist.get_xnet_for_junction(member) is self.clock_xnet:
+                            self.clock_drives_logic = True
+            self.evaluate()
+
+        def _add_reg(self, reg: GenericReg) -> None:
+            regs = self.pos_regs if reg.clk_edge == EdgeType.Positive else self.neg_regs
+            regs += get_reg_descriptors(self.simulator.netlist, reg)
+
+        def _start_simulate(self, module: 'Module') -> Optional[Generator]:
+            """
+            Calls the 'simulate' method of a module. Returns the generator if 'simulate' is a generator, None otherwise.
+            """
+            try:
+                generator = module.simulate(self.simulator)
+            except TypeError:
+                generator = module.simulate()
+            return generator if isgenerator(generator) else None
+
+        def _get_sim_function(self, module: 'Module') -> Optional[Tuple[Tuple[int], XNet, Callable]]:
+            """
+            Returns the input indices (into the state store), the output XNet and the conversion-included evaluation function
+            for modules that support get_sim_function on non-composite ports, None otherwise.
+            """
+            sim_function = module.get_sim_function()
+            if sim_function is None:
+                return None
+            inputs, output, function = sim_function
+            if output.is_composite() or any(input.is_composite() for input in inputs):
+                return None
+            netlist = self.simulator.netlist
+            input_indices = tuple(netlist.get_xnet_for_junction(input).sim_index for input in inputs)
+            convert = create_sim_value_converter(output)
+            def converted_function(*values: Any) -> Any:
+                return convert(function(*values))
+            return input_indices, netlist.get_xnet_for_junction(output), converted_function
+
+        def _add_evaluator(self, module: 'Module') -> None:
+            sim_function = self._get_sim_function(module)
+            if sim_function is not None:
+                input_indices, output_xnet, function = sim_function
+                values = self.state_store.values
+                def evaluate() -> None:
+                    self.schedule_value_change(output_xnet, function(*(values[index] for index in input_indices)))
+                self.evaluators.append(evaluate)
+                return
+            # Fall back to calling the 'simulate' method of the module once per evaluation
+            generator = self._start_simulate(module)
+            if generator is None:
+                # One-shot modules (constants for instance) are done at this point
+                return
+            try:
+                generator.send(None)
+            except StopIteration:
+                return
+            def evaluate() -> None:
+                try:
+                    wait = generator.send(self.now)
+                except StopIteration:
+                    self.evaluators.remove(evaluate)
+                    return
+                if isinstance(wait, int):
+                    raise SimulationException(f"Combinational modules can't wait for time in the cycle-based simulator", module._impl)
+            self.evaluators.append(evaluate)
+
+        def evaluate(self) -> None:
+            """
+            Evaluates all combinational logic in rank order
+            """
+            for evaluator in tuple(self.evaluators):
+                evaluator()
+
+        def _clock_edge(self, clock_value: int, regs: Sequence[Tuple[int, ...]]) -> None:
+            now = self.now
+            if self.trace_control is not None:
+                self.trace_control.apply_scheduled(now)
+            set_value = self.state_store.set_value
+            if self.clock_xnet is not None:
+                set_value(self.clock_xnet.sim_index, self.clock_values[clock_value], now, 0)
+            # Registers sample all their inputs before any of them update
+            new_values = tuple(self._sample_regs(regs))
+            for out_index, value in new_values:
+                set_value(out_index, value, now, 1)
+            # Nothing could have changed if no register was clocked and the clock itself is not used by logic
+            if len(new_values) > 0 or self.clock_drives_logic:
+                self.evaluate()
+
+        def _sample_regs(self, regs: Sequence[Tuple[int, ...]]) -> Generator[Tuple[int, Any], None, None]:
+            """
+            Yields the output index and the new value of every register that changes on the current clock edge
+            """
+            values = self.state_store.values
+            for out_index, in_index, reset_index, reset_value_index, reset_value, clock_en_index in regs:
+                if reset_index is not None and values[reset_index] == 1:
+                    yield out_index, values[reset_value_index] if reset_value_index is not None else reset_value
+                elif clock_en_index is None or values[clock_en_index] == 1:
+                    yield out_index, values[in_index]
+
+        def schedule_value_change(self, xnet: XNet, value: Any, when: Optional[int] = None) -> None:
+            """
+            Called by modules (and through port assignments) to change the value of a net.
+            There are no delta-cycles in cycle-based simulation, so the change takes effect immediately.
+            """
+            if when is not None and when != self.now:
+                raise SimulationException(f"Scheduling value changes into the future is not supported by the cycle-based simulator")
+            self.state_store.set_value(xnet.sim_index, value, self.now, 0)
+
+        def schedule_generator(self, generator: Generator, when: Optional[int] = None) -> None:
+            raise SimulationException(f"Scheduling generators is not supported by the cycle-based simulator")
+
+        def run_cycles(self, cycle_cnt: int) -> int:
+            """
+            Simulates 'cycle_cnt' clock cycles. Each cycle starts with the clock low, the clock rises
+            half-way through the cycle and falls at the end of it. This way, any value assigned between
+            calls is stable by the time registers sample it.
+
+            Returns the simulation time at the end of the last cycle.
+            """
+            simulator = self.simulator
+            half_period = simulator.clock_period // 2
+            # Pick up any changes the user made since the last call
+            self.evaluate()
+            for _ in range(cycle_cnt):
+                simulator._now += half_period
+                self._clock_edge(1, self.pos_regs)
+                simulator._now += simulator.clock_period - half_period
+                self._clock_edge(0, self.neg_regs)
+                if self.vcd_writer is not None:
+                    self.vcd_writer.flush()
+            return self.now
+
+        def simulate(self, end_time: Optional[int] = None) -> int:
+            """
+            Simulates until 'end_time' (which must be specified).
+            """
+            if end_time is None:
+                raise SimulationException(f"The cycle-based simulator needs an end time to simulate to")
+            return self.run_cycles(max(0, (end_time - self.now + self.simulator.clock_period - 1) // self.simulator.clock_period))
+
+    def __init__(self, netlist: Netlist, vcd_file: Optional[Union[IO,str]], timescale='1ns', *, clock_period: int = 10):
+        super().__init__(netlist, vcd_file, timescale)
+        if clock_period < 2:
+            raise SimulationException(f"Clock period must be at least 2 time units")
+        self.clock_period = clock_period
+        self._now = 0
+
+    @property
+    def now(self) -> int:
+        return self._now
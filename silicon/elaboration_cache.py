@@ -0,0 +1,208 @@
+from typing import Any, Callable, Dict, Optional, Sequence, Set, Tuple, Union
+from types import FunctionType
+from pathlib import Path
+from hashlib import sha256
+from timeit import default_timer
+import io
+import os
+import sys
+import pickle
+import threading
+
+from .netlist import Netlist
+from .utils import vprint, VerbosityLevels
+
+"""
+A persistent, on-disk cache of elaborated netlists.
+
+Elaboration is usually the most expensive step of a run, yet most runs elaborate the very same design as
+the previous one did. An ElaborationCache stores the netlist after elaboration in a directory and a later
+run with the same inputs loads it from there, ready for 'generate' or 'simulate':
+
+    cache = ElaborationCache("build/elaboration_cache")
+    netlist = cache.elaborate(Top, data_width=32)
+    netlist.generate(SystemVerilog(...))
+
+Entries are keyed by the top level class and the parameters passed to it. An entry also records the
+Python source files its netlist refers to (the ones defining the classes and functions in it and all
+of silicon) with a hash of their content. If any of them changed since, the entry is stale: the design
+is elaborated again and the entry is replaced. Sources that the netlist doesn't refer to (helper functions
+called from 'body' in another module, for instance) can be listed in 'dependencies'.
+
+Netlists are stored using pickle. Classes and functions are stored by name, except for the types that
+are created on the fly (net types of NetTypeFactories, the typed junction classes etc.): those remember
+the call that created them in '_type_factory' and get re-created by repeating that call. Designs with
+classes or functions that can't be found by name (the ones defined inside functions for instance) can't
+be stored: for those 'elaborate' simply returns the freshly elaborated netlist every time.
+
+Pickling recurses along the references between objects, and the chains of junctions and modules of all but
+the smallest netlists are a lot deeper than what the default recursion limit allows for. To store those,
+pass a 'dump_stack_size' (ElaborationCache.deep_stack_size is enough for large designs): netlists are then
+pickled in a thread with a stack of that size and the recursion limit raised to match. Both of these are
+process-wide settings: they are restored once the netlist is pickled, but other threads see them until then.
+
+NOTE: loading an entry un-pickles it, which can run arbitrary code: only use cache directories you trust.
+"""
+
+# Bump this every time the stored representation changes in an incompatible way
+_format_version = 1
+# The most stack a level of pickling recursion needs: the recursion limit is raised to the stack size divided by this
+_dump_frame_size = 5 * 1024
+# The recursion limit and the thread stack size are process-wide: only one dump can change them at a time
+_dump_lock = threading.Lock()
+
+class _NetlistPickler(pickle.Pickler):
+    def __init__(self, file: io.BufferedIOBase):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.source_modules: Set[str] = set()
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, type):
+            type_factory = obj.__dict__.get("_type_factory", None)
+            if type_factory is not None:
+                return type_factory
+            self.source_modules.add(obj.__module__)
+        elif isinstance(obj, FunctionType):
+            self.source_modules.add(obj.__module__)
+        return NotImplemented
+
+def _dump(obj: Any, stack_size: Optional[int] = None) -> Tuple[bytes, Set[str]]:
+    """
+    Pickles 'obj'. Returns the pickled bytes and the names of the modules whose classes and functions it refers to.
+
+    Without a 'stack_size', pickling is done in the calling thread, within its recursion limit. Otherwise it's
+    done in a thread of its own, with a stack of 'stack_size' bytes (see the notes at the top of this file).
+    Raises a RuntimeError if that thread can't be started.
+    """
+    stream = io.BytesIO()
+    pickler = _NetlistPickler(stream)
+    if stack_size is None:
+        pickler.dump(obj)
+        return stream.getvalue(), pickler.source_modules
+
+    exceptions = []
+    def dump() -> None:
+        try:
+            pickler.dump(obj)
+        except BaseException as ex:
+            exceptions.append(ex)
+
+    with _dump_lock:
+        recursion_limit = sys.getrecursionlimit()
+        old_stack_size = threading.stack_size()
+        try:
+            threading.stack_size(stack_size)
+            sys.setrecursionlimit(max(recursion_limit, stack_size // _dump_frame_size))
+            dump_thread = threading.Thread(target=dump)
+            dump_thread.start()
+            dump_thread.join()
+        finally:
+            threading.stack_size(old_stack_size)
+            sys.setrecursionlimit(recursion_limit)
+    if len(exceptions) > 0:
+        raise exceptions[0]
+    return stream.getvalue(), pickler.source_modules
+
+def _get_source_hash(file_name: str) -> Optional[str]:
+    try:
+        with open(file_name, "rb") as source_file:
+            return sha256(source_file.read()).hexdigest()
+    except OSError:
+        return None
+
+class ElaborationCache(object):
+    """
+    Stores elaborated netlists in 'cache_dir' and loads them from there if nothing changed since.
+
+    Netlists are pickled in a thread with 'dump_stack_size' bytes of stack if it's given, in the calling thread otherwise.
+    """
+    # A stack size that is enough to store large netlists
+    deep_stack_size = 1024 * 1024 * 1024
+
+    def __init__(self, cache_dir: Union[str, Path], *, dependencies: Sequence[Union[str, Path]] = (), dump_stack_size: Optional[int] = None):
+        self.cache_dir = Path(cache_dir)
+        self.dependencies = tuple(str(Path(dependency).absolute()) for dependency in dependencies)
+        self.dump_stack_size = dump_stack_size
+
+    def get_key(self, top_class: Callable, *args, **kwargs) -> Optional[str]:
+        """
+        Returns the cache key for the netlist of top_class(*args, **kwargs), or None if the parameters can't be stored.
+        """
+        # Parameters are small: they are pickled right here, without changing the recursion limit
+        try:
+            pickled_parameters, _ = _dump((_format_version, sys.version_info[:2], top_class, args, kwargs))
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            return None
+        return sha256(pickled_parameters).hexdigest()
+
+    def _get_file_name(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.netlist"
+
+    def load(self, key: str) -> Optional[Netlist]:
+        """
+        Returns the netlist stored under 'key', or None if there's no such entry or it is stale.
+        """
+        start = default_timer()
+        try:
+            with open(self._get_file_name(key), "rb") as cache_file:
+                format_version, sources = pickle.load(cache_file)
+                if format_version != _format_version:
+                    return None
+                for file_name, source_hash in sources.items():
+                    if _get_source_hash(file_name) != source_hash:
+                        return None
+                netlist = pickle.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            # Anything can go wrong while loading (a class that is not there anymore for instance): treat it as a miss
+            vprint(VerbosityLevels.instantiation, f"Ignoring elaboration cache entry {key}: {ex}")
+            return None
+        netlist.phase_times["load"] = default_timer() - start
+        return netlist
+
+    def store(self, key: str, netlist: Netlist) -> bool:
+        """
+        Stores 'netlist' under 'key'. Returns False if the netlist can't be stored.
+        """
+        # NOTE: RecursionError is a RuntimeError, just as the failure to start the thread for a deep stack
+        try:
+            pickled_netlist, source_modules = _dump(netlist, self.dump_stack_size)
+        except (pickle.PicklingError, TypeError, AttributeError, RuntimeError) as ex:
+            vprint(VerbosityLevels.instantiation, f"Netlist can't be stored in elaboration cache: {ex}")
+            if isinstance(ex, RecursionError) and self.dump_stack_size is None:
+                vprint(VerbosityLevels.instantiation, "Large netlists need a 'dump_stack_size' to be stored")
+            return False
+        source_files = set(self.dependencies)
+        source_files.update(str(source_file) for source_file in Path(__file__).parent.glob("*.py"))
+        for module_name in source_modules:
+            module_file = getattr(sys.modules.get(module_name, None), "__file__", None)
+            if module_file is not None:
+                source_files.add(str(Path(module_file).absolute()))
+        sources: Dict[str, Optional[str]] = {source_file: _get_source_hash(source_file) for source_file in sorted(source_files)}
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        file_name = self._get_file_name(key)
+        # Write a temporary file first, so that concurrent runs never see a partial entry
+        temp_file_name = file_name.with_name(f"{file_name.name}.{os.getpid()}.tmp")
+        with open(temp_file_name, "wb") as cache_file:
+            pickle.dump((_format_version, sources), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            cache_file.write(pickled_netlist)
+        os.replace(temp_file_name, file_name)
+        return True
+
+    def elaborate(self, top_class: Callable, *args, **kwargs) -> Netlist:
+        """
+        Returns the elaborated netlist for top_class(*args, **kwargs): loaded from the cache if possible,
+        elaborated (and stored for next time) otherwise.
+        """
+        key = self.get_key(top_class, *args, **kwargs)
+        if key is not None:
+            netlist = self.load(key)
+            if netlist is not None:
+                return netlist
+        with Netlist().elaborate() as netlist:
+            top_class(*args, **kwargs)
+        if key is not None:
+            self.store(key, netlist)
+        return netlist
@@ -0,0 +1,145 @@
+from typing import Any, Tuple
+
+"""
+Bit-parallel four-state (0, 1, X) simulation values.
+
+By default the simulator models X as None on the whole net: a single unknown bit makes the whole
+value unknown. In four-state simulation (Simulator(..., four_state=True)) integer nets can also
+hold partially unknown values. These are represented by XValue objects, which store the known bits
+in an integer and the unknown bits in a mask, so X propagation can be done with a handful of integer
+operations.
+
+Values are only ever XValues if at least one bit of the value is unknown: fully known values are
+still stored as raw ints, so designs without X-es take the same (fast) paths as in normal simulation.
+
+XValues never leave four-state aware code: 'Junction.sim_value' still returns None for any net with
+unknown bits. Four-state aware primitives (bitwise gates, slices, concatenation, size adaptors and
+registers) look at 'Junction.four_state_sim_value' whenever 'sim_value' is None.
+"""
+
+class XValue(object):
+    """
+    A partially unknown integer value.
+
+    Bits set in 'x_mask' are unknown, the same bits in 'value' are always 0. For signed values, bits
+    above the size of the net follow the sign bit, if that is known. If the sign bit is unknown, 'value'
+    is the unsigned (positive) bit-pattern of the net.
+    """
+    __slots__ = ("value", "x_mask")
+
+    def __init__(self, value: int, x_mask: int):
+        self.value = value & ~x_mask
+        self.x_mask = x_mask
+
+    def is_different(self, other: Any) -> bool:
+        if other.__class__ is not XValue:
+            return True
+        return self.value != other.value or self.x_mask != other.x_mask
+
+    def __eq__(self, other: Any) -> bool:
+        return other.__class__ is XValue and self.value == other.value and self.x_mask == other.x_mask
+
+    def __hash__(self) -> int:
+        return hash((self.value, self.x_mask))
+
+    def __repr__(self) -> str:
+        return f"XValue({self.value:#x}, x_mask={self.x_mask:#x})"
+
+    def to_bit_str(self, num_bits: int) -> str:
+        """
+        Returns the value as a string of '0', '1' and 'x' characters, MSB first.
+        """
+        value = self.value
+        x_mask = self.x_mask
+        return "".join("x" if (x_mask >> bit) & 1 else "1" if (value >> bit) & 1 else "0" for bit in range(num_bits - 1, -1, -1))
+
+def x_split(value: Any) -> Tuple[int, int]:
+    """
+    Returns the (value, x_mask) pair for a simulation value. None is unknown on every bit.
+    """
+    if value.__class__ is int:
+        return value, 0
+    if value.__class__ is XValue:
+        return value.value, value.x_mask
+    # None, or anything that is not an integer (such as fractional values, which can't have unknown bits)
+    return 0, -1
+
+def x_join(value: int, x_mask: int) -> Any:
+    """
+    The inverse of x_split: returns an int if all bits are known, None if all of them are unknown, an XValue otherwise.
+    """
+    if x_mask == 0:
+        return value
+    if x_mask < 0:
+        # Unknown on an infinite number of bits: the width of the result is not known here
+        return None
+    return XValue(value, x_mask)
+
+# The binary operations below are precise even if one of the operands is None: a known 0 bit in the
+# other operand makes the corresponding bit of an AND known for instance. Because of that they can
+# return an XValue for inputs without any: callers should only use them if there's at least one.
+#
+# Each of them is built on a '*_bits' counterpart, which works on (value, x_mask) pairs. Those only use
+# integer operators, so they work on NumPy arrays just as well: the LaneSimulator uses them to propagate
+# unknown bits in all lanes at once (see lane_simulator.py).
+
+def x_and_bits(a_value: Any, a_mask: Any, b_value: Any, b_mask: Any) -> Tuple[Any, Any]:
+    # Known 0-s on either side force the result to 0
+    known_zeros = (~a_value & ~a_mask) | (~b_value & ~b_mask)
+    return a_value & b_value, (a_mask | b_mask) & ~known_zeros
+
+def x_or_bits(a_value: Any, a_mask: Any, b_value: Any, b_mask: Any) -> Tuple[Any, Any]:
+    # Known 1-s on either side force the result to 1 (unknown bits in '*_value' are 0)
+    known_ones = a_value | b_value
+    return known_ones, (a_mask | b_mask) & ~known_ones
+
+def x_xor_bits(a_value: Any, a_mask: Any, b_value: Any, b_mask: Any) -> Tuple[Any, Any]:
+    x_mask = a_mask | b_mask
+    return (a_value ^ b_value) & ~x_mask, x_mask
+
+def x_not_bits(a_value: Any, a_mask: Any, num_bits: int) -> Tuple[Any, Any]:
+    bit_mask = (1 << num_bits) - 1
+    x_mask = a_mask & bit_mask
+    return (a_value ^ bit_mask) & ~x_mask, x_mask
+
+def x_slice_bits(a_value: Any, a_mask: Any, shift: int, bit_mask: int) -> Tuple[Any, Any]:
+    return (a_value >> shift) & bit_mask, (a_mask >> shift) & bit_mask
+
+def x_resize_bits(a_value: Any, a_mask: Any, input_bits: int, input_signed: bool, output_bits: int, output_signed: bool) -> Tuple[Any, Any]:
+    if input_signed:
+        # Unknown sign bit: all the extension bits are unknown as well
+        a_mask = a_mask | (((a_mask >> (input_bits - 1)) & 1) * (-1 << input_bits))
+    bit_mask = (1 << output_bits) - 1
+    a_value = a_value & bit_mask
+    a_mask = a_mask & bit_mask
+    # Sign-extend (known) negative results
+    if output_signed:
+        a_value = a_value - ((a_value >> (output_bits - 1)) & 1) * (bit_mask + 1)
+    return a_value, a_mask
+
+def x_and(a: Any, b: Any) -> Any:
+    return x_join(*x_and_bits(*x_split(a), *x_split(b)))
+
+def x_or(a: Any, b: Any) -> Any:
+    return x_join(*x_or_bits(*x_split(a), *x_split(b)))
+
+def x_xor(a: Any, b: Any) -> Any:
+    return x_join(*x_xor_bits(*x_split(a), *x_split(b)))
+
+def x_not(a: Any, num_bits: int) -> Any:
+    if a is None:
+        return None
+    return x_join(*x_not_bits(*x_split(a), num_bits))
+
+def x_slice(a: Any, shift: int, bit_mask: int) -> Any:
+    if a is None:
+        return None
+    return x_join(*x_slice_bits(*x_split(a), shift, bit_mask))
+
+def x_resize(a: Any, input_bits: int, input_signed: bool, output_bits: int, output_signed: bool) -> Any:
+    """
+    Truncates or extends a value, the same way SizeAdaptor does for integers.
+    """
+    if a is None:
+        return None
+    return x_join(*x_resize_bits(*x_split(a), input_bits, input_signed, output_bits, output_signed))
@@ -1,20 +1,25 @@
+import operator
 from .module import Module, InlineBlock, InlineExpression
-from typing import Dict, Optional, Tuple, Any, Generator, Union
+from typing import Dict, Optional, Tuple, Any, Generator, Union, Sequence, Callable
 from .port import Input, Output, Port
 from .number import logic, Number
 from .exceptions import SyntaxErrorException, InvalidPortError
-from .utils import get_common_net_type, TSimEvent, adjust_precision
+from .utils import get_common_net_type, TSimEvent, StaticSensitivity, adjust_precision
+from .four_state import XValue, x_and, x_or, x_xor, x_not, x_and_bits, x_or_bits, x_xor_bits, x_not_bits
 
 def _is_sim_none(arg: Any) -> bool:
     if arg is None:
         return True
     if arg.sim_value is None:
         return True
-    if arg.sim_value.value is None:
+    if arg.sim_value.__class__ is not int and arg.sim_value.value is None:
         return True
     return False
 
 def _sim_value(arg: Any) -> Any:
+    # Integer nets store raw ints (and X as None): those don't need any conversion
+    if arg is None or arg.__class__ is int:
+        return arg
     try:
         raw_val = arg.sim_value
     except AttributeError:
@@ -27,8 +32,31 @@ def _sim_value(arg: Any) -> Any:
     #    return arg.sim_value
     #return arg
 
+def _two_state_value(port: Port) -> Any:
+    # In two-state simulation ports are never None, and integer nets hold raw ints
+    value = port.sim_value
+    if value.__class__ is int:
+        return value
+    return _sim_value(value)
+
+def _four_state_value(arg: Any) -> Any:
+    # The same as _sim_value, but returns partially unknown values (XValue) in four-state simulation
+    value = _sim_value(arg)
+    if value is None and arg is not None:
+        try:
+            return arg.four_state_sim_value
+        except AttributeError:
+            pass
+    return value
+
+def _lane_unknown(value: Any, x_mask: Any, unknown_mask: int) -> Tuple[Any, Any]:
+    # The multi-lane version of returning None for unknown inputs: lanes with any unknown input bits are unknown on all output bits
+    known = x_mask == 0
+    return value * known, unknown_mask * ~known
+
 class Gate(Module):
     output_port = Output()
+    four_state_aware = False # Set for gates that propagate individual unknown bits in four-state simulation (see four_state.py)
 
     def construct(self):
         self.max_input_cnt = None
@@ -82,13 +110,27 @@ class NInputGate(Gate):
     """
     A generic gate implementation for things where 'N' repeated operations over similar structures is supported. Things, such as (A & B & C) or (aa + bb + cc).
     """
+    two_state_op: Optional[Callable[[Any, Any], Any]] = None # The operation on two (known) values, used in two-state simulation
+    x_lane_op: Optional[Callable[[Any, Any, Any, Any], Tuple[Any, Any]]] = None # The bit-precise operation on (value, x_mask) pairs, used in multi-lane simulation
+
     def sim_op(self, next_input: Port, partial_output: Any) -> Any:
         raise NotImplementedError
-    def simulate(self) -> TSimEvent:
+    def simulate(self, simulator: 'Simulator') -> TSimEvent:
         target_precision = self.output_port.precision
+        sensitivity = StaticSensitivity(self.get_inputs().values())
+        if simulator.two_state and self.two_state_op is not None:
+            two_state_op = self.two_state_op
+            first_input, *other_inputs = sensitivity.ports
+            while True:
+                yield sensitivity
+                out_val = _two_state_value(first_input)
+                for input in other_inputs:
+                    out_val = two_state_op(out_val, _two_state_value(input))
+                self.output_port <<= out_val
+        first_value = _four_state_value if self.four_state_aware else _sim_value
         while True:
-            yield self.get_inputs().values()
-            inputs = list(self.get_inputs().values())
+            yield sensitivity
+            inputs = sensitivity.ports
             # We take all the non-None elements first, then a final None if there were any of those.
             # The reason is the following: let's assume we compute the two-bit OR of None | 1 | 2.
             # In this case, the result should be 3. But, if we initialize the partial output with
@@ -100,13 +142,53 @@ class NInputGate(Gate):
                     some_none = True
                 else:
                     if first:
-                        out_val = _sim_value(inputs[0])
+                        out_val = first_value(inputs[0])
                         first = False
                     else:
                         out_val = self.sim_op(input, out_val)
             if some_none:
                 out_val = self.sim_op(None, out_val)
             self.output_port <<= out_val
+    def get_sim_function(self) -> Optional[Tuple[Sequence[Port], Port, Callable]]:
+        sim_op = self.sim_op
+        def sim_function(first_input: Any, *other_inputs: Any) -> Any:
+            out_val = _sim_value(first_input)
+            for input in other_inputs:
+                out_val = sim_op(input, out_val)
+            return out_val
+        return tuple(self.get_inputs().values()), self.output_port, sim_function
+    def get_two_state_sim_function(self) -> Optional[Tuple[Sequence[Port], Port, Callable]]:
+        two_state_op = self.two_state_op
+        if two_state_op is None:
+            return self.get_sim_function()
+        def sim_function(first_input: Any, *other_inputs: Any) -> Any:
+            out_val = _sim_value(first_input)
+            for input in other_inputs:
+                out_val = two_state_op(out_val, _sim_value(input))
+            return out_val
+        return tuple(self.get_inputs().values()), self.output_port, sim_function
+    def get_lane_sim_function(self) -> Optional[Tuple[Sequence[Port], Port, Callable]]:
+        x_lane_op = self.x_lane_op
+        if x_lane_op is not None:
+            def sim_function(first_input: Any, *other_inputs: Any) -> Tuple[Any, Any]:
+                value = first_input.value
+                x_mask = first_input.x_mask
+                for input in other_inputs:
+                    value, x_mask = x_lane_op(value, x_mask, input.value, input.x_mask)
+                return value, x_mask
+            return tuple(self.get_inputs().values()), self.output_port, sim_function
+        two_state_op = self.two_state_op
+        if two_state_op is None:
+            return None
+        unknown_mask = (1 << self.output_port.get_num_bits()) - 1
+        def sim_function(first_input: Any, *other_inputs: Any) -> Tuple[Any, Any]:
+            value = first_input.value
+            x_mask = first_input.x_mask
+            for input in other_inputs:
+                value = two_state_op(value, input.value)
+                x_mask = x_mask | input.x_mask
+            return _lane_unknown(value, x_mask, unknown_mask)
+        return tuple(self.get_inputs().values()), self.output_port, sim_function
     def generate_op(self, back_end: str) -> Tuple[str, int]:
         raise NotImplementedError
 
@@ -130,16 +212,21 @@ class NInputGate(Gate):
         return ret_val, op_precedence
 
 class and_gate(NInputGate):
+    four_state_aware = True
+    two_state_op = staticmethod(operator.and_)
+    x_lane_op = staticmethod(x_and_bits)
     def sim_op(self, next_input: Port, partial_output: Any) -> Any:
-        next_input = _sim_value(next_input)
+        next_input = _four_state_value(next_input)
+        if next_input.__class__ is XValue or partial_output.__class__ is XValue:
+            return x_and(next_input, partial_output)
         if next_input is None:
             if partial_output == 0:
-                return Number.NetValue(0)
+                return 0
             else:
                 return None
         if partial_output is None:
             if next_input == 0:
-                return Number.NetValue(0)
+                return 0
             else:
                 return None
         return next_input & partial_output
@@ -154,12 +241,17 @@ class and_gate(NInputGate):
 
 
 class or_gate(NInputGate):
+    four_state_aware = True
+    two_state_op = staticmethod(operator.or_)
+    x_lane_op = staticmethod(x_or_bits)
     def sim_op(cls, next_input: Port, partial_output: Any) -> Any:
         def all_ones(n):
             if n is None: return None
             return ((n+1) & n == 0) and (n!=0)
 
-        next_input = _sim_value(next_input)
+        next_input = _four_state_value(next_input)
+        if next_input.__class__ is XValue or partial_output.__class__ is XValue:
+            return x_or(next_input, partial_output)
         if next_input is None:
             if all_ones(_sim_value(partial_output)):
                 return partial_output
@@ -180,8 +272,13 @@ class or_gate(NInputGate):
         return adjust_precision(input, input_expression, input_precedence, self.output_port.precision, back_end)
 
 class xor_gate(NInputGate):
+    four_state_aware = True
+    two_state_op = staticmethod(operator.xor)
+    x_lane_op = staticmethod(x_xor_bits)
     def sim_op(cls, next_input: Port, partial_output: Any) -> Any:
-        next_input = _sim_value(next_input)
+        next_input = _four_state_value(next_input)
+        if next_input.__class__ is XValue or partial_output.__class__ is XValue:
+            return x_xor(next_input, partial_output)
         if next_input is None or partial_output is None:
             return None
         return next_input ^ partial_output
@@ -194,6 +291,7 @@ class xor_gate(NInputGate):
         return adjust_precision(input, input_expression, input_precedence, self.output_port.precision, back_end)
 
 class sum_gate(NInputGate):
+    two_state_op = staticmethod(operator.add)
     def sim_op(cls, next_input: Port, partial_output: Any) -> Any:
         next_input = _sim_value(next_input)
         if next_input is None or partial_output is None:
@@ -208,6 +306,7 @@ class sum_gate(NInputGate):
         return adjust_precision(input, input_expression, input_precedence, self.output_port.precision, back_end)
 
 class prod_gate(NInputGate):
+    two_state_op = staticmethod(operator.mul)
     def sim_op(cls, next_input: Port, partial_output: Any) -> Any:
         next_input = _sim_value(next_input)
         if next_input is None or partial_output is None:
@@ -233,6 +332,8 @@ class prod_gate(NInputGate):
 """
 
 class UnaryGate(Gate):
+    lane_op: Optional[Callable[[Any], Any]] = None # The operation on the (known) values of all lanes, used in multi-lane simulation
+
     def construct(self):
         self.max_input_cnt = 1
     def generate_op(self, back_end: 'BackEnd') -> Tuple[str, int]:
@@ -255,16 +356,37 @@ class UnaryGate(Gate):
     def sim_op(cls, input: Port) -> Any:
         raise NotImplementedError
     def simulate(self) -> TSimEvent:
+        sensitivity = StaticSensitivity(self.get_inputs().values())
         while True:
-            yield self.get_inputs().values()
+            yield sensitivity
             self.output_port <<= self.sim_op(self.input_port_0)
+    def get_sim_function(self) -> Optional[Tuple[Sequence[Port], Port, Callable]]:
+        return (self.input_port_0, ), self.output_port, self.sim_op
+    def get_lane_sim_function(self) -> Optional[Tuple[Sequence[Port], Port, Callable]]:
+        lane_op = self.lane_op
+        if lane_op is None:
+            return None
+        unknown_mask = (1 << self.output_port.get_num_bits()) - 1
+        def sim_function(input: Any) -> Tuple[Any, Any]:
+            return _lane_unknown(lane_op(input.value), input.x_mask, unknown_mask)
+        return (self.input_port_0, ), self.output_port, sim_function
 
 class not_gate(UnaryGate):
+    four_state_aware = True
     def sim_op(self, input: Port) -> Any:
-        input_val = _sim_value(input)
+        input_val = _four_state_value(input)
         if input_val is None:
             return None
+        if input_val.__class__ is XValue:
+            return x_not(input_val, self.output_port.get_num_bits())
+        if input_val.__class__ is int:
+            return input_val ^ ((1 << self.output_port.get_num_bits()) - 1)
         return Number.NetValue(input_val).invert(self.output_port.get_num_bits())
+    def get_lane_sim_function(self) -> Optional[Tuple[Sequence[Port], Port, Callable]]:
+        num_bits = self.output_port.get_num_bits()
+        def sim_function(input: Any) -> Tuple[Any, Any]:
+            return x_not_bits(input.value, input.x_mask, num_bits)
+        return (self.input_port_0, ), self.output_port, sim_function
     def generate_op(self, back_end: 'BackEnd') -> Tuple[str, int]:
         assert back_end.language == "SystemVerilog"
         return "~", back_end.get_operator_precedence("~", back_end.UNARY)
@@ -274,6 +396,7 @@ class not_gate(UnaryGate):
         return adjust_precision(input, input_expression, input_precedence, self.output_port.precision, back_end)
 
 class neg_gate(UnaryGate):
+    lane_op = staticmethod(operator.neg)
     def sim_op(cls, input: Port) -> Any:
         input = _sim_value(input)
         if input is None:
@@ -288,6 +411,7 @@ class neg_gate(UnaryGate):
         return adjust_precision(input, input_expression, input_precedence, self.output_port.precision, back_end)
 
 class abs_gate(UnaryGate):
+    lane_op = staticmethod(operator.abs)
     def sim_op(cls, input: Port) -> Any:
         input = _sim_value(input)
         if input is None:
@@ -306,6 +430,7 @@ class abs_gate(UnaryGate):
         return adjust_precision(input, input_expression, input_precedence, self.output_port.precision, back_end)
 
 class bool_gate(UnaryGate):
+    lane_op = staticmethod(lambda value: value != 0)
     def construct(self):
         super().construct()
         from .number import logic
@@ -334,6 +459,8 @@ class bool_gate(UnaryGate):
 """
 
 class BinaryGate(Gate):
+    lane_op: Optional[Callable[[Any, Any], Any]] = None # The operation on the (known) values of all lanes, used in multi-lane simulation
+
     def construct(self):
         self.max_input_cnt = 2
 
@@ -360,13 +487,25 @@ class BinaryGate(Gate):
     def sim_op(cls, input_0: Port, input_1: Any) -> Any:
         raise NotImplementedError
     def simulate(self) -> TSimEvent:
+        sensitivity = StaticSensitivity(self.get_inputs().values())
         while True:
-            yield self.get_inputs().values()
+            yield sensitivity
             self.output_port <<= self.sim_op(self.input_port_0, self.input_port_1)
+    def get_sim_function(self) -> Optional[Tuple[Sequence[Port], Port, Callable]]:
+        return (self.input_port_0, self.input_port_1), self.output_port, self.sim_op
+    def get_lane_sim_function(self) -> Optional[Tuple[Sequence[Port], Port, Callable]]:
+        lane_op = self.lane_op
+        if lane_op is None:
+            return None
+        unknown_mask = (1 << self.output_port.get_num_bits()) - 1
+        def sim_function(input_0: Any, input_1: Any) -> Tuple[Any, Any]:
+            return _lane_unknown(lane_op(input_0.value, input_1.value), input_0.x_mask | input_1.x_mask, unknown_mask)
+        return (self.input_port_0, self.input_port_1), self.output_port, sim_function
     def get_verilog_bit_width(self) -> int:
         raise NotImplementedError()
 
 class sub_gate(BinaryGate):
+    lane_op = staticmethod(operator.sub)
     def sim_op(cls, input_0: Port, input_1: Any) -> Any:
         input_0 = _sim_value(input_0)
         input_1 = _sim_value(input_1)
@@ -384,6 +523,7 @@ class sub_gate(BinaryGate):
         return max(port.get_net_type().get_num_bits() for port in self.get_inputs().values())
 
 class lshift_gate(BinaryGate):
+    lane_op = staticmethod(operator.lshift)
     def sim_op(cls, input_0: Port, input_1: Any) -> Any:
         input_0 = _sim_value(input_0)
         input_1 = _sim_value(input_1)
@@ -404,6 +544,7 @@ class lshift_gate(BinaryGate):
         return self.input_port_0.get_num_bits()
 
 class rshift_gate(BinaryGate):
+    lane_op = staticmethod(operator.rshift)
     def sim_op(cls, input_0: Port, input_1: Any) -> Any:
         input_0 = _sim_value(input_0)
         input_1 = _sim_value(input_1)
@@ -441,11 +582,14 @@ class ComparisonGate(BinaryGate):
         return 1
 
 class lt_gate(ComparisonGate):
+    lane_op = staticmethod(operator.lt)
     def sim_op(cls, input_0: Port, input_1: Any) -> Any:
         input_0 = _sim_value(input_0)
         input_1 = _sim_value(input_1)
         if input_0 is None or input_1 is None:
             return None
+        if input_0.__class__ is int and input_1.__class__ is int:
+            return int(input_0 < input_1)
         return Number.NetValue.lt(input_0, input_1)
     def generate_op(self, back_end: 'BackEnd') -> Tuple[str, int]:
         assert back_end.language == "SystemVerilog"
@@ -454,11 +598,14 @@ class lt_gate(ComparisonGate):
         return adjust_precision(input, input_expression, input_precedence, max(i.precision for i in self.get_inputs().values()), back_end)
 
 class le_gate(ComparisonGate):
+    lane_op = staticmethod(operator.le)
     def sim_op(cls, input_0: Port, input_1: Any) -> Any:
         input_0 = _sim_value(input_0)
         input_1 = _sim_value(input_1)
         if input_0 is None or input_1 is None:
             return None
+        if input_0.__class__ is int and input_1.__class__ is int:
+            return int(input_0 <= input_1)
         return Number.NetValue.le(input_0, input_1)
     def generate_op(self, back_end: 'BackEnd') -> Tuple[str, int]:
         assert back_end.language == "SystemVerilog"
@@ -467,11 +614,14 @@ class le_gate(ComparisonGate):
         return adjust_precision(input, input_expression, input_precedence, max(i.precision for i in self.get_inputs().values()), back_end)
 
 class eq_gate(ComparisonGate):
+    lane_op = staticmethod(operator.eq)
     def sim_op(cls, input_0: Port, input_1: Any) -> Any:
         input_0 = _sim_value(input_0)
         input_1 = _sim_value(input_1)
         if input_0 is None or input_1 is None:
             return None
+        if input_0.__class__ is int and input_1.__class__ is int:
+            return int(input_0 == input_1)
         return Number.NetValue.eq(input_0, input_1)
     def generate_op(self, back_end: 'BackEnd') -> Tuple[str, int]:
         assert back_end.language == "SystemVerilog"
@@ -480,11 +630,14 @@ class eq_gate(ComparisonGate):
         return adjust_precision(input, input_expression, input_precedence, max(i.precision for i in self.get_inputs().values()), back_end)
 
 class ne_gate(ComparisonGate):
+    lane_op = staticmethod(operator.ne)
     def sim_op(cls, input_0: Port, input_1: Any) -> Any:
         input_0 = _sim_value(input_0)
         input_1 = _sim_value(input_1)
         if input_0 is None or input_1 is None:
             return None
+        if input_0.__class__ is int and input_1.__class__ is int:
+            return int(input_0 != input_1)
         return Number.NetValue.ne(input_0, input_1)
     def generate_op(self, back_end: 'BackEnd') -> Tuple[str, int]:
         assert back_end.language == "SystemVerilog"
@@ -493,11 +646,14 @@ class ne_gate(ComparisonGate):
         return adjust_precision(input, input_expression, input_precedence, max(i.precision for i in self.get_inputs().values()), back_end)
 
 class gt_gate(ComparisonGate):
+    lane_op = staticmethod(operator.gt)
     def sim_op(cls, input_0: Port, input_1: Any) -> Any:
         input_0 = _sim_value(input_0)
         input_1 = _sim_value(input_1)
         if input_0 is None or input_1 is None:
             return None
+        if input_0.__class__ is int and input_1.__class__ is int:
+            return int(input_0 > input_1)
         return Number.NetValue.gt(input_0, input_1)
     def generate_op(self, back_end: 'BackEnd') -> Tuple[str, int]:
         assert back_end.language == "SystemVerilog"
@@ -506,11 +662,14 @@ class gt_gate(ComparisonGate):
         return adjust_precision(input, input_expression, input_precedence, max(i.precision for i in self.get_inputs().values()), back_end)
 
 class ge_gate(ComparisonGate):
+    lane_op = staticmethod(operator.ge)
     def sim_op(cls, input_0: Port, input_1: Any) -> Any:
         input_0 = _sim_value(input_0)
         input_1 = _sim_value(input_1)
         if input_0 is None or input_1 is None:
             return None
+        if input_0.__class__ is int and input_1.__class__ is int:
+            return int(input_0 >= input_1)
         return Number.NetValue.ge(input_0, input_1)
     def generate_op(self, back_end: 'BackEnd') -> Tuple[str, int]:
         assert back_end.language == "SystemVerilog"
@@ -0,0 +1,339 @@
+from typing import Optional, Tuple, Generator, IO, Union, Any, Sequence, List, Callable
+import numpy as np
+from .netlist import Netlist, XNet
+from .simulator import SimStateStore
+from .cycle_simulator import CycleSimulator
+from .four_state import XValue
+from .utils import adapt
+from .exceptions import SimulationException
+
+"""
+Multi-lane (batched) cycle-based simulation.
+
+Regression and fuzzing runs simulate the same netlist over and over again with different stimulus.
+The LaneSimulator simulates 'lane_cnt' independent copies of the design in a single pass, with one
+simulation value for every lane of every XNet. All the overhead of figuring out what to evaluate and
+in what order is paid once, not once per lane.
+
+Integer XNets (of up to 62 bits) keep their lanes in NumPy arrays (see LaneValues): the known bits of
+every lane in one array, the unknown (X) bits in another, the same encoding XValue uses (see four_state.py).
+Gates, Select, Concatenator, slices, size adaptors and registers evaluate all lanes with a handful of
+vectorized operations (see Module.get_lane_sim_function). Bitwise operations, slices and concatenation
+propagate individual unknown bits. Because of that, lanes can have known bits where the CycleSimulator
+only knows that the whole value is unknown: the upper bits of (X & 0x0f)[7:4] for instance. Arithmetic
+and comparison makes the whole output of a lane unknown if any input bit is.
+
+All other XNets (enums, fractional or wide numbers) hold a tuple of regular simulation values, with None
+marking an unknown (X) value in a lane. Modules without a vectorized implementation, or with ports on such
+XNets, are evaluated by calling their sim function (see Module.get_sim_function) for every lane separately.
+
+The restrictions of the CycleSimulator apply. In addition, every combinational module must support
+get_sim_function on non-composite ports (constants are fine).
+
+Assigning a single value to a net (using <<=) sets it in all lanes. Use 'set_lanes' to assign a different
+value to each lane. The 'sim_value' of nets is a sequence of all the lane values, where lanes with any
+unknown bits are None. Waveforms are recorded for a single lane, selected by 'vcd_lane'.
+"""
+
+# Integer nets up to this size are kept in NumPy arrays. This leaves room in the 64-bit
+# lanes for the sign bit and for the sign extension of unknown bits (see x_resize_bits).
+max_lane_bits = 62
+
+class LaneValues(object):
+    """
+    The simulation value of an integer XNet in every lane.
+
+    'value' and 'x_mask' are NumPy int64 arrays with an entry for every lane: the known bits and the
+    unknown bits of the value (see XValue). Instances are never modified after they are created.
+
+    Indexing returns the simulation value of a single lane: an int, or None if any of its bits are unknown.
+    """
+    __slots__ = ("value", "x_mask")
+
+    def __init__(self, value: np.ndarray, x_mask: np.ndarray):
+        self.value = value
+        self.x_mask = x_mask
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, lane: int) -> Optional[int]:
+        if self.x_mask[lane] != 0:
+            return None
+        return int(self.value[lane])
+
+    def __iter__(self):
+        return iter(self.to_tuple())
+
+    def to_tuple(self) -> Tuple[Optional[int], ...]:
+        return tuple(None if x_mask != 0 else value for value, x_mask in zip(self.value.tolist(), self.x_mask.tolist()))
+
+    def get_four_state_value(self, lane: int) -> Any:
+        """
+        Returns the value of a single lane as an int, or as an XValue if any of its bits are unknown.
+        """
+        value = int(self.value[lane])
+        x_mask = int(self.x_mask[lane])
+        if x_mask == 0:
+            return value
+        return XValue(value, x_mask)
+
+    def is_different(self, other: Any) -> bool:
+        if other.__class__ is not LaneValues:
+            return True
+        return bool((self.value != other.value).any() or (self.x_mask != other.x_mask).any())
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is LaneValues:
+            return not self.is_different(other)
+        try:
+            return self.to_tuple() == tuple(other)
+        except TypeError:
+            return False
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"LaneValues{self.to_tuple()}"
+
+def _is_different(old_value: Any, new_value: Any) -> bool:
+    # Mirrors the comparison in SimStateStore.set_value
+    if old_value.__class__ is int and new_value.__class__ is int:
+        return old_value != new_value
+    if old_value is None or new_value is None:
+        return old_value is not new_value
+    try:
+        return old_value.is_different(new_value)
+    except AttributeError:
+        try:
+            return new_value.is_different(old_value)
+        except AttributeError:
+            return old_value != new_value
+
+def _is_one(lanes: Any) -> np.ndarray:
+    # The lanes where a (reset or clock enable) signal is known to be 1
+    if lanes.__class__ is LaneValues:
+        return (lanes.value == 1) & (lanes.x_mask == 0)
+    return np.array(tuple(value == 1 for value in lanes), dtype=bool)
+
+class LaneStateStore(SimStateStore):
+    """
+    A state store with one simulation value for every lane of every XNet.
+
+    Integer XNets of up to 'max_lane_bits' bits hold LaneValues, all others a tuple of simulation values.
+    """
+    def __init__(self, sim_context: 'LaneSimulator.SimulatorContext', xnets: Sequence[XNet]):
+        from .number import is_number
+
+        super().__init__(sim_context, xnets)
+        self.lane_cnt = sim_context.simulator.lane_cnt
+        # The mask of all the bits of every XNet that holds LaneValues, None for the ones that hold tuples
+        self.unknown_masks: List[Optional[int]] = [None] * len(self.xnets)
+        for index, xnet in enumerate(self.xnets):
+            net_type = xnet.get_net_type()
+            if net_type is not None and is_number(net_type) and net_type.precision == 0 and net_type.get_num_bits() <= max_lane_bits:
+                self.unknown_masks[index] = (1 << net_type.get_num_bits()) - 1
+                self.values[index] = self.to_lane_values(index, (self.values[index], ) * self.lane_cnt)
+            else:
+                self.values[index] = (self.values[index], ) * self.lane_cnt
+
+    def to_lane_values(self, index: int, lane_values: Sequence[Any]) -> LaneValues:
+        """
+        Converts the (validated) simulation values of each lane of an XNet to LaneValues.
+        """
+        if None not in lane_values:
+            return LaneValues(np.array(lane_values, dtype=np.int64), np.zeros(self.lane_cnt, dtype=np.int64))
+        unknown_mask = self.unknown_masks[index]
+        value = np.fromiter((0 if lane_value is None else lane_value for lane_value in lane_values), dtype=np.int64, count=self.lane_cnt)
+        x_mask = np.fromiter((unknown_mask if lane_value is None else 0 for lane_value in lane_values), dtype=np.int64, count=self.lane_cnt)
+        return LaneValues(value, x_mask)
+
+    def broadcast(self, index: int, value: Optional[int]) -> LaneValues:
+        """
+        Returns LaneValues for an XNet with the same (validated) simulation value in every lane.
+        """
+        if value is None:
+            return LaneValues(np.zeros(self.lane_cnt, dtype=np.int64), np.full(self.lane_cnt, self.unknown_masks[index], dtype=np.int64))
+        return LaneValues(np.full(self.lane_cnt, value, dtype=np.int64), np.zeros(self.lane_cnt, dtype=np.int64))
+
+    def get_lane_tuple(self, index: int) -> Tuple[Any, ...]:
+        """
+        Returns the simulation values of all the lanes of an XNet, None for lanes with any unknown bits.
+        """
+        value = self.values[index]
+        if value.__class__ is LaneValues:
+            return value.to_tuple()
+        return value
+
+    def set_value(self, index: int, new_value: Any, now: int, delta: int) -> bool:
+        """
+        Sets the value of an XNet in all lanes. 'new_value' is either a tuple of the values of each lane,
+        or a single value for all lanes. LaneValues (the results of vectorized evaluation) are not validated.
+        """
+        if new_value.__class__ is not LaneValues:
+            validator = self.validators[index]
+            unknown_mask = self.unknown_masks[index]
+            if new_value.__class__ is not tuple:
+                if validator is not None:
+                    new_value = validator(new_value, self.xnets[index].get_source())
+                if unknown_mask is None:
+                    new_value = (new_value, ) * self.lane_cnt
+                else:
+                    new_value = self.broadcast(index, new_value)
+            else:
+                if validator is not None:
+                    source = self.xnets[index].get_source()
+                    new_value = tuple(validator(lane_value, source) for lane_value in new_value)
+                if unknown_mask is not None:
+                    new_value = self.to_lane_values(index, new_value)
+        old_value = self.values[index]
+        if new_value.__class__ is LaneValues:
+            if not old_value.is_different(new_value):
+                return False
+        elif not any(map(_is_different, old_value, new_value)):
+            return False
+        if self.last_changed[index] != now:
+            self.previous_values[index] = old_value
+        self.values[index] = new_value
+        self.last_changed[index] = now
+        self.last_changed_delta[index] = delta
+        return True
+
+    def _get_vcd_value(self, index: int) -> Any:
+        value = self.values[index]
+        lane = self.sim_context.simulator.vcd_lane
+        if value.__class__ is LaneValues:
+            if value.x_mask[lane] == self.unknown_masks[index]:
+                # Fully unknown values are dumped the same way as in normal simulation
+                return None
+            return value.get_four_state_value(lane)
+        return value[lane]
+
+def _sample_lane(value: Any, reset: Any, reset_value: Any, clock_en: Any, in_value: Any) -> Any:
+    # The same as CycleSimulator._sample_regs, for a single lane
+    if reset == 1:
+        return reset_value
+    if clock_en == 1:
+        return in_value
+    return value
+
+class LaneSimulator(CycleSimulator):
+    class SimulatorContext(CycleSimulator.SimulatorContext):
+        def _create_state_store(self, xnets: Sequence[XNet]) -> SimStateStore:
+            return LaneStateStore(self, xnets)
+
+        def _get_lane_sim_function(self, module: 'Module') -> Optional[Tuple[Tuple[int], int, Callable]]:
+            """
+            Returns the input indices, the output index (into the state store) and the vectorized evaluation function
+            for modules that support get_lane_sim_function on XNets that hold LaneValues, None otherwise.
+            """
+            sim_function = module.get_lane_sim_function()
+            if sim_function is None:
+                return None
+            inputs, output, function = sim_function
+            if output.is_composite() or any(input.is_composite() for input in inputs):
+                return None
+            netlist = self.simulator.netlist
+            indices = tuple(netlist.get_xnet_for_junction(port).sim_index for port in (output, *inputs))
+            if any(self.state_store.unknown_masks[index] is None for index in indices):
+                return None
+            return indices[1:], indices[0], function
+
+        def _add_evaluator(self, module: 'Module') -> None:
+            store = self.state_store
+            values = store.values
+            lane_sim_function = self._get_lane_sim_function(module)
+            if lane_sim_function is not None:
+                input_indices, output_index, function = lane_sim_function
+                def evaluate() -> None:
+                    value, x_mask = function(*(values[index] for index in input_indices))
+                    # Comparisons return boolean arrays
+                    store.set_value(output_index, LaneValues(value.astype(np.int64, copy=False), x_mask.astype(np.int64, copy=False)), self.now, 0)
+                self.evaluators.append(evaluate)
+                return
+            sim_function = self._get_sim_function(module)
+            if sim_function is None:
+                if self._start_simulate(module) is not None:
+                    raise SimulationException(f"Module doesn't support multi-lane simulation. It needs to implement get_sim_function on non-composite ports", module._impl)
+                # One-shot modules (constants for instance) are done at this point
+                return
+            # Fall back to evaluating the sim function lane-by-lane
+            input_indices, output_xnet, function = sim_function
+            output_index = output_xnet.sim_index
+            get_lane_tuple = store.get_lane_tuple
+            def evaluate() -> None:
+                store.set_value(output_index, tuple(map(function, *(get_lane_tuple(index) for index in input_indices))), self.now, 0)
+            self.evaluators.append(evaluate)
+
+        def _sample_regs(self, regs: Sequence[Tuple[int, ...]]) -> Generator[Tuple[int, Any], None, None]:
+            store = self.state_store
+            values = store.values
+            for out_index, in_index, reset_index, reset_value_index, reset_value, clock_en_index in regs:
+                if store.unknown_masks[out_index] is None:
+                    yield out_index, self._sample_reg_lanes(out_index, in_index, reset_index, reset_value_index, reset_value, clock_en_index)
+                    continue
+                in_lanes = values[in_index]
+                value = in_lanes.value
+                x_mask = in_lanes.x_mask
+                if clock_en_index is not None:
+                    enabled = _is_one(values[clock_en_index])
+                    out_lanes = values[out_index]
+                    value = np.where(enabled, value, out_lanes.value)
+                    x_mask = np.where(enabled, x_mask, out_lanes.x_mask)
+                if reset_index is not None:
+                    in_reset = _is_one(values[reset_index])
+                    if reset_value_index is None:
+                        reset_lanes = store.broadcast(out_index, reset_value)
+                    else:
+                        reset_lanes = values[reset_value_index]
+                        if reset_lanes.__class__ is not LaneValues:
+                            reset_lanes = store.to_lane_values(out_index, reset_lanes)
+                    value = np.where(in_reset, reset_lanes.value, value)
+                    x_mask = np.where(in_reset, reset_lanes.x_mask, x_mask)
+                # The output of the register has the same type as its input: no need to validate the new value
+                yield out_index, LaneValues(value, x_mask)
+
+        def _sample_reg_lanes(self, out_index: int, in_index: int, reset_index: Optional[int], reset_value_index: Optional[int], reset_value: Any, clock_en_index: Optional[int]) -> Tuple[Any, ...]:
+            """
+            Samples a register lane-by-lane, for XNets that hold tuples
+            """
+            lane_cnt = self.simulator.lane_cnt
+            get_lane_tuple = self.state_store.get_lane_tuple
+            reset_lanes = get_lane_tuple(reset_index) if reset_index is not None else (None, ) * lane_cnt
+            clock_en_lanes = get_lane_tuple(clock_en_index) if clock_en_index is not None else (1, ) * lane_cnt
+            reset_value_lanes = get_lane_tuple(reset_value_index) if reset_value_index is not None else (reset_value, ) * lane_cnt
+            return tuple(map(_sample_lane, get_lane_tuple(out_index), reset_lanes, reset_value_lanes, clock_en_lanes, get_lane_tuple(in_index)))
+
+        def set_lanes(self, junction: 'Junction', values: Sequence[Any]) -> None:
+            """
+            Assigns a separate value to each lane of a net. Use None to mark a lane as unknown (X).
+            """
+            if len(values) != self.simulator.lane_cnt:
+                raise SimulationException(f"Expected {self.simulator.lane_cnt} lane values, got {len(values)}", junction)
+            if junction.is_composite():
+                raise SimulationException(f"Lane values can only be assigned to non-composite nets", junction)
+            net_type = junction.get_net_type()
+            xnet = self.simulator.netlist.get_xnet_for_junction(junction)
+            store = self.state_store
+            if store.unknown_masks[xnet.sim_index] is not None and all(value is None or value.__class__ is int for value in values):
+                # Integer stimulus goes straight into the lane arrays: the range of all lanes is checked at once
+                lane_values = store.to_lane_values(xnet.sim_index, values)
+                out_of_range = (lane_values.x_mask == 0) & ((lane_values.value < net_type.min_val) | (lane_values.value > net_type.max_val))
+                if out_of_range.any():
+                    lane = int(out_of_range.argmax())
+                    raise SimulationException(f"Can't assign the value '{values[lane]}' to lane {lane}. That value is outside of the representable range.", junction)
+            else:
+                lane_values = tuple(
+                    value.sim_value if hasattr(value, "sim_value") else adapt(value, net_type, implicit=False, force=False, allow_memberwise_adapt=False)
+                    for value in values
+                )
+            self.schedule_value_change(xnet, lane_values)
+
+    def __init__(self, netlist: Netlist, vcd_file: Optional[Union[IO,str]], timescale='1ns', *, lane_cnt: int, clock_period: int = 10, vcd_lane: int = 0):
+        super().__init__(netlist, vcd_file, timescale, clock_period=clock_period)
+        if lane_cnt < 1:
+            raise SimulationException(f"Lane count must be at least 1")
+        if vcd_lane < 0 or vcd_lane >= lane_cnt:
+            raise SimulationException(f"Waveform lane {vcd_lane} doesn't exist")
+        self.lane_cnt = lane_cnt
+        self.vcd_lane = vcd_lane # The lane to record in the waveform file
@@ -308,18 +308,19 @@ class _BasicMemory(GenericModule):
         )
 
 
+        # In two-state simulation, uninitialized content reads as 0
+        two_state = simulator.two_state
         def read_mem(addr: int, data_width: int) -> int:
             value = 0
             burst_size = data_width // content_width
             start_addr = addr * burst_size
             data_mask = (1 << content_width) - 1
             for burst_addr in range(start_addr + burst_size - 1, start_addr - 1, -1):
-                try:
-                    data_section = content[burst_addr]
-                except KeyError:
-                    return None
+                data_section = content.get(burst_addr, None)
                 if data_section is None:
-                    return None
+                    if not two_state:
+                        return None
+                    data_section = 0
                 value = (value << content_width) | (data_section & data_mask)
             return value
 
@@ -335,6 +336,12 @@ class _BasicMemory(GenericModule):
                 else:
                     content[burst_addr] = None
 
+        if two_state:
+            # Addresses start out as 0, not None, so there might never be an address change to trigger the first read
+            for port in self.mem_ports:
+                if port.has_read:
+                    port.data_out <<= read_mem(int(port.addr.sim_value), port.width)
+
         while True:
             yield trigger_ports
 
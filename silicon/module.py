@@ -5,14 +5,14 @@ import typing
 from collections import OrderedDict
 from .port import Junction, Port, Output, Input, Wire, JunctionBase, is_port, is_junction_base
 from .net_type import NetType, NetTypeMeta
-from .utils import is_junction, str_block, TSimEvent, ContextMarker, first, Context
+from .utils import is_junction, str_block, TSimEvent, StaticSensitivity, ContextMarker, first, Context
 from .tracer import Tracer
 from .netlist import Netlist
 from enum import Enum
 from .ordered_set import OrderedSet
 from .exceptions import SimulationException, SyntaxErrorException, InvalidPortError
 from threading import RLock
-from itertools import chain, zip_longest
+from itertools import chain, zip_longest, islice
 from .utils import is_input_port, is_output_port, is_wire, is_module, fill_arg_names, is_iterable, MEMBER_DELIMITER, first, implicit_adapt, convert_to_junction
 from .utils import ScopedAttr
 from .state_stack import StateStackElement
@@ -110,6 +110,13 @@ class Module(object):
     ignore_caller_libs= ["silicon"]
     ignore_callers = ["wrapper", "__init__"]
 
+    # Opt-in elaboration cache: set this to True on module classes, where the result of 'body' depends on nothing but
+    # the construct arguments and the types of the ports. The first instance for each combination of those is elaborated,
+    # all further instances get a copy of its guts instead of calling 'body' again. See Module.Impl.get_elaboration_key.
+    # NOTE: 'body' must not hold on to junctions of the module in any other way than attributes of the module or
+    #       its sub-modules (in closures for instance): those would not be copied.
+    cache_elaboration = False
+
     class Context(StateStackElement):
         def __init__(self, context: 'Module'):
             self.context = context
@@ -283,6 +290,43 @@ class Module(object):
         Apart from primitives, most test-bench modules will implement this method to drive stimulus and test resposnes.
         """
         pass
+    def get_sim_function(self) -> Optional[Tuple[Sequence['Junction'], 'Junction', Callable]]:
+        """
+        Optional fast-path for combinational modules with a single output.
+
+        Returns a tuple of (input ports, output port, function), where 'function' takes the simulation
+        values of the input ports (in the same order) and returns the value to be assigned to the output port.
+        The function must not have side-effects: it is used by the simulator to compile whole combinational
+        cones into a single evaluation function, in which case the 'simulate' method is not called at all.
+
+        In four-state simulation, the function only gets partially unknown (XValue) input values if the
+        class of the module sets 'four_state_aware' to True. Otherwise such inputs are passed in as None.
+
+        Default implementation returns None, meaning that the module doesn't support compiled simulation.
+        """
+        return None
+    def get_two_state_sim_function(self) -> Optional[Tuple[Sequence['Junction'], 'Junction', Callable]]:
+        """
+        The same as get_sim_function, but used in two-state simulation. The function never gets None inputs
+        and can skip all the checks for unknown values.
+
+        Default implementation returns whatever get_sim_function returns.
+        """
+        return self.get_sim_function()
+    def get_lane_sim_function(self) -> Optional[Tuple[Sequence['Junction'], 'Junction', Callable]]:
+        """
+        The same as get_sim_function, but used in multi-lane simulation (see lane_simulator.py), where
+        'function' evaluates all lanes at once. For every input it gets an object with a 'value' and
+        an 'x_mask' attribute: NumPy integer arrays of the known and the unknown bits of every lane (the
+        same encoding as XValue uses, see four_state.py). It returns a tuple of two such arrays for the output.
+
+        Only used if all the ports are integer nets that fit in the arrays. The function doesn't need to
+        check the range of the results: they are assumed to fit into the type of the output port.
+
+        Default implementation returns None, in which case the function returned by get_sim_function
+        is called for every lane separately.
+        """
+        return None
     def is_combinational(self) -> bool:
         """
         Returns True if the module is purely combinational, False otherwise
@@ -638,6 +682,17 @@ class Module(object):
                 #show_callers_locals()
             Context.register(self._context_change)
 
+        def __getstate__(self) -> Dict[str, Any]:
+            # Used when a netlist is stored (see elaboration_cache.py)
+            state = self.__dict__.copy()
+            del state["supersetattr"] # Bound to the super() of our module, which can't be stored
+            return state
+
+        def __setstate__(self, state: Dict[str, Any]) -> None:
+            self.__dict__.update(state)
+            self.supersetattr = super(Module, self._true_module).__setattr__
+            Context.register(self._context_change)
+
         def _context_change(self, context: Context) -> None:
             # Called by Context every time there's a change in context
             if context == Context.construction:
@@ -1032,33 +1087,52 @@ class Module(object):
                         from .constant import NoneNetType
                         input_port.set_net_type(NoneNetType)
 
-            with ScopedAttr(self, "setattr__impl", self._setattr__elaboration):
-                with self.netlist.set_current_scope(self._true_module):
-                    with Module.Context(self):
-                        self.call_and_trace(trace, self._true_module.body)
-                    # Finish ordering sub-modules:
-                    for sub_module in self._unordered_sub_modules:
-                        self._sub_modules.append(sub_module)
-                    del self._unordered_sub_modules # This will force all subsequent module instantiations (during type-propagation) to directly go to _sub_modules
-
-                    # Go through each junction and make resolve their sources if needed
-                    #   This is where we create PhiSlice objects for partial assignments for instance.
-                    for junction in self.get_junctions():
-                        junction.resolve_multiple_sources(self._true_module)
-
-            for sub_module in self._sub_modules:
-                # handle any pending auto-binds
-                for port in sub_module.get_ports().values():
-                    if port._auto:
-                        port.auto_bind(self._true_module) # If already bound, this is a no-op, so it's safe to call it multiple times
+            # See if we can get away with copying an already elaborated instance
+            template = False
+            elaboration_key = None
+            if self._true_module.cache_elaboration and not self.is_top_level():
+                elaboration_key = self.get_elaboration_key()
+            if elaboration_key is not None:
+                with ScopedAttr(NetTypeMeta, "eq_is_is", True):
+                    template = self.netlist.elaboration_templates.get(elaboration_key, False)
+                if template is None:
+                    # An earlier instance turned out to be unsuitable as a template
+                    elaboration_key = None
+                elif not template:
+                    first_module_idx = len(self.netlist.modules)
+                    symbols_before = self.netlist.symbol_table[self._true_module].get_symbols()
+
+            if template:
+                # This includes the sub-modules: they are copied already elaborated
+                self._clone_elaboration(*template)
+            else:
+                with ScopedAttr(self, "setattr__impl", self._setattr__elaboration):
+                    with self.netlist.set_current_scope(self._true_module):
+                        with Module.Context(self):
+                            self.call_and_trace(trace, self._true_module.body)
+                        # Finish ordering sub-modules:
+                        for sub_module in self._unordered_sub_modules:
+                            self._sub_modules.append(sub_module)
+                        del self._unordered_sub_modules # This will force all subsequent module instantiations (during type-propagation) to directly go to _sub_modules
+
+                        # Go through each junction and make resolve their sources if needed
+                        #   This is where we create PhiSlice objects for partial assignments for instance.
+                        for junction in self.get_junctions():
+                            junction.resolve_multiple_sources(self._true_module)
 
-            remaining_local_wires = dict()
-            for wire in self._local_wires.values():
-                if not wire.has_sinks() and not wire.has_source():
-                    print(f"WARNING: deleting unused local wire: {wire}")
-                else:
-                    remaining_local_wires[id(wire)] = wire
-            self._local_wires = remaining_local_wires
+                for sub_module in self._sub_modules:
+                    # handle any pending auto-binds
+                    for port in sub_module.get_ports().values():
+                        if port._auto:
+                            port.auto_bind(self._true_module) # If already bound, this is a no-op, so it's safe to call it multiple times
+
+                remaining_local_wires = dict()
+                for wire in self._local_wires.values():
+                    if not wire.has_sinks() and not wire.has_source():
+                        print(f"WARNING: deleting unused local wire: {wire}")
+                    else:
+                        remaining_local_wires[id(wire)] = wire
+                self._local_wires = remaining_local_wires
 
             # Go through each sub-module in a loop, and finalize their interface until everything every Input port type is known
 
@@ -1078,9 +1152,14 @@ class Module(object):
                     rhs_name, precedence = self.input_port.get_rhs_expression(back_end, target_namespace, self.output_port.get_net_type())
                     return rhs_name, precedence
                 def simulate(self) -> TSimEvent:
+                    sensitivity = StaticSensitivity(self.input_port)
                     while True:
-                        yield self.input_port
+                        yield sensitivity
                         self.output_port <<= self.input_port.sim_value
+                def get_sim_function(self) -> Optional[Tuple[Sequence['Junction'], 'Junction', Callable]]:
+                    return (self.input_port, ), self.output_port, lambda in_val: in_val
+                def get_lane_sim_function(self) -> Optional[Tuple[Sequence['Junction'], 'Junction', Callable]]:
+                    return (self.input_port, ), self.output_port, lambda in_lanes: (in_lanes.value, in_lanes.x_mask)
                 def is_combinational(self) -> bool:
                     """
                     Returns True if the module is purely combinational, False otherwise
@@ -1387,7 +1466,7 @@ class Module(object):
 
 
             with self.netlist.set_current_scope(self._true_module):
-                incomplete_sub_modules = OrderedSet(self._sub_modules)
+                incomplete_sub_modules = OrderedSet(self._sub_modules if not template else ())
                 changes = True
                 while len(incomplete_sub_modules) > 0 and changes:
                     # Propagate types around on this hierarchy level until we can't do anything more.
@@ -1430,6 +1509,185 @@ class Module(object):
                     raise SyntaxErrorException(f"Output port {output} is not fully specialized after body call. Can't finalize interface")
             assert all((output.is_specialized() or not output.has_source()) for output in self.get_output_ports(recursive=True))
 
+            if elaboration_key is not None and not template:
+                # All the modules registered since the call to 'body': the ones within our hierarchy, and the adaptors that
+                # type propagation inserted in front of our inputs (the same happens for the copies)
+                template_modules = tuple(module for module in islice(self.netlist.modules, first_module_idx, None) if module._impl.parent is not self.parent)
+                # Symbols that 'body' (and the rest of elaboration) added to or removed from our scope
+                symbols_after = self.netlist.symbol_table[self._true_module].get_symbols()
+                before_ids = set((kind, name, id(obj)) for kind, name, obj in symbols_before)
+                after_ids = set((kind, name, id(obj)) for kind, name, obj in symbols_after)
+                symbol_changes = (
+                    tuple((kind, name, obj) for kind, name, obj in symbols_before if (kind, name, id(obj)) not in after_ids),
+                    tuple((kind, name, obj) for kind, name, obj in symbols_after if (kind, name, id(obj)) not in before_ids),
+                )
+                template = None
+                if self._is_self_contained(template_modules, *symbol_changes):
+                    template = (self._true_module, template_modules, symbol_changes)
+                with ScopedAttr(NetTypeMeta, "eq_is_is", True):
+                    self.netlist.elaboration_templates[elaboration_key] = template
+
+        def get_elaboration_key(self) -> Optional[Tuple]:
+            """
+            Returns the key under which the elaborated guts of the module are cached (see Module.cache_elaboration):
+            the class, the construct arguments and the interface of the module.
+
+            Returns None if the construct arguments can't be compared by value. That is, if they are not hashable
+            or refer to junctions or modules.
+            """
+            def canonical_arg(arg: Any) -> Any:
+                if is_junction_base(arg) or is_module(arg):
+                    raise TypeError
+                # Containers are compared by content, everything else by type and value (so 1 and True are different)
+                if isinstance(arg, (tuple, list)):
+                    return (type(arg), tuple(canonical_arg(item) for item in arg))
+                if isinstance(arg, dict):
+                    return (type(arg), frozenset((canonical_arg(key), canonical_arg(value)) for key, value in arg.items()))
+                hash(arg)
+                return (type(arg), arg)
+
+            def port_key(port_name: str, port: Port) -> Tuple:
+                # Net types are compared by identity
+                return (port_name, port.get_junction_type(), port.get_net_type(), port.is_deleted(), is_input_port(port) and port.has_driver())
+
+            try:
+                return (
+                    type(self._true_module),
+                    tuple(canonical_arg(arg) for arg in self._construct_args),
+                    frozenset((arg_name, canonical_arg(arg)) for arg_name, arg in self._construct_kwargs.items()),
+                    tuple(port_key(port_name, port) for port_name, port in self._true_module.get_ports().items()),
+                )
+            except TypeError:
+                return None
+
+        def _is_self_contained(self, modules: Sequence['Module'], removed_symbols: Sequence[Tuple], added_symbols: Sequence[Tuple]) -> bool:
+            """
+            Returns True if the elaborated guts of the module can serve as a template for other instances: 'modules' (all
+            the modules registered during elaboration) are all within our hierarchy and nothing within refers to the outside.
+
+            'removed_symbols' and 'added_symbols' are the changes elaboration made to our own scope table.
+            """
+            scopes = set(id(module) for module in modules)
+            scopes.add(id(self._true_module))
+            if any(id(module._impl.parent) not in scopes for module in modules):
+                return False
+
+            def is_internal(obj: object) -> bool:
+                if is_module(obj):
+                    return id(obj) in scopes and obj is not self._true_module
+                if is_junction_base(obj):
+                    return id(obj.get_parent_module()) in scopes
+                return True
+
+            own_ports = set(id(junction) for port in self.get_ports().values() for junction in port.get_all_member_junctions(add_self=True))
+            junctions = chain(self.get_junctions(recursive=True), *(module._impl.get_junctions(recursive=True) for module in modules))
+            for junction in junctions:
+                # Our ports connect to the outside, of course, but only through edges in the scope of our parent
+                for _, source_edge in junction._partial_sources:
+                    if id(source_edge.scope) in scopes or id(junction) not in own_ports:
+                        if id(source_edge.scope) not in scopes or not is_internal(source_edge.far_end):
+                            return False
+                for sink, scope in junction._sinks.items():
+                    if id(scope) in scopes or id(junction) not in own_ports:
+                        if id(scope) not in scopes or not is_internal(sink):
+                            return False
+
+            # Our scope table can contain symbols from our parent (created before elaboration), only the changes get copied.
+            # Those can only remove symbols of our ports.
+            if any(id(obj) not in own_ports for _, _, obj in removed_symbols):
+                return False
+            if not all(is_internal(obj) for _, _, obj in added_symbols):
+                return False
+            symbol_table = self.netlist.symbol_table
+            for module in modules:
+                if not all(is_internal(obj) for _, _, obj in symbol_table[module].get_symbols()):
+                    return False
+            return True
+
+        def _clone_elaboration(self, template: 'Module', template_modules: Sequence['Module'], symbol_changes: Tuple[Sequence[Tuple], Sequence[Tuple]]) -> None:
+            """
+            Instead of calling 'body', sets up the guts of the module as a copy of those of 'template': an already elaborated
+            instance with the same elaboration key.
+
+            'template_modules' contains all the modules within 'template' (sub-modules, their sub-modules, etc.) in the order
+            they were registered with the netlist. 'symbol_changes' contains the symbols elaboration removed from and added
+            to the scope table of 'template'.
+            """
+            from copy import deepcopy
+            from .sym_table import ScopeTable
+
+            template_impl = template._impl
+            # Everything the guts of 'template' refer to, but are not part of them map to our own objects
+            memo = {
+                id(self.netlist): self.netlist,
+                id(ScopeTable.reserved): ScopeTable.reserved,
+                id(template): self._true_module,
+                id(template_impl): self,
+                id(template_impl.parent): self.parent,
+            }
+            # Outputs get their net types during elaboration. Composites create their members when that happens, so set those up first.
+            for port_name, port in self.get_outputs().items():
+                template_port = template_impl.get_outputs()[port_name]
+                if not port.is_specialized() and template_port.is_specialized():
+                    port.set_net_type(template_port.get_net_type())
+            port_pairs = []
+            for port_name, port in self.get_ports().items():
+                template_port = template_impl.get_ports()[port_name]
+                for template_junction, junction in zip_longest(template_port.get_all_member_junctions(add_self=True), port.get_all_member_junctions(add_self=True)):
+                    assert template_junction is not None and junction is not None
+                    port_pairs.append((template_junction, junction))
+                    memo[id(template_junction)] = junction
+            # Modules are not copied by deepcopy: create empty ones to fill in below
+            for template_module in template_modules:
+                module = object.__new__(type(template_module))
+                memo[id(template_module)] = module
+                memo[id(template_module._impl)] = object.__new__(type(template_module._impl))
+                memo[id(template_module._impl.supersetattr)] = super(Module, module).__setattr__
+            copied_ids = set(memo.keys())
+
+            for template_module in template_modules:
+                module = memo[id(template_module)]
+                module.__dict__.update(deepcopy(template_module.__dict__, memo))
+                module._impl.__dict__.update(deepcopy(template_module._impl.__dict__, memo))
+                module._impl._local_wires = {id(wire): wire for wire in module._impl._local_wires.values()}
+            # Attributes created by 'body'
+            for attr_name, attr_value in template.__dict__.items():
+                if attr_name not in self._true_module.__dict__:
+                    self.supersetattr(attr_name, deepcopy(attr_value, memo))
+            self._sub_modules = deepcopy(template_impl._sub_modules, memo)
+            del self._unordered_sub_modules
+            self._wires = deepcopy(template_impl._wires, memo)
+            self._junctions = deepcopy(template_impl._junctions, memo)
+            self._local_wires = {id(wire): wire for wire in deepcopy(tuple(template_impl._local_wires.values()), memo)}
+            # Connections of our ports to the inside
+            scopes = set(id(module) for module in template_modules)
+            scopes.add(id(template))
+            for template_junction, junction in port_pairs:
+                for key, source_edge in template_junction._partial_sources:
+                    if id(source_edge.scope) in scopes:
+                        junction._partial_sources.append(deepcopy((key, source_edge), memo))
+                for sink, scope in template_junction._sinks.items():
+                    if id(scope) in scopes:
+                        junction._sinks[deepcopy(sink, memo)] = deepcopy(scope, memo)
+
+            symbol_table = self.netlist.symbol_table
+            scope_table = symbol_table[self._true_module]
+            removed_symbols, added_symbols = symbol_changes
+            for kind, name, obj in removed_symbols:
+                scope_table.del_symbol(kind, name, memo[id(obj)])
+            for kind, name, obj in added_symbols:
+                scope_table.add_symbol(kind, name, deepcopy(obj, memo))
+            for template_module in template_modules:
+                symbol_table.scopes[memo[id(template_module)]] = deepcopy(symbol_table[template_module], memo)
+
+            for template_module in template_modules:
+                module = memo[id(template_module)]
+                self.netlist.modules.add(module)
+                Context.register(module._impl._context_change)
+            for obj_id, obj in memo.items():
+                if obj_id not in copied_ids and is_junction_base(obj):
+                    Context.register(obj._context_change)
+
         def is_top_level(self) -> bool:
             return self.netlist.top_level is self._true_module
 
@@ -1516,6 +1774,36 @@ class Module(object):
 
             return True
 
+        def get_structural_hash(self, netlist: 'Netlist') -> int:
+            """
+            Returns a hash of everything is_equivalent compares: modules that are equivalent have the same
+            hash, so variants can be looked up by hash, with is_equivalent only confirming the match.
+
+            NOTE: just as is_equivalent, this is called in inverse hierarchy order, so all sub-modules
+                  already have their module class name. If is_equivalent is customized, this method
+                  needs to be customized as well (or return a constant).
+            """
+            def junction_key(junction_name: str, junction: 'Junction') -> Tuple:
+                # Net types are compared by identity
+                is_specialized = junction.is_specialized()
+                return (junction_name, type(junction.get_underlying_junction()), is_specialized, id(junction.get_net_type()) if is_specialized else None)
+
+            def arg_hash(arg: Any) -> int:
+                try:
+                    return hash(arg)
+                except TypeError:
+                    # Unhashable arguments don't contribute: is_equivalent compares them
+                    return 0
+
+            return hash((
+                tuple(junction_key(port_name, port) for port_name, port in self._true_module.get_ports().items()),
+                tuple(junction_key(wire_name, wire) for wire_name, wire in self._true_module.get_wires().items()),
+                tuple(netlist.get_module_class_name(sub_module) for sub_module in self._sub_modules),
+                tuple(arg_hash(arg) for arg in self._construct_args),
+                # Keyword arguments are compared by name, irrespective of their order
+                frozenset((arg_name, arg_hash(arg)) for arg_name, arg in self._construct_kwargs.items()),
+            ))
+
 
         def generate_module_header(self, back_end: 'BackEnd') -> str:
             ret_val = ""
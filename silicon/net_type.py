@@ -2,6 +2,7 @@ from abc import abstractmethod
 from typing import Optional, Any, Sequence, Union
 from .exceptions import AdaptTypeError, SyntaxErrorException
 from enum import Enum as PyEnum
+from functools import partial
 
 class KeyKind(PyEnum):
     Index = 0
@@ -30,6 +31,9 @@ class NetTypeFactory(object):
 
     If the 'net_type' parameter is not specified during subclassing, an additional
     class property, called net_type needs to be defines as well.
+
+    The created NetTypes remember the call that created them in '_type_factory': they can't be
+    found by name, so this is how they are re-created when a stored netlist is loaded (see elaboration_cache.py).
     """
     def __init_subclass__(cls, /, net_type: Optional['NetTypeMeta'] = None) -> None:
         if net_type is not None:
@@ -42,6 +46,7 @@ class NetTypeFactory(object):
         except KeyError:
             obj = type(str(name), (cls.net_type, ), {})
             cls.construct(obj, *args, **kwargs)
+            obj._type_factory = (partial(cls, *args, **kwargs), ())
             cls.instances[key] = obj
             return obj
     @classmethod
@@ -78,11 +83,16 @@ class __FakeInit(object):
     def __init__(self, *args, **kwargs):
         pass
 
+def _suppressed_init_type(cls: type) -> type:
+    suppressed_type = type(cls.__name__, (__FakeInit, cls, ), {})
+    suppressed_type._type_factory = (_suppressed_init_type, (cls, ))
+    return suppressed_type
+
 def suppress_init(obj: object) -> object:
     """
     Replaces the __init__ method on the object with one that does nothing
     """
-    obj.__class__ = type(obj.__class__.__name__, (__FakeInit, obj.__class__, ), {})
+    obj.__class__ = _suppressed_init_type(obj.__class__)
     return obj
 
 class NetType(object, metaclass=NetTypeMeta):
@@ -1,5 +1,6 @@
 from typing import Union, Set, Tuple, Dict, Any, Optional, List, Iterable, NamedTuple, Sequence, Callable, Generator
 import typing
+import sys
 from .ordered_set import OrderedSet
 from collections import OrderedDict
 from .port import is_port
@@ -7,7 +8,9 @@ from .port import Junction
 from .utils import is_input_port, is_output_port, is_wire, is_module, MEMBER_DELIMITER, ContextMarker, Context
 from .utils import vprint, verbose_enough, VerbosityLevels, profile
 from itertools import chain
-from .exceptions import SyntaxErrorException
+from timeit import default_timer
+import threading
+from .exceptions import SyntaxErrorException, SimulationException
 from .stack import Stack
 from pathlib import Path
 from .sym_table import SymbolTable
@@ -38,8 +41,9 @@ class XNet(object):
             self.is_used = is_used
             self.is_input = is_input
 
-    def __init__(self):
+    def __init__(self, netlist: 'Netlist'):
         from .port import Port, Wire
+        self.netlist = netlist
         self._source: Junction = None
         self._sinks: Set[Port] = OrderedSet()
         self._transitions: Set[Port] = OrderedSet()
@@ -47,6 +51,7 @@ class XNet(object):
         self.scoped_names: Dict['Module', Dict[str, 'XNet.NameStatus']] = OrderedDict()
         self.rhs_expressions: Dict['Module', Tuple[str, int]] = OrderedDict()
         self.assigned_names: Dict['Module', str] = OrderedDict()
+        self.sim_index: Optional[int] = None # Index of the simulation state in 'sim_store'. The same for all simulations of the netlist
 
     def add_source(self, junction: 'Junction') -> None:
         assert self._source is None
@@ -263,9 +268,31 @@ class XNet(object):
             return alias.get_net_type()
         assert False
 
+    class _SimStoreLookup(object):
+        """
+        Returns the state store of the simulation running on the netlist in the current thread.
+
+        This is a non-data descriptor, so it's only used if the XNet doesn't have a 'sim_store' attribute of
+        its own. While there's a single simulation running on the netlist, every XNet has one, pointing to the
+        state store of that simulation: reading simulated values is as fast as it can be. If there are more,
+        the attributes are removed and the store is looked up for every access (see Netlist._update_sim_stores).
+        """
+        def __get__(self, xnet: Optional['XNet'], owner: type = None) -> Any:
+            if xnet is None:
+                return self
+            return xnet.netlist._sim_local.context.state_store
+
+    sim_store = _SimStoreLookup()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The state store of the last simulation is not part of a stored netlist
+        state = self.__dict__.copy()
+        state.pop("sim_store", None)
+        return state
+
     @property
     def sim_value(self) -> Any:
-        return self.sim_state.value
+        return self.sim_store.values[self.sim_index]
 
     def get_num_bits(self) -> int:
         return self.get_net_type().get_num_bits()
@@ -276,7 +303,9 @@ class Netlist(object):
         self.modules: Set['Module'] = OrderedSet()
         self.net_types: Dict[str, List['NetType']]= OrderedDict()
         self.ports: Set[object] = OrderedSet()
-        self.simulator_context: Optional['Simulator.SimulatorContext'] = None
+        self._sim_local = Netlist._SimLocal() # The active simulation of the netlist, separately for every thread (see simulator_context)
+        self._running_simulations: List['Simulator.SimulatorContext'] = [] # In all threads
+        self._simulation_lock = threading.Lock()
         self.module_variants: Optional[Dict[str, Dict[str, List['Module']]]] = None
         self.module_to_class_map: Optional[Dict['Module', str]] = None
         self.module_class_short_name_map: Dict[str, str] = OrderedDict() # Maps short names to their fully qualified names
@@ -288,6 +317,51 @@ class Netlist(object):
         self.symbol_table = SymbolTable()
         self.rank_list = None
         self.rank_map = None
+        self._signal_index: Optional['SignalIndex'] = None
+        self.phase_times: Dict[str, float] = OrderedDict() # Seconds spent in each phase of elaboration
+        self.elaboration_templates: Dict[Tuple, Optional[Tuple['Module', Sequence['Module']]]] = {} # Elaborated instances, by elaboration key (see Module.cache_elaboration)
+
+    class _SimLocal(threading.local):
+        context: Optional['Simulator.SimulatorContext'] = None
+
+    @property
+    def simulator_context(self) -> Optional['Simulator.SimulatorContext']:
+        """
+        The simulation running on the netlist in the current thread, or None.
+
+        The netlist itself is not changed by simulations, all simulation state is kept by the simulator context.
+        So any number of simulations can run on a netlist, one after the other, nested or in separate threads.
+        """
+        return self._sim_local.context
+
+    @simulator_context.setter
+    def simulator_context(self, sim_context: Optional['Simulator.SimulatorContext']) -> None:
+        self._sim_local.context = sim_context
+
+    def _add_simulation(self, sim_context: 'Simulator.SimulatorContext') -> None:
+        """
+        Called by the simulator once the state store of 'sim_context' is set up
+        """
+        with self._simulation_lock:
+            self._running_simulations.append(sim_context)
+            self._update_sim_stores()
+
+    def _remove_simulation(self, sim_context: 'Simulator.SimulatorContext') -> None:
+        with self._simulation_lock:
+            if sim_context not in self._running_simulations:
+                return # Setup failed before the simulation got added
+            self._running_simulations.remove(sim_context)
+            self._update_sim_stores()
+
+    def _update_sim_stores(self) -> None:
+        if len(self._running_simulations) == 1:
+            state_store = self._running_simulations[0].state_store
+            for xnet in self.xnets:
+                xnet.sim_store = state_store
+        elif len(self._running_simulations) > 1:
+            # Fall back to XNet._SimStoreLookup
+            for xnet in self.xnets:
+                xnet.__dict__.pop("sim_store", None)
 
     @staticmethod
     def get_global_netlist() -> 'Netlist':
@@ -326,29 +400,26 @@ class Netlist(object):
             del globals()["netlist"]
         self.enter_depth -= 1
 
-    #def __getstate__(self):
-    #    state = self.__dict__.copy()
-    #    del state["top_level"]
-    #    del state["modules"]
-    #    del state["net_types"]
-    #    del state["ports"]
-    #    del state["simulator_context"]
-    #    del state["module_variants"]
-    #    del state["module_to_class_map"]
-    #    del state["module_class_short_name_map"]
-    #    del state["xnets"]
-    #    del state["junction_to_xnet_map"]
-    #    del state["module_to_xnet_map"]
-    #    del state["_parent_modules"]
-    #    del state["enter_depth"]
-    #    del state["symbol_table"]
-    #    del state["rank_list"]
-    #    del state["rank_map"]
-    #    return state
-    #
-    #def __setstate__(self, state):
-    #    self.__dict__.update(state)
-    #    # TODO: restore everything...
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Used to store elaborated netlists (see elaboration_cache.py). Simulations are not part of the stored state.
+        """
+        if len(self._running_simulations) > 0:
+            raise SimulationException(f"Can't store a netlist while it's being simulated")
+        state = self.__dict__.copy()
+        del state["_sim_local"]
+        del state["_running_simulations"]
+        del state["_simulation_lock"]
+        del state["_parent_modules"] # Only used during elaboration
+        state["_signal_index"] = None # Re-created on first use
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._sim_local = Netlist._SimLocal()
+        self._running_simulations = []
+        self._simulation_lock = threading.Lock()
+        self._parent_modules = Stack()
 
     def _register_net_type(self, net_type: 'NetType'):
         type_name = net_type.get_type_name()
@@ -388,25 +459,31 @@ class Netlist(object):
                     # Only create XNets for things that source something. Sinks will get added to existing XNets once the source is identified.
                     return []
                 else:
-                    x_net = XNet()
-
-                    def trace_x_net(current_junction: Junction):
-                        for sink in current_junction.get_sinks():
-                            if is_wire(sink):
-                                x_net.add_alias(sink)
-                            else:
-                                if not sink.has_sinks():
-                                    # No sinks of this junction: this is a terminal node.
-                                    x_net.add_sink(sink)
-                                else:
-                                    x_net.add_transition(sink)
-                            self.junction_to_xnet_map[sink] = x_net
-                            sink._xnet = x_net
-                            trace_x_net(sink)
-
-                    self.junction_to_xnet_map[for_junction] = x_net
+                    x_net = XNet(self)
+                    junction_to_xnet_map = self.junction_to_xnet_map
+                    junction_to_xnet_map[for_junction] = x_net
                     for_junction._xnet = x_net
-                    trace_x_net(for_junction)
+
+                    # Depth-first walk over everything driven by 'for_junction', through any number of wires and
+                    # hierarchy levels. An explicit stack (of sink iterators) is used, so there's no limit on the depth.
+                    sink_iters = [iter(for_junction.get_sinks())]
+                    while len(sink_iters) > 0:
+                        sink = next(sink_iters[-1], None)
+                        if sink is None:
+                            sink_iters.pop()
+                            continue
+                        sinks = sink.get_sinks()
+                        if is_wire(sink):
+                            x_net.add_alias(sink)
+                        elif len(sinks) == 0:
+                            # No sinks of this junction: this is a terminal node.
+                            x_net.add_sink(sink)
+                        else:
+                            x_net.add_transition(sink)
+                        junction_to_xnet_map[sink] = x_net
+                        sink._xnet = x_net
+                        if len(sinks) > 0:
+                            sink_iters.append(iter(sinks))
 
                     if x_net.num_junctions(include_source=True) == 0:
                         # XNet contains only this single junction --> Determine if it's a source-only XNet or a source-less one
@@ -461,20 +538,15 @@ class Netlist(object):
         Creates a DAG from the netlist (by forcing all non-combinational modules into rank 0)
         Arranges every module by rank in the DAG and returns the DAG
 
+        The rank of a combinational module is one more than the highest rank of the modules driving it.
+        Modules are ranked by a depth-first traversal of their drivers, using an explicit stack, so there's
+        no limit on the depth of combinational logic. Every module and every driver edge is visited once.
+
         NOTE: this can only be called after _create_xnets was called
         """
         from .module import Module
         rank_map: Dict[Module, int] = OrderedDict()
         rank_list: List[Set[Module]] = []
-        xnet_trace: List[XNet] = []
-
-        def get_sourced_xnets(module: Module) -> Set[XNet]:
-            xnets = OrderedSet()
-            for port in module.get_ports().values():
-                xnet = self.junction_to_xnet_map[port]
-                if xnet.is_source(port):
-                    xnets.add(xnet)
-            return xnets
 
         def get_sinked_xnets(module: Module) -> Set[XNet]:
             xnets = OrderedSet()
@@ -487,50 +559,80 @@ class Netlist(object):
                         xnets.add(xnet)
             return xnets
 
-        def _rank_module(module: Module, xnet: Optional[XNet] = None, iter_level: int = 0) -> int:
-            assert module is not None
-            if xnet is not None:
-                xnet_trace.append(xnet)
-            assert iter_level < 100
-            if module in rank_map:
-                if xnet is not None: xnet_trace.pop()
-                return rank_map[module]
-            # Check for loops (i.e. if graph truly is a DAG)
-            if module in visited_modules:
-                def xnet_trace_names():
-                    return "\n    ".join(xnet.get_diagnostic_name(self) for xnet in xnet_trace)
-                raise SyntaxErrorException(f"Combinational loop found:\n    {xnet_trace_names()}")
-            visited_modules.add(module)
+        def get_source_modules(module: Module) -> Tuple[Tuple[Module, XNet], ...]:
+            """
+            Returns the modules driving 'module', each with the XNet it's driven through
+            """
             if not module.is_combinational():
-                rank = 0
-            else:
-                source_xnets = get_sinked_xnets(module)
-                if len(source_xnets) == 0:
-                    rank = 0
-                else:
-                    sources = OrderedSet((source_xnet.get_source(), source_xnet) for source_xnet in source_xnets if source_xnet.get_source() is not None)
-                    source_modules = OrderedSet((source[0].get_parent_module(), source[1]) for source in sources if source[0].get_parent_module() is not None)
-                    if len(source_modules) == 0:
-                        rank = 0
-                    else:
-                        assert None not in source_modules
-                        rank = max(_rank_module(source_module[0], source_module[1], iter_level + 1) + 1 for source_module in source_modules)
+                return ()
+            source_modules = []
+            for source_xnet in get_sinked_xnets(module):
+                source = source_xnet.get_source()
+                if source is None:
+                    continue
+                source_module = source.get_parent_module()
+                if source_module is not None:
+                    source_modules.append((source_module, source_xnet))
+            return tuple(source_modules)
+
+        def add_to_rank(module: Module, rank: int) -> None:
             rank_map[module] = rank
             while len(rank_list) <= rank:
                 rank_list.append(OrderedSet())
             rank_list[rank].add(module)
-            if xnet is not None: xnet_trace.pop()
-            visited_modules.remove(module)
-            return rank
+
+        # Indices into the stack frames
+        MODULE = 0
+        XNET = 1 # The XNet through which the module was reached (None for the root)
+        SOURCES = 2
+        NEXT_SOURCE = 3
+        RANK = 4 # The rank based on the sources visited so far
+
+        def rank_module(root: Module) -> None:
+            stack = [[root, None, get_source_modules(root), 0, 0]]
+            modules_on_stack = {root}
+            while len(stack) > 0:
+                frame = stack[-1]
+                source_modules = frame[SOURCES]
+                if frame[NEXT_SOURCE] < len(source_modules):
+                    source_module, xnet = source_modules[frame[NEXT_SOURCE]]
+                    frame[NEXT_SOURCE] += 1
+                    source_rank = rank_map.get(source_module, None)
+                    if source_rank is not None:
+                        frame[RANK] = max(frame[RANK], source_rank + 1)
+                        continue
+                    # Check for loops (i.e. if graph truly is a DAG)
+                    if source_module in modules_on_stack:
+                        xnet_trace = [frame[XNET] for frame in stack[1:]] + [xnet]
+                        def xnet_trace_names():
+                            return "\n    ".join(xnet.get_diagnostic_name(self) for xnet in xnet_trace)
+                        raise SyntaxErrorException(f"Combinational loop found:\n    {xnet_trace_names()}")
+                    stack.append([source_module, xnet, get_source_modules(source_module), 0, 0])
+                    modules_on_stack.add(source_module)
+                    continue
+                # All sources are ranked
+                stack.pop()
+                modules_on_stack.remove(frame[MODULE])
+                rank = frame[RANK]
+                add_to_rank(frame[MODULE], rank)
+                if len(stack) > 0:
+                    stack[-1][RANK] = max(stack[-1][RANK], rank + 1)
 
         for module in self.modules:
-            visited_modules = set()
-            _rank_module(module)
-        for module in self.modules:
-            assert module in rank_map
+            if module not in rank_map:
+                rank_module(module)
 
         return rank_list, rank_map
 
+    def get_signal_index(self) -> 'SignalIndex':
+        """
+        Returns the index of all named nets (see signal_index.py). The index is built on first use, after elaboration.
+        """
+        if self._signal_index is None:
+            from .signal_index import SignalIndex
+            self._signal_index = SignalIndex(self)
+        return self._signal_index
+
     def get_xnet_for_junction(self, junction: 'Junction') -> 'XNet':
         if junction not in self.junction_to_xnet_map:
             raise SyntaxErrorException(f"Can't associate {junction} with any Xnet. Most likely reason is that it doesn't have a source.")
@@ -587,7 +689,12 @@ class Netlist(object):
         def __enter__(self):
             self.netlist.__enter__()
             self.marker = ContextMarker(Context.elaboration)
-            self.marker.__enter__()
+            try:
+                self.marker.__enter__()
+            except BaseException:
+                # Entering elaboration context can fail (see Context.push): don't leave the netlist active
+                self.netlist.__exit__(*sys.exc_info())
+                raise
             return self.netlist
         def __exit__(self, exception_type, exception_value, traceback):
             try:
@@ -606,6 +713,13 @@ class Netlist(object):
 
         top_impl: Module.Impl = self.top_level._impl
 
+        phase_start = default_timer()
+        def end_phase(phase: str) -> None:
+            nonlocal phase_start
+            phase_end = default_timer()
+            self.phase_times[phase] = phase_end - phase_start
+            phase_start = phase_end
+
         # Give top level a name and mark it as user-assigned.
         scope_table = self.symbol_table[None]
         if scope_table.is_auto_symbol(self.top_level):
@@ -616,6 +730,9 @@ class Netlist(object):
             if not all_inputs_specialized:
                 raise SyntaxErrorException(f"Top level module must have all its inputs specialized before it can be elaborated")
             top_impl._elaborate(trace=True)
+        # Templates are only valid until the rest of elaboration starts changing the modules
+        self.elaboration_templates.clear()
+        end_phase("elaborate")
 
         # Deal with all the cleanup after elaboration.
         #
@@ -633,6 +750,8 @@ class Netlist(object):
             for sub_module in module._impl.get_sub_modules():
                 populate_names(sub_module)
 
+        # Maps module class base names to the variant names, by structural hash (see Module.Impl.get_structural_hash)
+        variant_hashes: Dict[str, Dict[int, List[str]]] = {}
         def populate_module_variants(module: 'Module'):
             def _populate_module_variants(module: 'Module'):
                 # First recurse into all sub-modules, then deal with this one...
@@ -643,11 +762,15 @@ class Netlist(object):
 
                 module_class_base_name = fully_qualified_name(module)
                 module_class_short_name = module.__class__.__name__
+                structural_hash = module._impl.get_structural_hash(self)
                 found = False
                 if module_class_base_name not in self.module_variants:
                     self.module_variants[module_class_base_name] = OrderedDict()
+                    variant_hashes[module_class_base_name] = {}
                 else:
-                    for variant_name, variant_instances in self.module_variants[module_class_base_name].items():
+                    # Only variants with the same structural hash can be equivalent
+                    for variant_name in variant_hashes[module_class_base_name].get(structural_hash, ()):
+                        variant_instances = self.module_variants[module_class_base_name][variant_name]
                         # We assume that if we're compatible with one variant instance, we're compatible with all of them.
                         # Now, this is potentially a bit restrictive, but the alternative is an O(N^2) search, which would be bad (TM)
                         variant_instance = variant_instances[0]
@@ -671,6 +794,7 @@ class Netlist(object):
                         module_class_name += "_" + str(variant_cnt+1)
                     self.module_variants[module_class_base_name][module_class_name] = [module]
                     self.module_to_class_map[module] = module_class_name
+                    variant_hashes[module_class_base_name].setdefault(structural_hash, []).append(module_class_name)
 
             _populate_module_variants(module)
 
@@ -684,7 +808,9 @@ class Netlist(object):
         for module in self.modules:
             for junction in module.get_junctions():
                 self._register_junction(junction)
+        end_phase("register junctions")
         self._create_xnets()
+        end_phase("create xnets")
 
         def delimiter(obj: object) -> str:
             if is_module(obj):
@@ -697,14 +823,17 @@ class Netlist(object):
         self.symbol_table.make_unique(delimiter)
         populate_names(self.top_level)
         self._fill_xnet_names()
+        end_phase("names")
 
         #for xnet in self.xnets:
         #    print(f"xnet {hex(id(xnet))} names: {'; '.join(tuple(' '.join(name.keys()) for name in xnet.scoped_names.values()))}")
 
         self.rank_list, self.rank_map = self._rank_netlist()
+        end_phase("rank")
         self.module_variants = OrderedDict()
         self.module_to_class_map = OrderedDict()
         populate_module_variants(self.top_level)
+        end_phase("module variants")
         # Make sure we've got to everyone
         for module in self.modules:
             assert module in self.module_to_class_map
@@ -768,16 +897,24 @@ class Netlist(object):
 
     def simulate(
         self,
-        vcd_file_name: Union[Path,str],
+        vcd_file_name: Optional[Union[Path,str]],
         *,
         end_time: Optional[int] = None,
         timescale='1ns',
         signal_pattern: str = ".",
-        add_unnamed_scopes: bool = False
+        add_unnamed_scopes: bool = False,
+        compile_cones: bool = False,
+        bank_registers: bool = False,
+        four_state: bool = False,
+        two_state: bool = False,
+        background_trace: bool = False,
+        trace_format: Optional[str] = None
     ) -> int:
         from .simulator import Simulator
-        with Simulator(self, str(vcd_file_name), timescale) as context:
-            context.dump_signals(signal_pattern=signal_pattern, add_unnamed_scopes=add_unnamed_scopes)
+        # Without a VCD file, the simulation runs without any tracing
+        with Simulator(self, str(vcd_file_name) if vcd_file_name is not None else None, timescale, compile_cones=compile_cones, bank_registers=bank_registers, four_state=four_state, two_state=two_state, background_trace=background_trace, trace_format=trace_format) as context:
+            if vcd_file_name is not None:
+                context.dump_signals(signal_pattern=signal_pattern, add_unnamed_scopes=add_unnamed_scopes)
             return context.simulate(end_time)
 
     def lint(self):
@@ -1,10 +1,11 @@
-from typing import Optional, Any, Tuple, Generator, Union, Dict, Set, Sequence, Union
+from typing import Optional, Any, Tuple, Generator, Union, Dict, Set, Sequence, Union, Callable
 import enum
 from .exceptions import FixmeException, SyntaxErrorException, SimulationException, AdaptTypeError, InvalidPortError
 from .net_type import NetType, KeyKind, NetTypeFactory, NetTypeMeta
 from .module import GenericModule, Module, InlineBlock, InlineExpression, inline_statement_from_expression
 from .port import Input, Output, Junction, Port, is_junction_base
-from .utils import first, TSimEvent, get_common_net_type, min_none, max_none, adjust_precision, adjust_precision_sim, first_bit_set, Context, NetValue, is_power_of_two
+from .utils import first, TSimEvent, StaticSensitivity, get_common_net_type, min_none, max_none, adjust_precision, adjust_precision_sim, first_bit_set, Context, NetValue, is_power_of_two
+from .four_state import XValue, x_slice, x_resize, x_slice_bits, x_resize_bits
 from collections import OrderedDict
 import re
 try:
@@ -182,6 +183,8 @@ class Number(NetTypeFactory):
             thing = _sim_value(thing)
             if thing is None:
                 return None, None
+            if thing.__class__ is int:
+                return 0, thing
             return thing.precision, thing.value
         @staticmethod
         def _value_in_precision(value: int, precision: int, out_precision: int) -> int:
@@ -563,6 +566,7 @@ class Number(NetTypeFactory):
 
         TODO: get_slice will need review
         """
+        four_state_aware = True
         def construct(self, slice: Union[int, slice], number: 'NumberMeta') -> None:
             self.key = Number.Instance.Key(slice, number)
             self.input_port = Input(number)
@@ -621,14 +625,35 @@ class Number(NetTypeFactory):
 
             shift = end
             mask = (1 << (start - end + 1)) - 1
+            sensitivity = StaticSensitivity(self.input_port)
             while True:
-                yield self.input_port
+                yield sensitivity
                 in_val = self.input_port.sim_value
                 if in_val is None:
-                    out_val = None
+                    # Slices of partially unknown values can be fully known
+                    out_val = x_slice(self.input_port.four_state_sim_value, shift, mask)
                 else:
                     out_val = (in_val >> shift) & mask
                 self.output_port <<= out_val
+        def get_sim_function(self) -> Optional[Tuple[Sequence[Junction], Junction, Callable]]:
+            input_type = self.input_port.get_net_type()
+            start = self.key.start + input_type.precision
+            end = self.key.end + input_type.precision
+
+            shift = end
+            mask = (1 << (start - end + 1)) - 1
+            def sim_function(in_val: Any) -> Any:
+                if in_val is None or in_val.__class__ is XValue:
+                    return x_slice(in_val, shift, mask)
+                return (in_val >> shift) & mask
+            return (self.input_port, ), self.output_port, sim_function
+        def get_lane_sim_function(self) -> Optional[Tuple[Sequence[Junction], Junction, Callable]]:
+            input_type = self.input_port.get_net_type()
+            shift = self.key.end + input_type.precision
+            mask = (1 << (self.key.start - self.key.end + 1)) - 1
+            def sim_function(in_lanes: Any) -> Tuple[Any, Any]:
+                return x_slice_bits(in_lanes.value, in_lanes.x_mask, shift, mask)
+            return (self.input_port, ), self.output_port, sim_function
         def generate(self, netlist: 'Netlist', back_end: 'BackEnd') -> str:
             assert False
         def is_combinational(self) -> bool:
@@ -655,6 +680,7 @@ class Number(NetTypeFactory):
     class TrivialAdaptor(GenericModule):
         input_port = Input()
         output_port = Output()
+        four_state_aware = True
         def construct(self, in_net_type: 'NetType', out_net_type: 'NetType'):
             # We have to be careful: we insert this adaptor late enough in elaboration that type
             # propagation for the ports is not taking place: we'll have to set the net types
@@ -668,9 +694,17 @@ class Number(NetTypeFactory):
             rhs_name, precedence = self.input_port.get_rhs_expression(back_end, target_namespace, self.output_port.get_net_type())
             return rhs_name, precedence
         def simulate(self) -> TSimEvent:
+            sensitivity = StaticSensitivity(self.input_port)
             while True:
-                yield self.input_port
-                self.output_port <<= self.input_port.sim_value
+                yield sensitivity
+                in_val = self.input_port.sim_value
+                if in_val is None:
+                    in_val = self.input_port.four_state_sim_value
+                self.output_port <<= in_val
+        def get_sim_function(self) -> Optional[Tuple[Sequence[Junction], Junction, Callable]]:
+            return (self.input_port, ), self.output_port, lambda in_val: in_val
+        def get_lane_sim_function(self) -> Optional[Tuple[Sequence[Junction], Junction, Callable]]:
+            return (self.input_port, ), self.output_port, lambda in_lanes: (in_lanes.value, in_lanes.x_mask)
         def is_combinational(self) -> bool:
             """
             Returns True if the module is purely combinational, False otherwise
@@ -678,6 +712,7 @@ class Number(NetTypeFactory):
             return True
 
     class SizeAdaptor(GenericModule):
+        four_state_aware = True
         def construct(self, input_type: 'NumberMeta', output_type: 'NumberMeta') -> None:
             if not is_number(input_type):
                 raise SyntaxErrorException("Can only adapt the size of numbers")
@@ -712,20 +747,64 @@ class Number(NetTypeFactory):
             else:
                 yield inline_statement_from_expression(back_end, target_namespace, ret_val, self.output_port)
         def simulate(self) -> TSimEvent:
+            sensitivity = StaticSensitivity(self.input_port)
             while True:
-                yield self.input_port
+                yield sensitivity
                 input_val = adjust_precision_sim(self.input_port.sim_value, self.input_port.precision, self.output_port.precision)
                 if input_val is None:
-                    self.output_port <<= None
+                    self.output_port <<= self.resize_four_state(self.input_port.four_state_sim_value)
                 else:
                     output_bit_mask = (1 << self.output_port.get_net_type().int_length) - 1
                     input_val &= output_bit_mask
                     if self.output_port.signed:
                         if input_val > self.output_port.get_net_type().max_val:
-                            input_val = Number.NetValue(input_val.value - output_bit_mask - 1, input_val.precision)
+                            if input_val.__class__ is int:
+                                input_val = input_val - output_bit_mask - 1
+                            else:
+                                input_val = Number.NetValue(input_val.value - output_bit_mask - 1, input_val.precision)
                     # So far we've done what the RTL is doing. However, that might still be a mistake if output is not a full power-of-two range.
                     # This however will get caught in the implementation if __ilshift__
                     self.output_port <<= input_val
+        def get_sim_function(self) -> Optional[Tuple[Sequence[Junction], Junction, Callable]]:
+            input_precision = self.input_port.precision
+            output_type = self.output_port.get_net_type()
+            output_precision = output_type.precision
+            output_bit_mask = (1 << output_type.int_length) - 1
+            output_signed = output_type.signed
+            output_max_val = output_type.max_val
+            resize_four_state = self.resize_four_state
+            def sim_function(in_val: Any) -> Any:
+                if in_val.__class__ is XValue:
+                    return resize_four_state(in_val)
+                input_val = adjust_precision_sim(in_val, input_precision, output_precision)
+                if input_val is None:
+                    return None
+                input_val &= output_bit_mask
+                if output_signed:
+                    if input_val > output_max_val:
+                        if input_val.__class__ is int:
+                            input_val = input_val - output_bit_mask - 1
+                        else:
+                            input_val = Number.NetValue(input_val.value - output_bit_mask - 1, input_val.precision)
+                return input_val
+            return (self.input_port, ), self.output_port, sim_function
+        def get_lane_sim_function(self) -> Optional[Tuple[Sequence[Junction], Junction, Callable]]:
+            input_type = self.input_port.get_net_type()
+            output_type = self.output_port.get_net_type()
+            def sim_function(in_lanes: Any) -> Tuple[Any, Any]:
+                return x_resize_bits(in_lanes.value, in_lanes.x_mask, input_type.length, input_type.signed, output_type.length, output_type.signed)
+            return (self.input_port, ), self.output_port, sim_function
+        def resize_four_state(self, in_val: Any) -> Any:
+            """
+            Simulates the adaptor for partially unknown (four-state) inputs. Only integer values can have unknown bits.
+            """
+            if in_val.__class__ is not XValue:
+                return None
+            input_type = self.input_port.get_net_type()
+            output_type = self.output_port.get_net_type()
+            if input_type.precision != 0 or output_type.precision != 0:
+                return None
+            return x_resize(in_val, input_type.length, input_type.signed, output_type.length, output_type.signed)
         def is_combinational(self) -> bool:
             """
             Returns True if the module is purely combinational, False otherwise
@@ -864,6 +943,7 @@ class Number(NetTypeFactory):
             multiple-assignment to (sections of) vectors.
             """
             output_port = Output()
+            four_state_aware = True
 
             def construct(self, key_chains: Sequence[Sequence[Tuple[Any, KeyKind]]]):
                 self.key_chains = key_chains
@@ -956,9 +1036,16 @@ class Number(NetTypeFactory):
             def simulate(self) -> TSimEvent:
                 net_type = self.output_port.get_net_type()
                 cache = net_type.prep_simulate_concatenated_expression(self.input_map)
+                sensitivity = StaticSensitivity(self.get_inputs().values())
                 while True:
-                    yield self.get_inputs().values()
+                    yield sensitivity
                     self.output_port <<= net_type.simulate_concatenated_expression(cache)
+            def get_sim_function(self) -> Optional[Tuple[Sequence[Junction], Junction, Callable]]:
+                inputs, sim_function = self.output_port.get_net_type().get_concatenated_sim_function(self.input_map)
+                return inputs, self.output_port, sim_function
+            def get_lane_sim_function(self) -> Optional[Tuple[Sequence[Junction], Junction, Callable]]:
+                inputs, sim_function = self.output_port.get_net_type().get_concatenated_lane_sim_function(self.input_map)
+                return inputs, self.output_port, sim_function
 
             def is_combinational(self) -> bool:
                 """
@@ -1115,9 +1202,19 @@ class Number(NetTypeFactory):
             Has the option to change/correct the sim_value prior to assignment.
 
             Returns potentially modified sim_value for assignment.
+
+            Integer (precision 0) nets store raw Python ints. Any other representation
+            of an integer value is converted here.
             """
             if sim_value is None:
                 return sim_value
+            if sim_value.__class__ is not int and cls.precision == 0:
+                if sim_value.__class__ is bool:
+                    sim_value = int(sim_value)
+                elif sim_value.__class__ is Number.NetValue and sim_value.precision == 0:
+                    sim_value = sim_value.value
+                    if sim_value is None:
+                        return None
             if sim_value > cls.max_sim_val or sim_value < cls.min_sim_val:
                 raise SimulationException(f"Can't assign to net '{parent_junction}' the value '{sim_value}'. That value is outside of the representable range.", parent_junction)
             return sim_value
@@ -1151,8 +1248,12 @@ class Number(NetTypeFactory):
             """
             if value is None:
                 return 'X'
+            if value.__class__ is int:
+                return value
             if isinstance(value, Number.NetValue):
                 return value.value
+            if value.__class__ is XValue:
+                return value.to_bit_str(cls.length)
             assert False
             return value
 
@@ -1161,12 +1262,24 @@ class Number(NetTypeFactory):
             context = Context.current()
 
             if context == Context.simulation:
-                if input is None or input.value is None:
+                # Integer values are kept as raw Python ints, Number.NetValue is only used for fractional values
+                if input.__class__ is int:
+                    if cls.min_val <= input <= cls.max_val:
+                        return input if cls.precision == 0 else Number.NetValue(input)
+                    input = Number.NetValue(input)
+                elif input is None or input.value is None:
                     return None
-                if is_junction_base(input):
-                    input = input.sim_value
+                elif input.__class__ is XValue:
+                    # Partially unknown values (four-state simulation) are only supported on integer nets
+                    return input if cls.precision == 0 else None
+                elif is_junction_base(input):
+                    return cls.adapt_from(input.sim_value, implicit, force, allow_memberwise_adapt)
                 elif isinstance(input, Number.NetValue):
-                    pass
+                    if input.precision == 0 and cls.precision == 0 and input.__class__ is Number.NetValue:
+                        input = input.value
+                        if cls.min_val <= input <= cls.max_val:
+                            return input
+                        input = Number.NetValue(input)
                 else:
                     try:
                         input = Number.NetValue(int(input))
@@ -1549,13 +1662,58 @@ class Number(NetTypeFactory):
         @classmethod
         def simulate_concatenated_expression(cls, prep_cache: Any) -> int:
             value = 0
+            x_mask = 0
             for sub_port, last_top_idx in prep_cache:
                 sub_source_value = sub_port.sim_value
                 if sub_source_value is None:
-                    return None
+                    sub_source_value = sub_port.four_state_sim_value
+                    if sub_source_value.__class__ is not XValue:
+                        return None
+                    x_mask |= sub_source_value.x_mask << last_top_idx
+                    sub_source_value = sub_source_value.value
                 value |= sub_source_value << last_top_idx
+            if x_mask != 0:
+                return XValue(value, x_mask)
             return value
 
+        @classmethod
+        def get_concatenated_sim_function(cls, input_map: Dict['Number.Instance.Key', Junction]) -> Tuple[Sequence[Junction], Callable]:
+            """
+            Returns the input ports (in order) and a side-effect free function that computes the concatenated value from their sim values.
+            """
+            prep_cache = cls.prep_simulate_concatenated_expression(input_map)
+            shifts = tuple(last_top_idx for _, last_top_idx in prep_cache)
+            def sim_function(*input_values: Any) -> Any:
+                value = 0
+                x_mask = 0
+                for sub_source_value, last_top_idx in zip(input_values, shifts):
+                    if sub_source_value is None:
+                        return None
+                    if sub_source_value.__class__ is XValue:
+                        x_mask |= sub_source_value.x_mask << last_top_idx
+                        sub_source_value = sub_source_value.value
+                    value |= sub_source_value << last_top_idx
+                if x_mask != 0:
+                    return XValue(value, x_mask)
+                return value
+            return tuple(sub_port for sub_port, _ in prep_cache), sim_function
+
+        @classmethod
+        def get_concatenated_lane_sim_function(cls, input_map: Dict['Number.Instance.Key', Junction]) -> Tuple[Sequence[Junction], Callable]:
+            """
+            The same as get_concatenated_sim_function, but for multi-lane simulation (see Module.get_lane_sim_function).
+            """
+            prep_cache = cls.prep_simulate_concatenated_expression(input_map)
+            shifts = tuple(last_top_idx for _, last_top_idx in prep_cache)
+            def sim_function(*inputs: Any) -> Tuple[Any, Any]:
+                value = 0
+                x_mask = 0
+                for sub_source, last_top_idx in zip(inputs, shifts):
+                    value = value | (sub_source.value << last_top_idx)
+                    x_mask = x_mask | (sub_source.x_mask << last_top_idx)
+                return value & ~x_mask, x_mask
+            return tuple(sub_port for sub_port, _ in prep_cache), sim_function
+
 
     net_type = Instance
 
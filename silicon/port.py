@@ -52,6 +52,12 @@ class JunctionBase(object):
         Context.register(self._context_change)
         parent_module._impl.netlist.symbol_table[parent_module].add_auto_symbol(self)
 
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Called when a stored netlist is loaded (see elaboration_cache.py)
+        self.__dict__.update(state)
+        if self.__dict__.get("_parent_module", None) is not None:
+            Context.register(self._context_change)
+
     def __getitem__(self, key: Any) -> Any:
         if Context.current() == Context.simulation:
             return self.get_net_type().get_slice(key, self)
@@ -103,6 +109,11 @@ class JunctionBase(object):
     def _safe_call_by_name(obj, name, *kargs, **kwargs):
         if obj is None:
             return None
+        if obj.__class__ is int:
+            # Integer nets store raw ints. Operators on junctions follow Number.NetValue semantics
+            # (which among other things accept junctions as operands) so wrap the value for the operation.
+            from .number import Number
+            obj = Number.NetValue(obj)
         return getattr(type(obj), name)(obj, *kargs, **kwargs)
 
     def _binary_op(self, other: Any, gate: 'Module', name: str) -> Any:
@@ -271,6 +282,8 @@ class JunctionBase(object):
         context = Context.current()
         if context == Context.simulation:
             my_val = self.sim_value
+            if my_val.__class__ is int:
+                return my_val ^ ((1 << self.get_num_bits()) - 1)
             try:
                 return my_val.invert(self.get_num_bits())
             except AttributeError:
@@ -410,6 +423,9 @@ class Junction(JunctionBase):
             self.far_end = far_end
             self.scope = scope
 
+    class CompositeSimValue(object):
+        pass
+
     def __init__(self, net_type: Optional[NetTypeMeta] = None, parent_module: 'Module' = None, *, keyword_only: bool = False):
         # !!!!! SUPER IMPORTANT !!!!!
         # In most cases, Ports of a Module are set on the cls level, not inside __init__() (or construct()).
@@ -442,7 +458,7 @@ class Junction(JunctionBase):
         if not hasattr(self, "_xnet") or self._xnet is None:
             return ret_val
         try:
-            ret_val += f" = {self._xnet.sim_state.value}"
+            ret_val += f" = {self._xnet.sim_value}"
         except AttributeError:
             pass
         return ret_val
@@ -455,7 +471,7 @@ class Junction(JunctionBase):
         if not hasattr(self, "_xnet") or self._xnet is None:
             return ret_val
         try:
-            ret_val += f" = {self._xnet.sim_state.value}"
+            ret_val += f" = {self._xnet.sim_value}"
         except AttributeError:
             pass
         return ret_val
@@ -690,22 +706,26 @@ class Junction(JunctionBase):
             scopes.add(sub_module)
 
         ret_val = OrderedSet()
-        def _get_sinks(for_junction: 'Junction', first_or_last_in_path: Optional['Junction']) -> None:
-            for my_sink, my_scope in for_junction._sinks.items():
-                if my_scope in scopes:
-                    if add_last:
-                        ret_val.add((my_sink, for_junction))
-                    else:
-                        if first_or_last_in_path is None:
-                            ret_val.add((my_sink, my_sink))
-                        else:
-                            ret_val.add((my_sink, first_or_last_in_path))
+        # Depth-first walk with an explicit stack of (junction, first in path, sink iterator), so long chains of wires don't hit the recursion limit
+        stack = [(self, None, iter(self._sinks.items()))]
+        while len(stack) > 0:
+            for_junction, first_or_last_in_path, sinks = stack[-1]
+            my_sink, my_scope = next(sinks, (None, None))
+            if my_sink is None:
+                stack.pop()
+                continue
+            if my_scope in scopes:
+                if add_last:
+                    ret_val.add((my_sink, for_junction))
+                else:
                     if first_or_last_in_path is None:
-                        _get_sinks(my_sink, my_sink)
+                        ret_val.add((my_sink, my_sink))
                     else:
-                        _get_sinks(my_sink, first_or_last_in_path)
-
-        _get_sinks(self, None)
+                        ret_val.add((my_sink, first_or_last_in_path))
+                if first_or_last_in_path is None:
+                    stack.append((my_sink, my_sink, iter(my_sink._sinks.items())))
+                else:
+                    stack.append((my_sink, first_or_last_in_path, iter(my_sink._sinks.items())))
         return ret_val
 
 
@@ -871,38 +891,50 @@ class Junction(JunctionBase):
         #if not hasattr(self, "_xnet") or self._xnet is None:
         #    return None
         #assert not self.is_composite(), "Simulator should never ask for the value of compound types"
-        #return self._xnet.sim_state.value
-        class CompositeSimValue(object):
-            pass
-
         if self.is_composite():
-            sim_value = CompositeSimValue()
+            sim_value = Junction.CompositeSimValue()
             for member_name, (member_junction, reversed) in self.get_member_junctions().items():
                 setattr(sim_value, member_name, member_junction.sim_value)
             return sim_value
-        return self._xnet.sim_value
+        xnet = self._xnet
+        return xnet.sim_store.values[xnet.sim_index]
+
+    @property
+    def four_state_sim_value(self) -> Any:
+        """
+        The same as 'sim_value', except that in four-state simulation (partially or fully) unknown
+        values of integer nets are returned as XValue objects (see four_state.py), not None.
+        """
+        assert not self.is_composite(), "Simulator should never ask for the value of compound types"
+        xnet = self._xnet
+        return xnet.sim_store.get_four_state_value(xnet.sim_index)
 
     @property
     def previous_sim_value(self) -> Any:
         #if not hasattr(self, "_xnet") or self._xnet is None:
         #    return None
         assert not self.is_composite(), "Simulator should never ask for the value of compound types"
-        return self._xnet.sim_state.previous_value
+        return self._xnet.sim_store.previous_values[self._xnet.sim_index]
 
     @property
     def last_changed(self) -> Optional[int]:
         assert not self.is_composite(), "Simulator should never ask for the value of compound types"
-        return self._xnet.sim_state.get_last_changed()
+        return self._xnet.sim_store.last_changed[self._xnet.sim_index]
 
     def get_sim_edge(self) -> EdgeType:
         #if not hasattr(self, "_xnet") or self._xnet is None:
         #    return None
         assert not self.is_composite(), "Simulator should never ask for the value of compound types"
-        if not self._xnet.sim_state.is_edge():
+        xnet = self._xnet
+        sim_store = xnet.sim_store
+        sim_index = xnet.sim_index
+        if not sim_store.is_edge(sim_index):
             return EdgeType.NoEdge
-        if self.previous_sim_value == 0 and self.sim_value == 1:
+        previous_sim_value = sim_store.previous_values[sim_index]
+        sim_value = sim_store.values[sim_index]
+        if previous_sim_value == 0 and sim_value == 1:
             return EdgeType.Positive
-        if self.previous_sim_value == 1 and self.sim_value == 0:
+        if previous_sim_value == 1 and sim_value == 0:
             return EdgeType.Negative
         return EdgeType.Undefined
 
@@ -982,13 +1014,16 @@ class Junction(JunctionBase):
         # using hasattr instead of is_junction_base to speed up simulation. It also catches PortSlices not just Ports
         if hasattr(value, "sim_value"):
             new_sim_value = value.sim_value
+            if new_sim_value is None and hasattr(value, "four_state_sim_value"):
+                # Keep the known bits of partially unknown values
+                new_sim_value = value.four_state_sim_value
         else:
             from .utils import adapt
             new_sim_value = adapt(value, self.get_net_type(), implicit=False, force=False, allow_memberwise_adapt=False)
 
         xnet_source = self._xnet.get_source()
         if xnet_source is self:
-            self._xnet.sim_state.sim_context.schedule_value_change(self._xnet, new_sim_value, when)
+            self._xnet.sim_store.sim_context.schedule_value_change(self._xnet, new_sim_value, when)
             return
         if xnet_source is not None:
             is_transition = self._xnet.is_transition(self)
@@ -1000,7 +1035,7 @@ class Junction(JunctionBase):
             assert xnet_source is None
             if self._xnet.num_junctions(include_source=False) > 1:
                 raise SimulationException(f"Can't assigne to XNet that has no driver during simulation. This net is a {'transition, which means it both has a driver and sink(s)' if is_transition else 'sink, which means it does not drive anything'}", self)
-            self._xnet.sim_state.sim_context.schedule_value_change(self._xnet, new_sim_value, when)
+            self._xnet.sim_store.sim_context.schedule_value_change(self._xnet, new_sim_value, when)
 
 
 
@@ -1304,6 +1339,9 @@ class ScopedPort(JunctionBase):
                 raise AttributeError
             self.get_underlying_junction().__setattr__(name, value)
     def __getattr__(self, name: str) -> Any:
+        if name in ScopedPort.attributes:
+            # Not set up yet (while being copied for instance)
+            raise AttributeError
         if self._real_junction is None:
             raise AttributeError
         return self.get_underlying_junction().__getattribute__(name)
@@ -1374,6 +1412,7 @@ def create_junction_type(junction_type: 'JunctionBase', net_type: Optional[NetTy
         bases += extra_bases
 
     typed_junction_type = type(type_name, bases, {} if extra_dict is None else extra_dict)
+    typed_junction_type._type_factory = (create_junction_type, (junction_type, net_type, extra_bases, extra_dict))
 
     if extra_dict is None:
         _JunctionInstances[(junction_type, net_type)] = typed_junction_type
@@ -1,12 +1,12 @@
 from .module import Module, InlineBlock, InlineExpression, InlineStatement, InlineComposite, has_port, GenericModule
-from typing import Dict, Optional, Tuple, Any, Generator, Union
+from typing import Dict, Optional, Tuple, Any, Generator, Union, Sequence, Callable
 from .port import Junction, Input, Output, Port, EdgeType, Wire
 from .auto_input import ClkPort, ClkEnPort, RstPort, RstValPort
 from .exceptions import FixmeException, SyntaxErrorException, SimulationException, InvalidPortError
 from collections import OrderedDict
 from .utils import ScopedAttr, get_common_net_type
 from .number import NumberMeta, logic
-from .utils import TSimEvent, is_module
+from .utils import TSimEvent, StaticSensitivity, is_module
 from .sil_enum import is_enum
 
 class Select(Module):
@@ -69,18 +69,74 @@ class Select(Module):
         if not self.output_port.is_specialized():
             self.output_port.set_net_type(new_net_type)
 
-    def simulate(self) -> TSimEvent:
+    def get_two_state_missing_value(self) -> Any:
+        """
+        Returns the output value for selector values without an input in two-state simulation.
+
+        Without a default port that would be an unknown value, which two-state simulation doesn't have:
+        the default value of the output type is used instead.
+        """
+        if has_port(self, "default_port") and self.has_default():
+            return None
+        return self.output_port.get_net_type().get_default_sim_value()
+
+    def simulate(self, simulator: 'Simulator') -> TSimEvent:
+        sensitivity = StaticSensitivity(self.get_inputs().values())
+        missing_value = self.get_two_state_missing_value() if simulator.two_state else None
         while True:
-            yield self.get_inputs().values()
+            yield sensitivity
             if self.selector_port.sim_value is None:
                 self.output_port <<= None
                 continue
             selected_input_idx = self.selector_port.sim_value
             if selected_input_idx not in self.value_ports:
-                self.output_port <<= self.default_port
+                if missing_value is not None:
+                    self.output_port <<= missing_value
+                else:
+                    self.output_port <<= self.default_port
             else:
                 self.output_port <<= self.value_ports[selected_input_idx]
 
+    def _create_sim_function(self, missing_value: Any) -> Optional[Tuple[Sequence[Port], Port, Callable]]:
+        inputs = (self.selector_port, ) + tuple(self.value_ports.values())
+        has_default = has_port(self, "default_port")
+        if has_default:
+            inputs += (self.default_port, )
+        value_idx_map = OrderedDict((key, idx) for idx, key in enumerate(self.value_ports.keys()))
+        def sim_function(selector_value: Any, *values: Any) -> Any:
+            if selector_value is None:
+                return None
+            if selector_value not in value_idx_map:
+                if missing_value is not None:
+                    return missing_value
+                return values[-1] if has_default else None
+            return values[value_idx_map[selector_value]]
+        return inputs, self.output_port, sim_function
+
+    def get_sim_function(self) -> Optional[Tuple[Sequence[Port], Port, Callable]]:
+        return self._create_sim_function(None)
+
+    def get_two_state_sim_function(self) -> Optional[Tuple[Sequence[Port], Port, Callable]]:
+        return self._create_sim_function(self.get_two_state_missing_value())
+
+    def get_lane_sim_function(self) -> Optional[Tuple[Sequence[Port], Port, Callable]]:
+        import numpy as np
+
+        inputs = (self.selector_port, ) + tuple(self.value_ports.values())
+        has_default = has_port(self, "default_port") and self.has_default()
+        if has_default:
+            inputs += (self.default_port, )
+        keys = tuple(self.value_ports.keys())
+        unknown_mask = (1 << self.output_port.get_num_bits()) - 1
+        def sim_function(selector: Any, *values: Any) -> Tuple[Any, Any]:
+            conditions = tuple(selector.value == key for key in keys)
+            value = np.select(conditions, tuple(input.value for input in values[:len(keys)]), values[-1].value if has_default else 0)
+            x_mask = np.select(conditions, tuple(input.x_mask for input in values[:len(keys)]), values[-1].x_mask if has_default else unknown_mask)
+            # Lanes with any unknown selector bits are unknown
+            unknown_selector = selector.x_mask != 0
+            return np.where(unknown_selector, 0, value), np.where(unknown_selector, unknown_mask, x_mask)
+        return inputs, self.output_port, sim_function
+
     def get_inline_block(self, back_end: 'BackEnd', target_namespace: Module) -> Generator[InlineBlock, None, None]:
         assert len(self.get_outputs()) == 1
         if self.output_port.is_composite():
@@ -294,8 +350,9 @@ class SelectOne(_SelectOneHot):
 
     def simulate(self, simulator) -> TSimEvent:
         self.init_map()
+        sensitivity = StaticSensitivity(self.get_inputs().values())
         while True:
-            yield self.get_inputs().values()
+            yield sensitivity
             found = False
             selected_value = None
             for selector in self.selector_ports.values():
@@ -310,7 +367,9 @@ class SelectOne(_SelectOneHot):
                     if found:
                         if selected_value != self.selector_to_value_map[selector].sim_value:
                             # Due to simultanious changes (that are delayed by delta) it's possible that we have multiple inputs set even if that should not occur in a no-delay simulation
-                            self.output_port <<= None
+                            # In two-state simulation we simply keep the first selected value: the glitch will go away in a later delta cycle anyway.
+                            if not simulator.two_state:
+                                self.output_port <<= None
                             break
                             #raise SimulationException(f"Multiple selectors set on one-hot encoded selector", self)
                     found = True
@@ -390,8 +449,9 @@ class SelectFirst(_SelectOneHot):
     """
     def simulate(self, simulator) -> TSimEvent:
         self.init_map()
+        sensitivity = StaticSensitivity(self.get_inputs().values())
         while True:
-            yield self.get_inputs().values()
+            yield sensitivity
             use_default = True
             for idx in range(len(self.selector_ports)):
                 try:
@@ -468,6 +528,7 @@ class Concatenator(Module):
     Those are handled by type-specific PhiSlice modules.
     """
     output_port = Output()
+    four_state_aware = True # See four_state.py
 
     def construct(self):
         self.raw_input_map = []
@@ -537,10 +598,25 @@ class Concatenator(Module):
     def simulate(self) -> TSimEvent:
         net_type = self.output_port.get_net_type()
         cache = net_type.prep_simulate_concatenated_expression(self.input_map)
+        sensitivity = StaticSensitivity(self.get_inputs().values())
         while True:
-            yield self.get_inputs().values()
+            yield sensitivity
             self.output_port <<= net_type.simulate_concatenated_expression(cache)
 
+    def get_sim_function(self) -> Optional[Tuple[Sequence[Port], Port, Callable]]:
+        net_type = self.output_port.get_net_type()
+        if not hasattr(net_type, "get_concatenated_sim_function"):
+            return None
+        inputs, sim_function = net_type.get_concatenated_sim_function(self.input_map)
+        return inputs, self.output_port, sim_function
+
+    def get_lane_sim_function(self) -> Optional[Tuple[Sequence[Port], Port, Callable]]:
+        net_type = self.output_port.get_net_type()
+        if not hasattr(net_type, "get_concatenated_lane_sim_function"):
+            return None
+        inputs, sim_function = net_type.get_concatenated_lane_sim_function(self.input_map)
+        return inputs, self.output_port, sim_function
+
     def is_combinational(self) -> bool:
         """
         Returns True if the module is purely combinational, False otherwise
@@ -649,52 +725,100 @@ class GenericReg(GenericModule):
             ret_val += f"initial {output_name} <= {rst_val_expression};\n"
         return ret_val
 
-    def simulate(self) -> TSimEvent:
+    def simulate(self, simulator: 'Simulator') -> TSimEvent:
+        # Member lists of composite registers don't change during simulation, so collect them only once
+        is_composite = self.output_port.is_composite()
+        if is_composite:
+            out_members = self.output_port.get_all_member_junctions(add_self=False)
+            in_members = self.input_port.get_all_member_junctions(add_self=False)
+        else:
+            out_members = (self.output_port, )
+            in_members = (self.input_port, )
+        has_reset_value = self.reset_value_port.has_driver()
+        default_values = tuple(member.get_net_type().get_default_sim_value() for member in out_members)
+
         def reset():
-            if self.reset_value_port.has_driver():
+            if has_reset_value:
                 self.output_port <<= self.reset_value_port
             else:
-                if self.output_port.is_composite():
-                    members = self.output_port.get_all_member_junctions(add_self=False)
-                    for member in members:
-                        member <<= member.get_net_type().get_default_sim_value()
-                else:
-                    self.output_port <<= self.output_port.get_net_type().get_default_sim_value()
+                for member, default_value in zip(out_members, default_values):
+                    member <<= default_value
 
         has_reset = self.reset_port.has_driver()
         has_async_reset = not self.sync_reset and has_reset
         has_clk_en = self.clock_en.has_driver()
+
+        # The wake filter below lets the simulator skip waking us up on clock edges that wouldn't change the output:
+        # inactive edges, edges with the clock enable low and edges where the input didn't change since the last capture.
+        netlist = simulator.netlist
+        state_store = simulator.context.state_store
+        values = state_store.values
+        previous_values = state_store.previous_values
+        last_changed = state_store.last_changed
+        last_changed_delta = state_store.last_changed_delta
+        clock_index = netlist.get_xnet_for_junction(self.clock_port).sim_index
+        reset_index = netlist.get_xnet_for_junction(self.reset_port).sim_index if has_reset else None
+        clock_en_index = netlist.get_xnet_for_junction(self.clock_en).sim_index if has_clk_en else None
+        in_indices = tuple(netlist.get_xnet_for_junction(member).sim_index for member in in_members)
+        edge_from, edge_to = (0, 1) if self.clk_edge == EdgeType.Positive else (1, 0)
+        two_state = simulator.two_state
+        captured_stamps = None # The (last_changed, last_changed_delta) pairs of the inputs at the last capture, or None if the output doesn't hold the captured input
+
+        def needs_wake() -> bool:
+            if reset_index is not None and values[reset_index] != 0:
+                return True
+            # Without a reset, only an active or an undefined clock edge does anything. If the clock didn't change,
+            # the values below are stale, but then the generator wouldn't do anything either.
+            previous_value = previous_values[clock_index]
+            value = values[clock_index]
+            if previous_value == edge_to and value == edge_from:
+                return False
+            if previous_value != edge_from or value != edge_to:
+                return True
+            if clock_en_index is not None and values[clock_en_index] == 0:
+                return False
+            if captured_stamps is None:
+                return True
+            for in_index, (when, delta) in zip(in_indices, captured_stamps):
+                if last_changed[in_index] != when or last_changed_delta[in_index] != delta:
+                    return True
+            return False
+
+        if has_async_reset:
+            sensitivity = StaticSensitivity((self.reset_port, self.clock_port), needs_wake)
+        else:
+            sensitivity = StaticSensitivity(self.clock_port, needs_wake)
+        # Number of times the simulator actually woke us up. It's kept by the simulation: the netlist can be simulated several times at once
+        activation_counts = simulator.context.activation_counts
+        activation_counts[self] = 0
         while True:
-            if has_async_reset:
-                yield (self.reset_port, self.clock_port)
-            else:
-                yield (self.clock_port, )
+            yield sensitivity
+            activation_counts[self] += 1
             # Test for rising edge on clock
             if has_async_reset and self.reset_port.sim_value == 1:
                 reset()
+                captured_stamps = None
             else:
                 edge_type = self.clock_port.get_sim_edge()
                 if edge_type == self.clk_edge:
                     if has_reset and self.reset_port.sim_value == 1:
                         # This branch is never taken for async reset
                         reset()
+                        captured_stamps = None
                     else:
                         if not has_clk_en or self.clock_en.sim_value == 1:
-                            if self.output_port.is_composite():
-                                out_members = self.output_port.get_all_member_junctions(add_self=False)
-                                in_members = self.input_port.get_all_member_junctions(add_self=False)
-                                for out_member, in_member in zip(out_members, in_members):
-                                    if in_member.get_sim_edge() != EdgeType.NoEdge:
-                                        out_member <<= None
-                                    else:
-                                        out_member <<= in_member
-                            else:
-                                if self.input_port.get_sim_edge() != EdgeType.NoEdge:
-                                    self.output_port <<= None
+                            captured = True
+                            for out_member, in_member, in_index in zip(out_members, in_members, in_indices):
+                                if in_member.get_sim_edge() != EdgeType.NoEdge:
+                                    # In two-state simulation we can't produce an unknown value: take the value from before the clock edge instead
+                                    out_member <<= previous_values[in_index] if two_state else None
+                                    captured = False
                                 else:
-                                    self.output_port <<= self.input_port
-                elif edge_type == EdgeType.Undefined:
+                                    out_member <<= in_member
+                            captured_stamps = tuple((last_changed[in_index], last_changed_delta[in_index]) for in_index in in_indices) if captured else None
+                elif edge_type == EdgeType.Undefined and not two_state:
                     self.output_port <<= None
+                    captured_stamps = None
 
 class PosReg(GenericReg):
     def __new__(cls, *args, **kwargs):
@@ -867,11 +991,12 @@ class GenericLatch(GenericModule):
                     self.output_port <<= self.output_port.get_net_type().get_default_sim_value()
 
         has_reset = self.reset_port.has_driver()
+        if has_reset:
+            sensitivity = StaticSensitivity((self.reset_port, self.latch_port, self.input_port))
+        else:
+            sensitivity = StaticSensitivity((self.latch_port, self.input_port))
         while True:
-            if has_reset:
-                yield (self.reset_port, self.latch_port, self.input_port)
-            else:
-                yield (self.latch_port, self.input_port)
+            yield sensitivity
 
             if has_reset and self.reset_port.sim_value == 1:
                 reset()
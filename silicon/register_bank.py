@@ -0,0 +1,116 @@
+from typing import List, Tuple, Any, Sequence
+from .utils import StaticSensitivity, TSimEvent, adapt
+from .port import EdgeType
+from .cone_compiler import create_sim_value_converter
+
+"""
+Simulation of all registers on a clock edge in a single sweep.
+
+In normal (event-driven) simulation every register is its own generator, woken up (and checking the
+clock edge) separately. When register banking is enabled, the simulator groups registers that are
+clocked by the same XNet on the same edge into a RegisterBank. The bank is a single generator: on every
+clock edge it samples the inputs of all its registers first, then schedules all the output changes
+in one pass.
+
+Registers with asynchronous resets are still simulated one-by-one, through GenericReg.simulate.
+"""
+
+def get_reg_descriptors(netlist: 'Netlist', reg: 'GenericReg') -> List[Tuple[Any, ...]]:
+    """
+    Returns the description of every (non-composite) member of a register, as a list of tuples of
+    (output index, input index, reset index, reset value index, reset value, clock enable index).
+
+    Indices are XNet.sim_index values, or None for unconnected ports. 'reset value' is used if there's no reset value index.
+    """
+    has_reset = reg.reset_port.has_driver()
+    has_reset_value = reg.reset_value_port.has_driver()
+    reset_index = netlist.get_xnet_for_junction(reg.reset_port).sim_index if has_reset else None
+    clock_en_index = netlist.get_xnet_for_junction(reg.clock_en).sim_index if reg.clock_en.has_driver() else None
+    if reg.output_port.is_composite():
+        out_members = reg.output_port.get_all_member_junctions(add_self=False)
+        in_members = reg.input_port.get_all_member_junctions(add_self=False)
+        reset_value_members = reg.reset_value_port.get_all_member_junctions(add_self=False) if has_reset_value else (None, ) * len(out_members)
+    else:
+        out_members = (reg.output_port, )
+        in_members = (reg.input_port, )
+        reset_value_members = (reg.reset_value_port if has_reset_value else None, )
+    descriptors = []
+    for out_member, in_member, reset_value_member in zip(out_members, in_members, reset_value_members):
+        if reset_value_member is not None:
+            reset_value_index = netlist.get_xnet_for_junction(reset_value_member).sim_index
+            reset_value = None
+        else:
+            net_type = out_member.get_net_type()
+            reset_value_index = None
+            reset_value = adapt(net_type.get_default_sim_value(), net_type, implicit=False, force=False, allow_memberwise_adapt=False)
+        descriptors.append((
+            netlist.get_xnet_for_junction(out_member).sim_index,
+            netlist.get_xnet_for_junction(in_member).sim_index,
+            reset_index,
+            reset_value_index,
+            reset_value,
+            clock_en_index
+        ))
+    return descriptors
+
+class RegisterBank(object):
+    """
+    All (synchronous) registers that are clocked by the same XNet on the same edge.
+    """
+    def __init__(self, clock_xnet: 'XNet', clk_edge: EdgeType):
+        self.clock_xnet = clock_xnet
+        self.clk_edge = clk_edge
+        self.regs: List[Tuple[Any, ...]] = [] # See get_reg_descriptors for the layout
+        self.reset_value_converters: List[Any] = [] # Converts the reset value (port) to the type of the output, for every entry in 'regs'
+
+    def add_reg(self, netlist: 'Netlist', reg: 'GenericReg') -> None:
+        out_members = reg.output_port.get_all_member_junctions(add_self=False) if reg.output_port.is_composite() else (reg.output_port, )
+        self.regs += get_reg_descriptors(netlist, reg)
+        self.reset_value_converters += [create_sim_value_converter(out_member) for out_member in out_members]
+
+    def simulate(self, sim_context: 'Simulator.SimulatorContext') -> TSimEvent:
+        state_store = sim_context.state_store
+        values = state_store.values
+        previous_values = state_store.previous_values
+        last_changed = state_store.last_changed
+        last_changed_delta = state_store.last_changed_delta
+        four_state_value = state_store.get_four_state_value
+        simulator = sim_context.simulator
+        two_state = simulator.two_state
+        clock_index = self.clock_xnet.sim_index
+        edge_from, edge_to = (0, 1) if self.clk_edge == EdgeType.Positive else (1, 0)
+        regs: Sequence[Tuple[Any, ...]] = tuple(zip(self.regs, self.reset_value_converters))
+        sensitivity = StaticSensitivity(())
+        sensitivity.xnets = (self.clock_xnet, )
+        while True:
+            yield sensitivity
+            # The clock is the only thing we're sensitive to, so it must have changed
+            previous_value = previous_values[clock_index]
+            value = values[clock_index]
+            value_changes = simulator.current_event.value_changes
+            if previous_value == edge_from and value == edge_to:
+                now = sim_context.now
+                delta = sim_context.delta
+                # Sample all inputs first...
+                new_values = []
+                for (out_index, in_index, reset_index, reset_value_index, reset_value, clock_en_index), convert_reset_value in regs:
+                    if reset_index is not None and values[reset_index] == 1:
+                        new_values.append((out_index, convert_reset_value(values[reset_value_index]) if reset_value_index is not None else reset_value))
+                    elif clock_en_index is None or values[clock_en_index] == 1:
+                        # An input, changing together with the clock results in an unknown value
+                        if last_changed[in_index] == now and last_changed_delta[in_index] == delta:
+                            # In two-state simulation, the value from before the clock edge is used instead
+                            new_values.append((out_index, previous_values[in_index] if two_state else None))
+                        else:
+                            in_value = values[in_index]
+                            if in_value is None:
+                                # Keep the known bits of partially unknown inputs in four-state simulation
+                                in_value = four_state_value(in_index)
+                            new_values.append((out_index, in_value))
+                # ... then update all outputs
+                for out_index, new_value in new_values:
+                    value_changes[out_index] = new_value
+            elif (previous_value != edge_to or value != edge_from) and not two_state:
+                # Undefined clock edge
+                for (out_index, *_), _ in regs:
+                    value_changes[out_index] = None
@@ -24,6 +24,12 @@ are the port prefixes in decreasing priority (i.e. first element is the highest
 priority).
 """
 
+def _create_selector_fifo_if(max_oustanding_responses: int, selector_type: NetType) -> type:
+    selector_fifo_if = type(f"SelectorFifoIf_{max_oustanding_responses}", (ReadyValid,), {})
+    selector_fifo_if.add_member("data", selector_type)
+    selector_fifo_if._type_factory = (_create_selector_fifo_if, (max_oustanding_responses, selector_type))
+    return selector_fifo_if
+
 class GenericRVArbiter(GenericModule):
     clk = ClkPort()
     rst = RstPort()
@@ -113,8 +119,7 @@ class GenericRVArbiter(GenericModule):
         arbitration_order = [client.base_name for client in ordered_clients]
 
         SelectorType = Number(min_val=0, max_val=len(self.clients)-1)
-        SelectorFifoIf = type(f"SelectorFifoIf_{self.max_oustanding_responses}", (ReadyValid,), {})
-        SelectorFifoIf.add_member("data", SelectorType)
+        SelectorFifoIf = _create_selector_fifo_if(self.max_oustanding_responses, SelectorType)
 
         # Create a FIFO for the replies
         selector_fifo_output = Wire(SelectorFifoIf)
@@ -53,6 +53,7 @@ class ReadyValid(Interface):
         except AttributeError:
             raise SyntaxErrorException("To use ReadyValid interfaces, you must create a subclass of ReadyValid")
         cls._data_member_type = type(f"{cls.__name__}.DataMemberStruct", (Struct,), {})
+        cls._data_member_type._type_factory = (cls._get_data_member_type, ())
         for name, (member, _) in cls.members.items():
             if name not in ("ready", "valid"):
                 cls._data_member_type.add_member(name, member)
@@ -0,0 +1,151 @@
+from typing import Dict, List, Optional, NamedTuple, Tuple, Any
+from fnmatch import translate
+import re
+
+from .utils import FQN_DELIMITER
+
+"""
+A hierarchical index of all named nets of an elaborated netlist.
+
+Finding the nets to trace (or capture, or look up while debugging) by name needs the fully qualified
+name of every scope, the names of every XNet in them and whether the scope is named by the user or
+not. Collecting these is expensive for large netlists, so it's done once, the first time the index is
+needed (see Netlist.get_signal_index). The result is a trie of scopes, each with the signals in it.
+
+Signals can be selected by:
+- a regular expression on their name (the way SimulatorContext.dump_signals always worked)
+- a glob pattern on their fully qualified name ('top.u_core.*.data', 'top.**.valid'), which only
+  visits the scopes that can match
+- an exact fully qualified name
+All queries can be limited to a scope depth (the top level is at depth 1).
+"""
+
+class SignalEntry(NamedTuple):
+    seq: int # Entries are numbered in the order of the XNets of the netlist
+    scope_name: str # The fully qualified name of the scope (module instance)
+    name: str
+    xnet: 'XNet'
+    port: 'Junction' # The source of the XNet
+    depth: int
+    is_unnamed_scope: bool
+
+    @property
+    def full_name(self) -> str:
+        return self.scope_name + FQN_DELIMITER + self.name
+
+class _ScopeNode(object):
+    def __init__(self, name: str, depth: int):
+        self.name = name
+        self.depth = depth
+        self.children: Dict[str, '_ScopeNode'] = {}
+        self.entries: List[SignalEntry] = []
+
+_wildcard_chars = re.compile(r"[*?\[]")
+
+class SignalIndex(object):
+    def __init__(self, netlist: 'Netlist'):
+        self.root = _ScopeNode("", 0)
+        self.entries: List[SignalEntry] = []
+        self.entries_by_name: Dict[str, List[SignalEntry]] = {}
+        self._entries_by_full_name: Optional[Dict[str, SignalEntry]] = None
+
+        symbol_table = netlist.symbol_table
+        # Scope names and properties are computed only once per scope, not once for every XNet in them
+        scope_infos: Dict['Module', Tuple[str, _ScopeNode, bool]] = {}
+        for xnet in netlist.xnets:
+            port = xnet.get_source()
+            if port is None:
+                continue
+            if not port.is_specialized():
+                continue
+            for scope, names in xnet.scoped_names.items():
+                scope_info = scope_infos.get(scope, None)
+                if scope_info is None:
+                    scope_name = scope._impl.get_fully_qualified_name()
+                    scope_info = (scope_name, self._get_node(scope_name), symbol_table[scope._impl.parent].is_auto_symbol(scope))
+                    scope_infos[scope] = scope_info
+                scope_name, node, is_unnamed_scope = scope_info
+                for name in names.keys():
+                    entry = SignalEntry(len(self.entries), scope_name, name, xnet, port, node.depth, is_unnamed_scope)
+                    self.entries.append(entry)
+                    node.entries.append(entry)
+                    self.entries_by_name.setdefault(name, []).append(entry)
+
+    def _get_node(self, scope_name: str) -> _ScopeNode:
+        node = self.root
+        for segment in scope_name.split(FQN_DELIMITER):
+            child = node.children.get(segment, None)
+            if child is None:
+                child = _ScopeNode(segment, node.depth + 1)
+                node.children[segment] = child
+            node = child
+        return node
+
+    @staticmethod
+    def _is_selected(entry: SignalEntry, max_depth: Optional[int], add_unnamed_scopes: bool) -> bool:
+        if entry.is_unnamed_scope and not add_unnamed_scopes:
+            return False
+        return max_depth is None or entry.depth <= max_depth
+
+    def match(self, pattern: str = ".", *, max_depth: Optional[int] = None, add_unnamed_scopes: bool = False) -> List[SignalEntry]:
+        """
+        Returns the signals whose name (not including the scope) matches the regular expression 'pattern' (using re.match).
+        """
+        name_filter = re.compile(pattern)
+        selected = []
+        # Every name is matched only once, no matter how many scopes it appears in
+        for name, entries in self.entries_by_name.items():
+            if name_filter.match(name):
+                selected += (entry for entry in entries if self._is_selected(entry, max_depth, add_unnamed_scopes))
+        selected.sort(key=lambda entry: entry.seq)
+        return selected
+
+    def glob(self, pattern: str, *, max_depth: Optional[int] = None, add_unnamed_scopes: bool = False) -> List[SignalEntry]:
+        """
+        Returns the signals whose fully qualified name matches the glob 'pattern'. Segments of the pattern
+        (separated by '.') match one level of the hierarchy each, except for '**', which matches any number of levels.
+        """
+        segments = pattern.split(FQN_DELIMITER)
+        if len(segments) < 2:
+            return []
+        scope_segments = segments[:-1]
+        name_matcher = re.compile(translate(segments[-1])).match
+        selected = []
+        visited = set()
+        # Depth-first walk over (scope, position in the pattern) pairs
+        stack = [(self.root, 0)]
+        while stack:
+            node, position = stack.pop()
+            if (id(node), position) in visited:
+                continue
+            visited.add((id(node), position))
+            if max_depth is not None and node.depth > max_depth:
+                continue
+            if position == len(scope_segments):
+                if node is not self.root:
+                    selected += (entry for entry in node.entries if name_matcher(entry.name) and self._is_selected(entry, max_depth, add_unnamed_scopes))
+                continue
+            segment = scope_segments[position]
+            if segment == "**":
+                # Either done with '**' here, or it eats another level
+                stack.append((node, position + 1))
+                stack.extend((child, position) for child in node.children.values())
+            elif _wildcard_chars.search(segment) is None:
+                child = node.children.get(segment, None)
+                if child is not None:
+                    stack.append((child, position + 1))
+            else:
+                segment_matcher = re.compile(translate(segment)).match
+                stack.extend((child, position + 1) for child in node.children.values() if segment_matcher(child.name))
+        selected.sort(key=lambda entry: entry.seq)
+        return selected
+
+    def lookup(self, full_name: str) -> Optional[SignalEntry]:
+        """
+        Returns the signal with the fully qualified name 'full_name', or None if there's no such signal.
+        """
+        if self._entries_by_full_name is None:
+            self._entries_by_full_name = {}
+            for entry in self.entries:
+                self._entries_by_full_name.setdefault(entry.full_name, entry)
+        return self._entries_by_full_name.get(full_name, None)
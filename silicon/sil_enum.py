@@ -3,7 +3,7 @@ from enum import Enum, EnumMeta
 from typing import Tuple, Union, Optional, Any, Sequence, Generator
 from .net_type import NetType
 from .port import is_junction_base
-from .utils import first, TSimEvent, Context
+from .utils import first, TSimEvent, StaticSensitivity, Context
 from .exceptions import SimulationException, SyntaxErrorException, AdaptTypeError
 from .netlist import Netlist
 from .module import Module, InlineBlock, InlineExpression, inline_statement_from_expression
@@ -131,8 +131,9 @@ class EnumNet(Number):
                     yield inline_statement_from_expression(back_end, target_namespace, ret_val, self.output_port)
 
             def simulate(self) -> TSimEvent:
+                sensitivity = StaticSensitivity(self.input_port)
                 while True:
-                    yield self.input_port
+                    yield sensitivity
                     if self.input_port.sim_value is None:
                         self.output_port <<= None
                     else:
@@ -0,0 +1,118 @@
+from typing import Any, Callable
+import os
+import sys
+import pickle
+import traceback
+
+from .exceptions import SimulationException
+
+"""
+Snapshots of a running simulation, to run several variants of a test from the same (warmed-up) state.
+
+The simulation state is not just the values of the XNets: pending events, memory contents and most of all
+the local variables of every 'simulate' generator are part of it, and generators can't be copied or
+pickled. So snapshots rely on the operating system instead: SimSnapshot.run forks the process and runs
+the variant in the child, while the parent, which is still at the point where the snapshot was taken,
+waits for the result. This needs os.fork, so snapshots are only available on Unix-like systems.
+
+    with Simulator(netlist, None) as context:
+        context.simulate(1000) # reset and configuration
+        snapshot = context.snapshot()
+        for mode in modes:
+            results[mode] = snapshot.run(run_test, mode)
+
+In the child, tracing starts out off: call 'start_tracing' and 'dump_signals' to get a trace of the variant.
+Captures (see wave_capture.py) keep recording in the child, but their content doesn't make it back to the
+parent: return whatever is needed from the variant.
+"""
+
+class SimSnapshot(object):
+    """
+    The state of a simulation at a point in time. Created by SimulatorContext.snapshot.
+    """
+    def __init__(self, sim_context: 'Simulator.SimulatorContext'):
+        if not hasattr(os, "fork"):
+            raise SimulationException(f"Simulation snapshots need os.fork, which is not available on this system")
+        self.sim_context = sim_context
+        self.when = sim_context.now
+
+    def _check_current(self) -> None:
+        # Every tick advances simulation time, so the state only stayed the same if the time did
+        sim_context = self.sim_context
+        if sim_context.simulator.context is not sim_context or sim_context.now != self.when:
+            raise SimulationException(f"Simulation snapshot taken at {self.when} is no longer current")
+
+    def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Calls func(sim_context, *args, **kwargs) in a copy of the simulation as it was when the snapshot was taken,
+        and returns its result. Exceptions are re-raised. Both the result and the exception must be picklable.
+        """
+        self._check_current()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            self._run_child(write_fd, func, args, kwargs)
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as pipe:
+            message = pipe.read()
+        _, status = os.waitpid(pid, 0)
+        if len(message) == 0:
+            raise SimulationException(f"Simulation variant terminated without a result (exit status: {status})")
+        kind, payload, trace = pickle.loads(message)
+        if kind == "error":
+            if payload is None:
+                raise SimulationException(f"Simulation variant raised an exception:\n{trace}")
+            raise payload
+        return payload
+
+    def _run_child(self, write_fd: int, func: Callable, args: tuple, kwargs: dict) -> None:
+        """
+        Runs in the forked process. Never returns: the child must not continue with the code after the snapshot.
+        """
+        exit_code = 0
+        try:
+            sim_context = self.sim_context
+            opened_stream_cnt = len(sim_context.simulator.opened_vcd_streams)
+            self._reset_tracing()
+            try:
+                try:
+                    result = ("ok", func(sim_context, *args, **kwargs), None)
+                except BaseException as ex:
+                    result = ("error", ex, traceback.format_exc())
+                # The trace of the variant (if any) is finished here, as the simulator is never exited in the child
+                if sim_context.vcd_writer is not None:
+                    sim_context._done()
+            finally:
+                for vcd_stream in sim_context.simulator.opened_vcd_streams[opened_stream_cnt:]:
+                    vcd_stream.close()
+            try:
+                message = pickle.dumps(result)
+            except Exception as ex:
+                kind, payload, trace = result
+                if kind == "ok":
+                    trace = f"The result of the variant can't be pickled: {ex}"
+                message = pickle.dumps(("error", None, trace))
+            with os.fdopen(write_fd, "wb") as pipe:
+                pipe.write(message)
+        except BaseException:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(exit_code)
+
+    def _reset_tracing(self) -> None:
+        # The trace file belongs to the parent: the child doesn't write to it, nor (as it never exits the simulator) closes it
+        sim_context = self.sim_context
+        sim_context.vcd_writer = None
+        sim_context.trace_sink = None
+        sim_context.trace_control = None
+        state_store = sim_context.state_store
+        state_store.vcd_vars = {}
+        state_store.vcd_converters = {}
+        state_store.recording = True
+        state_store._update_set_value()
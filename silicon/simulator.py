@@ -1,13 +1,17 @@
-from typing import Optional, List, Set, Dict, Tuple, Callable, Generator, IO, Union, Iterable, Any, Generator
+from typing import Optional, List, Set, Dict, Tuple, Callable, Generator, IO, Union, Iterable, Any, Generator, Sequence
 from .module import Module
 from vcd import VCDWriter
 from .netlist import Netlist, XNet
 from .ordered_set import OrderedSet
 from collections import OrderedDict
-from .port import is_junction_base
-from .utils import Context, raise_for_caller, profile
+from itertools import chain
+from .port import is_junction_base, EdgeType
+from .utils import Context, raise_for_caller, profile, StaticSensitivity
 from .exceptions import SimulationException, SyntaxErrorException
+from .timeline import Timeline, HeapTimeline
+from .four_state import XValue
 from pathlib import Path
+import sys
 
 """
 A discrete time simulator for Silicon
@@ -33,90 +37,376 @@ def debug_print(*args, **kwargs):
     #print(*args, **kwargs)
     pass
 
-class SimXNetState(object):
+class SimStateStore(object):
     """
-    A state object to be attached to each XNet in the system during simulation.
+    The simulation state of all XNets in the system.
+
+    XNets are numbered densely (XNet.sim_index) when the simulation starts. The state is stored in
+    parallel arrays, indexed by that number. This is a lot more compact than having a state object
+    (with its own listener set, sensitivity list, VCD variables, etc.) for every XNet.
+
+    Dynamic listeners (the ones generators wait on by yielding ports) are kept in sets which are
+    only allocated for XNets that ever had a listener. Static listeners (see StaticSensitivity) are
+    kept in a compressed (CSR) fan-out table: the listeners of XNet 'i' are
+    static_fanout[static_fanout_offsets[i]:static_fanout_offsets[i+1]].
+    Static listeners with a wake filter are kept separately (filtered_fanout), these are only
+    resumed if their filter says so. Static listeners that come and go while the simulation runs
+    thaw the table; it is rebuilt once, before the next value change.
     """
-    def __init__(self, sim_context: 'Simulator.SimulatorContext', parent_xnet: XNet):
-        self.listeners: Set[Generator] = set() # All the modules that registered to get call-backs on value-change of this port
-        net_type = parent_xnet.get_net_type()
-        self.value: Any = net_type.get_unconnected_sim_value() if net_type is not None else None
-        self.previous_value: Any = None # Previous value
-        self.sim_context: 'Simulator.SimulatorContext' = sim_context
-        self.parent_xnet = parent_xnet
-        self.vcd_vars = []
-        self._last_changed = None
-        self._last_changed_delta = None
-        self._vcd_value_converter = None
-        self.value_validator = net_type.validate_sim_value if net_type is not None else (lambda x, y: x)
-
-    def add_listener(self, listener: Generator) -> None:
-        self.listeners.add(listener)
-
-    def is_edge(self) -> bool:
+    def __init__(self, sim_context: 'Simulator.SimulatorContext', xnets: Sequence[XNet]):
+        from .net_type import NetType
+
+        self.sim_context = sim_context
+        self.xnets: Tuple[XNet] = tuple(xnets)
+        xnet_cnt = len(self.xnets)
+        self.values: List[Any] = [None] * xnet_cnt
+        self.previous_values: List[Any] = [None] * xnet_cnt
+        self.last_changed: List[Optional[int]] = [None] * xnet_cnt
+        self.last_changed_delta: List[Optional[int]] = [None] * xnet_cnt
+        self.listeners: List[Optional[Set[Generator]]] = [None] * xnet_cnt
+        self.validators: List[Optional[Callable]] = [None] * xnet_cnt # None for net types that don't validate their values
+        self.vcd_vars: Dict[int, List[Any]] = {} # Only XNets that are dumped have an entry
+        self.vcd_converters: Dict[int, Callable] = {}
+        self.recorders: Dict[int, List[Callable[[int, Any], None]]] = {} # Only XNets that are captured (see wave_capture.py) have an entry
+        self.recording = True # If cleared, changes of dumped XNets are not recorded (see trace_control.py)
+        self.static_fanout_offsets: List[int] = [0] * (xnet_cnt + 1)
+        self.static_fanout: List[Generator] = []
+        # While the simulation is set up, static listeners are collected here. 'freeze_static_fanout' turns them into the CSR table
+        self._static_listeners: Optional[Dict[int, List[Generator]]] = {}
+        self.filtered_fanout: Dict[int, List[Tuple[Generator, Callable[[], bool]]]] = {} # Only XNets with filtered listeners have an entry
+
+        for index, xnet in enumerate(self.xnets):
+            xnet.sim_index = index
+            net_type = xnet.get_net_type()
+            if net_type is not None:
+                self.values[index] = net_type.get_unconnected_sim_value()
+                if net_type.validate_sim_value.__func__ is not NetType.validate_sim_value.__func__:
+                    self.validators[index] = net_type.validate_sim_value
+
+    def add_listener(self, index: int, listener: Generator) -> None:
+        listeners = self.listeners[index]
+        if listeners is None:
+            listeners = set()
+            self.listeners[index] = listeners
+        listeners.add(listener)
+
+    def add_static_listener(self, index: int, listener: Generator, wake_filter: Optional[Callable[[], bool]] = None) -> None:
+        if wake_filter is not None:
+            self.filtered_fanout.setdefault(index, []).append((listener, wake_filter))
+            return
+        if self._static_listeners is None:
+            self._thaw_static_fanout()
+        self._static_listeners.setdefault(index, []).append(listener)
+
+    def remove_static_listener(self, index: int, listener: Generator) -> None:
+        filtered_listeners = self.filtered_fanout.get(index, None)
+        if filtered_listeners is not None:
+            for entry in filtered_listeners:
+                if entry[0] is listener:
+                    filtered_listeners.remove(entry)
+                    if len(filtered_listeners) == 0:
+                        del self.filtered_fanout[index]
+                    return
+        if self._static_listeners is None:
+            self._thaw_static_fanout()
+        self._static_listeners[index].remove(listener)
+
+    def freeze_static_fanout(self) -> None:
         """
-        Returns True if there is a change on the port at the current moment in the simulation.
+        Builds the CSR fan-out table from the static listeners registered so far.
+        Listeners added or removed after this call thaw the table again: it's rebuilt on the next value change.
         """
-        ret_val = self._last_changed == self.sim_context.now and self._last_changed_delta == self.sim_context.delta
-        return ret_val
+        static_listeners = self._static_listeners
+        if static_listeners is None:
+            return
+        offsets = self.static_fanout_offsets
+        fanout = []
+        for index in range(len(self.xnets)):
+            offsets[index] = len(fanout)
+            fanout += static_listeners.get(index, ())
+        offsets[len(self.xnets)] = len(fanout)
+        self.static_fanout = fanout
+        self._static_listeners = None
+        self._update_set_value()
+
+    def _thaw_static_fanout(self) -> None:
+        offsets = self.static_fanout_offsets
+        fanout = self.static_fanout
+        self._static_listeners = {index: fanout[offsets[index]:offsets[index+1]] for index in range(len(self.xnets)) if offsets[index] != offsets[index+1]}
+        self._update_set_value()
+
+    def add_vcd_var(self, index: int, vcd_var: Any) -> None:
+        self.vcd_vars.setdefault(index, []).append(vcd_var)
+        self._update_set_value()
+
+    def add_recorder(self, index: int, recorder: Callable[[int, Any], None]) -> None:
+        """
+        Registers a callback that gets the time and the new value of every change of an XNet.
+        """
+        self.recorders.setdefault(index, []).append(recorder)
+        self._update_set_value()
+
+    def set_recording(self, recording: bool) -> None:
+        self.recording = recording
+        self._update_set_value()
+
+    def _update_set_value(self) -> None:
+        # Until the first net is traced, value changes go through the plain 'set_value' without any tracing hooks.
+        # While the static fan-out table is thawed (see freeze_static_fanout), the first value change rebuilds it.
+        if self._static_listeners is not None:
+            self.set_value = self._set_value_after_fanout_change
+        elif (self.recording and len(self.vcd_vars) > 0) or len(self.recorders) > 0:
+            self.set_value = self._set_value_and_record
+        elif "set_value" in self.__dict__:
+            del self.set_value
+
+    def get_vcd_values(self) -> Generator[Tuple[Any, Any], None, None]:
+        """
+        Yields every VCD variable with the current value of its XNet
+        """
+        for index, vcd_vars in self.vcd_vars.items():
+            vcd_val = self.xnets[index].get_net_type().convert_to_vcd_type(self._get_vcd_value(index))
+            for vcd_var in vcd_vars:
+                yield vcd_var, vcd_val
+
+    def is_edge(self, index: int) -> bool:
+        """
+        Returns True if there is a change on the XNet at the current moment in the simulation.
+        """
+        return self.last_changed[index] == self.sim_context.now and self.last_changed_delta[index] == self.sim_context.delta
 
-    def set_value(self, new_value: Any, now: int, delta: int) -> None:
-        #print(f"--- at {self.sim_context.now} {self.parent_xnet.get_diagnostic_name(self.sim_context.netlist)} setting value from {self.previous_value} to {new_value}, last changed at {self._last_changed}")
-        #assert self._last_changed != self.sim_context.now, "Combinational loop detected???"
+    def get_four_state_value(self, index: int) -> Any:
+        """
+        Returns the value of an XNet. In four-state simulation, unknown values of integer XNets are returned as XValue objects, not None.
+        """
+        return self.values[index]
 
-        new_value = self.value_validator(new_value, self.parent_xnet.get_source())
+    def set_value(self, index: int, new_value: Any, now: int, delta: int) -> bool:
+        """
+        Updates the value of an XNet and wakes up its listeners. Returns True if the value changed.
+        """
+        validator = self.validators[index]
+        if validator is not None:
+            new_value = validator(new_value, self.xnets[index].get_source())
+        old_value = self.values[index]
         # We have to be careful here: operator != might not do what we think it should, especially if one of the values is None.
         # It really is the simulation implementation of the != operation, not a simulation value comparison.
         # For complex sim values (Number.NetValue), there's a special method provided to check for value changes.
         # We will revert back to != only if such lookup fails.
-        try:
-            changed = self.value.is_different(new_value)
-        except AttributeError:
+        # Integer nets store raw ints (or None for X), which can be compared directly.
+        if old_value.__class__ is int and new_value.__class__ is int:
+            changed = old_value != new_value
+        elif old_value is None or new_value is None:
+            changed = old_value is not new_value
+        else:
             try:
-                changed = new_value.is_different(self.value)
+                changed = old_value.is_different(new_value)
             except AttributeError:
-                changed = self.value != new_value
+                try:
+                    changed = new_value.is_different(old_value)
+                except AttributeError:
+                    changed = old_value != new_value
 
         if changed:
-            if self._last_changed != now:
-                self.previous_value = self.value
-            self.value = new_value
-            self._last_changed = now
-            self._last_changed_delta = delta
-            self.record_change(now)
-
-            for listener in self.listeners:
+            self._change_value(index, old_value, new_value, now, delta)
+        return changed
+
+    def _change_value(self, index: int, old_value: Any, new_value: Any, now: int, delta: int) -> None:
+        """
+        Stores a new (different) value for an XNet and wakes up its listeners.
+        """
+        if self.last_changed[index] != now:
+            self.previous_values[index] = old_value
+        self.values[index] = new_value
+        self.last_changed[index] = now
+        self.last_changed_delta[index] = delta
+
+        current_event = self.sim_context.simulator.current_event
+        listeners = self.listeners[index]
+        if listeners:
+            for listener in listeners:
                 # Inlining schedule_generator
-                #self.sim_context.schedule_generator(listener) # Schedule the action on all the modules that registered to this value change
-                self.sim_context.simulator.current_event.add_generator(listener)
-            self.listeners.clear()
-
-    def get_last_changed(self) -> Optional[int]:
-        return self._last_changed
-
-    def record_change(self, when: int):
-        if self._vcd_value_converter is None:
-            self._vcd_value_converter = self.parent_xnet.get_net_type().convert_to_vcd_type
-        vcd_val = self._vcd_value_converter(self.value)
-        writer = self.sim_context.vcd_writer
-        for vcd_var in self.vcd_vars:
+                current_event.add_generator(listener)
+            listeners.clear()
+        offsets = self.static_fanout_offsets
+        first = offsets[index]
+        last = offsets[index+1]
+        if first != last:
+            for listener in self.static_fanout[first:last]:
+                current_event.add_generator(listener)
+        if index in self.filtered_fanout:
+            for listener, wake_filter in self.filtered_fanout[index]:
+                current_event.add_filtered_generator(listener, wake_filter)
+
+    def _set_value_after_fanout_change(self, index: int, new_value: Any, now: int, delta: int) -> bool:
+        """
+        The version of 'set_value' that is used while the static fan-out table is thawed
+        """
+        # Callers might hold on to this method for a whole delta cycle: only the first call rebuilds the table
+        self.freeze_static_fanout()
+        return self.set_value(index, new_value, now, delta)
+
+    def _set_value_and_record(self, index: int, new_value: Any, now: int, delta: int) -> bool:
+        """
+        The version of 'set_value' that is used once tracing is enabled for any of the XNets
+        """
+        changed = self.__class__.set_value(self, index, new_value, now, delta)
+        if changed:
+            if self.recording and index in self.vcd_vars:
+                self.record_change(index, now)
+            recorders = self.recorders.get(index, None)
+            if recorders is not None:
+                value = self.values[index]
+                for recorder in recorders:
+                    recorder(now, value)
+        return changed
+
+    def record_change(self, index: int, when: int) -> None:
+        vcd_vars = self.vcd_vars.get(index, None)
+        if vcd_vars is None:
+            return
+        vcd_value_converter = self.vcd_converters.get(index, None)
+        if vcd_value_converter is None:
+            vcd_value_converter = self.xnets[index].get_net_type().convert_to_vcd_type
+            self.vcd_converters[index] = vcd_value_converter
+        vcd_val = vcd_value_converter(self._get_vcd_value(index))
+        writer = self.sim_context.trace_sink
+        for vcd_var in vcd_vars:
             writer.change(vcd_var, when, vcd_val)
 
+    def _get_vcd_value(self, index: int) -> Any:
+        return self.values[index]
+
+class FourStateStore(SimStateStore):
+    """
+    A state store that keeps track of individual unknown bits of integer XNets (see four_state.py).
+
+    'values' holds the same as in SimStateStore: None for any XNet with unknown bits, so code that
+    is not aware of four-state values sees the same as in normal simulation. The known bits of
+    these XNets are kept in 'x_values'.
+    """
+    def __init__(self, sim_context: 'Simulator.SimulatorContext', xnets: Sequence[XNet]):
+        from .number import is_number
+
+        super().__init__(sim_context, xnets)
+        # The fully unknown value of every integer XNet, None for all other net types
+        self.unknown_values: List[Optional[XValue]] = [None] * len(self.xnets)
+        for index, xnet in enumerate(self.xnets):
+            net_type = xnet.get_net_type()
+            if net_type is not None and is_number(net_type) and net_type.precision == 0:
+                self.unknown_values[index] = XValue(0, (1 << net_type.get_num_bits()) - 1)
+        # The value of every XNet with unknown bits. Only valid if the entry in 'values' is None
+        self.x_values: List[Optional[XValue]] = list(self.unknown_values)
+
+    def get_four_state_value(self, index: int) -> Any:
+        value = self.values[index]
+        if value is None:
+            return self.x_values[index]
+        return value
+
+    def set_value(self, index: int, new_value: Any, now: int, delta: int) -> bool:
+        unknown_value = self.unknown_values[index]
+        if new_value.__class__ is XValue:
+            if unknown_value is None or new_value.x_mask & unknown_value.x_mask == unknown_value.x_mask:
+                new_value = None
+        if new_value is None:
+            new_value = unknown_value
+        elif new_value.__class__ is not XValue:
+            return super().set_value(index, new_value, now, delta)
+        # The new value has unknown bits
+        if self.values[index] is not None:
+            self.x_values[index] = new_value
+            return super().set_value(index, None, now, delta)
+        old_value = self.x_values[index]
+        if old_value is new_value or (old_value is not None and not old_value.is_different(new_value)):
+            return False
+        # Only the known bits changed: SimStateStore.set_value wouldn't notice that, 'values' stays None either way
+        self.x_values[index] = new_value
+        self._change_value(index, None, None, now, delta)
+        return True
+
+    def _get_vcd_value(self, index: int) -> Any:
+        value = self.values[index]
+        if value is None:
+            x_value = self.x_values[index]
+            # Fully unknown values are dumped the same way as in normal simulation
+            if x_value is not self.unknown_values[index]:
+                return x_value
+        return value
+
+class TwoStateStore(SimStateStore):
+    """
+    A state store for two-state simulation, where no XNet is ever unknown.
+
+    Every XNet starts out with the default value of its type (NetType.get_default_sim_value) instead
+    of None, and assigning None to an XNet is an error. This lets primitives use evaluation functions
+    that don't check for unknown inputs (see Simulator.two_state).
+    """
+    def __init__(self, sim_context: 'Simulator.SimulatorContext', xnets: Sequence[XNet]):
+        super().__init__(sim_context, xnets)
+        for index, xnet in enumerate(self.xnets):
+            net_type = xnet.get_net_type()
+            if net_type is None:
+                continue
+            try:
+                default_value = net_type.get_default_sim_value()
+            except NotImplementedError:
+                continue
+            validator = self.validators[index]
+            if validator is not None and default_value is not None:
+                default_value = validator(default_value, xnet.get_source())
+            self.values[index] = default_value
+        # Types without a default value (such as constants) are allowed to stay None
+        self.default_values: Tuple[Any] = tuple(self.values)
+        self.previous_values = list(self.values)
+
+    def set_value(self, index: int, new_value: Any, now: int, delta: int) -> bool:
+        validator = self.validators[index]
+        if validator is not None:
+            new_value = validator(new_value, self.xnets[index].get_source())
+        if new_value is None and self.default_values[index] is not None:
+            source = self.xnets[index].get_source()
+            raise SimulationException("Can't assign an unknown (None) value to a net in two-state simulation", source)
+        old_value = self.values[index]
+        # Without unknown values, the None special-casing of SimStateStore.set_value is not needed
+        if old_value.__class__ is int and new_value.__class__ is int:
+            changed = old_value != new_value
+        else:
+            try:
+                changed = old_value.is_different(new_value)
+            except AttributeError:
+                try:
+                    changed = new_value.is_different(old_value)
+                except AttributeError:
+                    changed = old_value != new_value
+
+        if changed:
+            self._change_value(index, old_value, new_value, now, delta)
+        return changed
+
 
 
 class Simulator(object):
     @staticmethod
     def _process_yield(generator: Generator, yielded_value: Any, sim_context: 'SimulatorContext', now: int) -> None:
         if isinstance(yielded_value, int):
+            if generator in sim_context.static_sensitivities:
+                raise SimulationException(f"The simulate method can't yield anything after it yielded a StaticSensitivity")
             next_trigger_time = now + yielded_value
             sim_context.schedule_generator(generator, next_trigger_time)
+        elif yielded_value.__class__ is StaticSensitivity:
+            # The common case is that the generator yields the same object again, in which case we're already registered
+            if sim_context.static_sensitivities.get(generator, None) is not yielded_value:
+                sim_context.add_static_sensitivity(generator, yielded_value)
         else:
+            if generator in sim_context.static_sensitivities:
+                raise SimulationException(f"The simulate method can't yield anything after it yielded a StaticSensitivity")
             # for speed-up purposes, relax the checks and unroll some code:
             # 1. Instead of checking for exact types, check simply for '_xnet' being an attribute
             # 2. Don't double-check these, once for creating the tuple from a single value, then when iterating the same tuple
             if is_junction_base(yielded_value):
                 xnet = sim_context.netlist.get_xnet_for_junction(yielded_value)
-                xnet.sim_state.add_listener(generator)
+                sim_context.state_store.add_listener(xnet.sim_index, generator)
             else:
                 try:
                     for port in yielded_value:
@@ -124,7 +414,7 @@ class Simulator(object):
                             if member_port.is_composite():
                                 continue
                             xnet = sim_context.netlist.get_xnet_for_junction(member_port)
-                            xnet.sim_state.add_listener(generator)
+                            sim_context.state_store.add_listener(xnet.sim_index, generator)
                 except TypeError:
                     raise SimulationException(f"The simulate method can only yield an integer, a Port or a sequence of Port objects. The type of the yielded value is {type(port)}", port)
 
@@ -138,24 +428,27 @@ class Simulator(object):
         the amount of churn in XNet value updates and make the simulation that much faster.
         """
         def __init__(self, when: int, sim_context: 'SimulatorContext'):
-            self.max_rank = len(sim_context.simulator.netlist.rank_list)
-            self.value_changes: Dict[XNet, Any] = OrderedDict()
+            self.max_rank = sim_context.rank_count
+            self.value_changes: Dict[int, Any] = {} # Maps XNet.sim_index to the new value
             self.when = when
-            self.rank_map = sim_context.simulator.netlist.rank_map
+            self.generator_ranks = sim_context.generator_ranks
 
             self.generators = []
+            self.filtered_generators: List[List[Tuple[Generator, Callable[[], bool]]]] = [] # Woken up generators (by rank), whose wake filter is not called yet
             for _ in range(self.max_rank):
                 self.generators.append(set())
+                self.filtered_generators.append([])
 
         def add_generator(self, generator: Generator) -> None:
-            module = generator.gi_frame.f_locals['self'] # Limitation: We must have a 'self' in the generator params. Else: KeyError is raised
-            module_rank = self.rank_map[module]
-            # Disabling assert for perf reasons...
-            #assert module_rank == 0 or module.is_combinational()
-            self.generators[module_rank].add(generator)
+            # Every generator is registered with the rank of its module in SimulatorContext._setup
+            self.generators[self.generator_ranks[generator]].add(generator)
+
+        def add_filtered_generator(self, generator: Generator, wake_filter: Callable[[], bool]) -> None:
+            # The filter is called right before the generator would run, so it sees the same state the generator would
+            self.filtered_generators[self.generator_ranks[generator]].append((generator, wake_filter))
 
         def add_value_change(self, xnet: XNet, value: Any) -> None:
-            self.value_changes[xnet] = value
+            self.value_changes[xnet.sim_index] = value
 
         def trigger(self, sim_context: 'SimulatorContext', now: int) -> None:
             netlist = sim_context.simulator.netlist
@@ -164,9 +457,10 @@ class Simulator(object):
 
             sim_context.reset_delta()
 
-            for xnet, value in self.value_changes.items():
-                xnet.sim_state.set_value(value, now, sim_context.delta)
-            self.value_changes = OrderedDict()
+            set_value = sim_context.state_store.set_value
+            for index, value in self.value_changes.items():
+                set_value(index, value, now, sim_context.delta)
+            self.value_changes = {}
 
             # Sort the generators into two groups: ones that belong to combinational modules and ones that are not.
             # Then, we do the following in a loop:
@@ -184,6 +478,12 @@ class Simulator(object):
                     # As such, we can't clear the set after-the-fact. We have to replace it with an empty set
                     # before entering the for loop below
                     self.generators[current_rank] = set()
+                    filtered_generators = self.filtered_generators[current_rank]
+                    if filtered_generators:
+                        self.filtered_generators[current_rank] = []
+                        for generator, wake_filter in filtered_generators:
+                            if wake_filter():
+                                generators_in_rank.add(generator)
                     for generator in generators_in_rank:
                         #debug_print(f"--- CG: {generator.gi_frame.f_locals['self']}")
                         try:
@@ -193,23 +493,42 @@ class Simulator(object):
                             # FIXME: the generator could be sitting in several other sensitivity lists and can still be called again.
                             #        We should go through all sensitivity lists and prune them from this generator.
                             #        That is expensive though without some more thinking but luckily it doesn't happen all that often.
-                            pass # The generator decided not to yield again: simply don't schedule it
+                            #        Static sensitivity lists are known though, so those we can clean up.
+                            sim_context.remove_static_sensitivity(generator)
                     # The previous loop re-populated value_changes with new things, so let's apply those changes (which will trigger a bunch of listeners, added to the generators)
-                    for xnet, value in self.value_changes.items():
-                        xnet.sim_state.set_value(value,now, sim_context.delta+1)
-                    self.value_changes = OrderedDict()
-                if len(self.generators[0]) == 0:
+                    value_changes = self.value_changes
+                    self.value_changes = {}
+                    # Generators might have turned tracing on, which changes 'set_value'
+                    set_value = sim_context.state_store.set_value
+                    for index, value in value_changes.items():
+                        set_value(index, value, now, sim_context.delta+1)
+                if len(self.generators[0]) == 0 and len(self.filtered_generators[0]) == 0:
                     break
                 sim_context.inc_delta()
-            assert sum(len(p) for p in self.generators) == 0
+            assert sum(len(p) for p in self.generators) == 0 and sum(len(p) for p in self.filtered_generators) == 0
 
     class SimulatorContext(object):
-        def __init__(self, simulator: 'Simulator', vcd_stream: IO, timescale: str):
-            from .utils import FQN_DELIMITER
-
+        def __init__(self, simulator: 'Simulator', vcd_stream: Optional[IO], timescale: str):
             self.simulator = simulator
-            self.vcd_writer = VCDWriter(vcd_stream, timescale=timescale, scope_sep=FQN_DELIMITER)
+            self.timescale = timescale
+            self.vcd_writer: Optional[VCDWriter] = None # Stays None if tracing is off
+            self.trace_sink: Optional[Any] = None # Where value changes are recorded: normally 'vcd_writer', but it can be a history buffer (see trace_control.py)
+            self.trace_control: Optional['TraceControl'] = None # Only created if tracing is limited to time windows
+            if vcd_stream is not None:
+                self._create_vcd_writer(vcd_stream, simulator._get_trace_format(simulator.vcd_file))
             self.netlist = simulator.netlist # Cache the netlist object
+            self.generator_ranks: Dict[Generator, int] = {} # Maps every generator to the rank of the module it simulates
+            self.static_sensitivities: Dict[Generator, StaticSensitivity] = {} # Permanent sensitivity lists for generators that declared one
+            self.activation_counts: Dict[Module, int] = {} # Number of times the simulator woke up the modules that keep count (such as registers)
+            self.state_store: Optional[SimStateStore] = None # Created in _setup
+            self.cones: Sequence['Cone'] = () # Combinational cones that are evaluated by compiled code instead of their member modules
+            self.register_banks: Dict[Tuple[XNet, EdgeType], 'RegisterBank'] = {} # Registers that are simulated together, by clock XNet and edge
+            self.rank_map: Dict[Module, int] = self.netlist.rank_map
+            self.rank_count = len(self.netlist.rank_list)
+            if simulator.compile_cones:
+                from .cone_compiler import ConeCompiler
+                self.cones, self.rank_map = ConeCompiler(self.netlist).compile()
+                self.rank_count = max(chain(self.rank_map.values(), (cone.rank for cone in self.cones)), default=0) + 1
             self._last_now = None
             self._delta = 0
 
@@ -219,53 +538,202 @@ class Simulator(object):
             This is needed because we call 'simulate' functions of modules
             here and so we want 'active_context' to be set up properly
             """
-            for xnet in self.simulator.netlist.xnets:
-                xnet.sim_state = SimXNetState(self, xnet)
+            self.state_store = self._create_state_store(self.simulator.netlist.xnets)
+            self.netlist._add_simulation(self)
 
             # Schedule an event to call all 'simulate' methods. This will start the simulation.
+            from inspect import isgenerator
+            from .primitives import GenericReg
+            from .register_bank import RegisterBank
+            rank_map = self.rank_map
+            bank_registers = self.simulator.bank_registers
+            # In two-state simulation XNets start with their default value, not None. Combinational logic
+            # has to be evaluated once, otherwise outputs of logic with constant inputs would never be set.
+            initial_generators = [] if self.simulator.two_state else None
             for module in self.simulator.netlist.modules:
+                # Synchronous registers are simulated by the bank of their clock, if banking is enabled
+                if bank_registers and isinstance(module, GenericReg) and (module.sync_reset or not module.reset_port.has_driver()):
+                    clock_xnet = self.netlist.get_xnet_for_junction(module.clock_port)
+                    bank = self.register_banks.get((clock_xnet, module.clk_edge), None)
+                    if bank is None:
+                        bank = RegisterBank(clock_xnet, module.clk_edge)
+                        self.register_banks[(clock_xnet, module.clk_edge)] = bank
+                    bank.add_reg(self.netlist, module)
+                    continue
                 # We extract all generators from the 'simulate' methods and run them to the first yield.
                 # This means that:
                 # - All xnets have a sim value of None
                 # - These generators can schedule value-changes to time 0 or otherwise
                 # - Most importantly they return their sensitivity list (or delayed schedule time) so we can
                 #   put them on the appropriate xnet sensitivity list or event trigger list.
-                if hasattr(module, "simulate"):
+                # Modules that got compiled into a cone are simulated by the cone
+                if hasattr(module, "simulate") and module in rank_map:
                     try:
                         generator = module.simulate(self.simulator)
                     except TypeError:
                         generator = module.simulate()
 
-                    from inspect import isgenerator
                     if isgenerator(generator):
+                        # Disabling assert for perf reasons...
+                        #assert rank_map[module] == 0 or module.is_combinational()
+                        self.generator_ranks[generator] = rank_map[module]
                         try:
                             sensitivity_list = generator.send(None)
                         except StopIteration:
                             continue
                         Simulator._process_yield(generator, sensitivity_list, self, 0)
+                        if initial_generators is not None and module.is_combinational():
+                            initial_generators.append(generator)
+            for cone in self.cones:
+                generator = cone.simulate(self)
+                self.generator_ranks[generator] = cone.rank
+                sensitivity_list = generator.send(None)
+                Simulator._process_yield(generator, sensitivity_list, self, 0)
+                if initial_generators is not None:
+                    initial_generators.append(generator)
+            for bank in self.register_banks.values():
+                generator = bank.simulate(self)
+                self.generator_ranks[generator] = 0 # Registers are always at rank 0
+                sensitivity_list = generator.send(None)
+                Simulator._process_yield(generator, sensitivity_list, self, 0)
+            self.state_store.freeze_static_fanout()
+            if initial_generators is not None:
+                for generator in initial_generators:
+                    self.simulator.current_event.add_generator(generator)
+
+        def _create_state_store(self, xnets: Sequence[XNet]) -> SimStateStore:
+            if self.simulator.four_state:
+                return FourStateStore(self, xnets)
+            if self.simulator.two_state:
+                return TwoStateStore(self, xnets)
+            return SimStateStore(self, xnets)
+
+        def add_static_sensitivity(self, generator: Generator, sensitivity: StaticSensitivity) -> None:
+            """
+            Called (through Simulator._process_yield) the first time a generator yields a StaticSensitivity.
+            Puts the generator permanently on the fan-out list of every XNet in the sensitivity list.
+            """
+            if generator in self.static_sensitivities:
+                raise SimulationException(f"The simulate method must always yield the same StaticSensitivity object")
+            if sensitivity.xnets is None:
+                xnets = OrderedSet()
+                for port in sensitivity.ports:
+                    for member_port in port.get_all_member_junctions(add_self=True):
+                        if member_port.is_composite():
+                            continue
+                        xnets.add(self.netlist.get_xnet_for_junction(member_port))
+                sensitivity.xnets = tuple(xnets)
+            for xnet in sensitivity.xnets:
+                self.state_store.add_static_listener(xnet.sim_index, generator, sensitivity.wake_filter)
+            self.static_sensitivities[generator] = sensitivity
+
+        def remove_static_sensitivity(self, generator: Generator) -> None:
+            sensitivity = self.static_sensitivities.pop(generator, None)
+            if sensitivity is None:
+                return
+            for xnet in sensitivity.xnets:
+                self.state_store.remove_static_listener(xnet.sim_index, generator)
+
+        def get_activation_counts(self) -> Dict[Module, int]:
+            """
+            Returns the number of times the simulator woke up each module that keeps count (such as registers).
+            """
+            return dict(self.activation_counts)
 
-        def dump_signals(self, signal_pattern: str = ".", add_unnamed_scopes: bool = False) -> None:
+        def _create_vcd_writer(self, vcd_stream: IO, trace_format: str) -> None:
             from .utils import FQN_DELIMITER
-            from re import compile
-            filter = compile(signal_pattern)
-            for xnet in self.simulator.netlist.xnets:
-                port = xnet.get_source() #if xnet.get_source() is not None else first(xnet._sinks)
-                if port is None:
-                    continue
-                if not port.is_specialized():
-                    continue
-                for scope in xnet.scoped_names.keys():
-                    module_name = scope._impl.get_fully_qualified_name()
-                    if not self.netlist.symbol_table[scope._impl.parent].is_auto_symbol(scope) or add_unnamed_scopes:
-                        names_in_scope = xnet.get_names(scope)
-                        for name in names_in_scope:
-                            if filter.match(name):
-                                xnet.sim_state.vcd_vars.append(self.vcd_writer.register_var(
-                                    scope = module_name,
-                                    name = name,
-                                    var_type = port.vcd_type,
-                                    size = port.get_num_bits()
-                                ))
+            if trace_format == "wave":
+                from .waveform import WaveformWriter
+                self.vcd_writer = WaveformWriter(vcd_stream, timescale=self.timescale, scope_sep=FQN_DELIMITER)
+            elif self.simulator.background_trace:
+                from .trace_writer import BackgroundVCDWriter
+                self.vcd_writer = BackgroundVCDWriter(vcd_stream, timescale=self.timescale, scope_sep=FQN_DELIMITER)
+            else:
+                self.vcd_writer = VCDWriter(vcd_stream, timescale=self.timescale, scope_sep=FQN_DELIMITER)
+            self.trace_sink = self.vcd_writer
+
+        def start_tracing(self, vcd_file: Union[IO,str]) -> None:
+            """
+            Turns tracing on for a simulation that was started without a VCD file.
+            Use 'dump_signals' afterwards to select the nets to trace.
+            """
+            if self.vcd_writer is not None:
+                raise SimulationException(f"Tracing is already on")
+            self._create_vcd_writer(self.simulator._open_vcd_file(vcd_file), self.simulator._get_trace_format(vcd_file))
+
+        def dump_signals(self, signal_pattern: str = ".", add_unnamed_scopes: bool = False, *, signal_glob: Optional[str] = None, max_depth: Optional[int] = None) -> None:
+            """
+            Selects nets to trace: the ones with names matching the regular expression 'signal_pattern', or if
+            specified, the ones with fully qualified names matching 'signal_glob' (see SignalIndex.glob).
+            Only nets in scopes no deeper than 'max_depth' (the top level being 1) are traced, if it's specified.
+            """
+            if self.vcd_writer is None:
+                raise SimulationException(f"Tracing is off. Specify a VCD file when creating the simulator or call 'start_tracing' first")
+            signal_index = self.netlist.get_signal_index()
+            if signal_glob is not None:
+                entries = signal_index.glob(signal_glob, max_depth=max_depth, add_unnamed_scopes=add_unnamed_scopes)
+            else:
+                entries = signal_index.match(signal_pattern, max_depth=max_depth, add_unnamed_scopes=add_unnamed_scopes)
+            state_store = self.state_store
+            initial_values = []
+            for entry in entries:
+                port = entry.port
+                sim_index = entry.xnet.sim_index
+                vcd_var = self.vcd_writer.register_var(
+                    scope = entry.scope_name,
+                    name = entry.name,
+                    var_type = port.vcd_type,
+                    size = port.get_num_bits()
+                )
+                state_store.add_vcd_var(sim_index, vcd_var)
+                # Nets that already have a value (tracing was turned on mid-simulation) start out with that
+                if state_store.last_changed[sim_index] is not None:
+                    initial_values.append((vcd_var, entry.xnet.get_net_type().convert_to_vcd_type(state_store._get_vcd_value(sim_index))))
+            # Values can only be written once all variables are registered
+            for vcd_var, vcd_val in initial_values:
+                self.vcd_writer.change(vcd_var, self.now, vcd_val)
+
+        def capture(self, *junctions: Union['Junction', str]) -> 'WaveCapture':
+            """
+            Starts recording the value changes of the specified ports or wires (or nets, by fully qualified name) into memory (see wave_capture.py).
+            """
+            from .wave_capture import WaveCapture
+            return WaveCapture(self, junctions)
+
+        def snapshot(self) -> 'SimSnapshot':
+            """
+            Takes a snapshot of the simulation, to run variants from (see sim_snapshot.py).
+            Must be called between calls to 'simulate', not from within a 'simulate' method of a module.
+            """
+            from .sim_snapshot import SimSnapshot
+            return SimSnapshot(self)
+
+        def _get_trace_control(self) -> 'TraceControl':
+            if self.vcd_writer is None:
+                raise SimulationException(f"Tracing is off. Specify a VCD file when creating the simulator or call 'start_tracing' first")
+            if self.trace_control is None:
+                from .trace_control import TraceControl
+                self.trace_control = TraceControl(self)
+            return self.trace_control
+
+        def dump_window(self, start_time: Optional[int] = None, end_time: Optional[int] = None) -> None:
+            """
+            Limits tracing to the time between 'start_time' (or now) and 'end_time' (or the end of the simulation).
+            Can be called multiple times: tracing is on while any of the windows (or triggered windows, see 'dump_on_trigger') is open.
+            """
+            self._get_trace_control().add_window(start_time, end_time)
+
+        def dump_on_trigger(self, trigger: 'Junction', condition: Optional[Callable[[Any], bool]] = None, *, pre_trigger: int = 0, post_trigger: Optional[int] = None) -> None:
+            """
+            Limits tracing to a window around the first time 'condition' (by default: the value is 1) becomes true for the value of 'trigger'.
+            The window starts 'pre_trigger' time units before the trigger: this history is kept in memory until the trigger fires.
+            It ends 'post_trigger' time units after the trigger, or at the end of the simulation.
+            """
+            if trigger.is_composite():
+                raise SimulationException(f"Can't trigger on composite junction {trigger}", trigger)
+            if condition is None:
+                condition = lambda value: value == 1
+            self._get_trace_control().add_trigger(trigger._xnet.sim_index, condition, pre_trigger, post_trigger)
 
         @property
         def now(self) -> int:
@@ -301,10 +769,12 @@ class Simulator(object):
 
         def tick(self) -> None:
             #print(f"== SIM: tick at {self.now}")
-            self.simulator.current_event = self.simulator.timeline.pop(0)
+            self.simulator.current_event = self.simulator.timeline.pop()
             assert self.now != self._last_now
             self._last_now = self.now
             now = self.now
+            if self.trace_control is not None:
+                self.trace_control.apply_scheduled(now)
             self.simulator.current_event.trigger(self, now)
 
         @profile
@@ -316,39 +786,41 @@ class Simulator(object):
             return self.now
 
         def _done(self):
-            now = self.now
-            for xnet in self.simulator.netlist.xnets:
-                try:
-                    xnet.record_change(now)
-                except:
-                    # If we can't record the last change, simply leave it as-is
-                    pass
-                # It's very annoying that simulation asserts clear up the simulation state before raising the exception. So for now, keep it around
-                #xnet.sim_state = None
+            # It's very annoying that simulation asserts clear up the simulation state before raising the exception. So for now, keep it around
             if self.vcd_writer is not None:
                 self.vcd_writer.close()
 
 
 
-    def __init__(self, netlist: Netlist, vcd_file: Union[IO,str], timescale='1ns'):
-        self.timeline: List['Simulator.Event'] = []
+    def __init__(self, netlist: Netlist, vcd_file: Optional[Union[IO,str]], timescale='1ns', *, timeline: Optional[Timeline] = None, compile_cones: bool = False, bank_registers: bool = False, four_state: bool = False, two_state: bool = False, background_trace: bool = False, trace_format: Optional[str] = None):
+        if four_state and two_state:
+            raise SimulationException("Four-state and two-state simulation can't be enabled at the same time")
+        if trace_format not in (None, "vcd", "wave"):
+            raise SimulationException(f"Unknown trace format: {trace_format}")
+        self.timeline: Timeline = timeline if timeline is not None else HeapTimeline()
+        self.compile_cones = compile_cones # If set, connected combinational modules are evaluated by generated code in a single step
+        self.bank_registers = bank_registers # If set, registers on the same clock are evaluated together, in a single sweep (see RegisterBank)
+        self.four_state = four_state # If set, individual bits of integer nets can be unknown (see four_state.py)
+        self.two_state = two_state # If set, nets are never unknown (None): they start with their default value and primitives skip all X checks (see TwoStateStore)
+        self.background_trace = background_trace # If set, waveforms are formatted and written by a separate thread (see trace_writer.py)
+        self.trace_format = trace_format # 'vcd' or 'wave' (see waveform.py). If None, it's determined by the file extension
         self.current_event: Optional[Simulator.Event] = None
 
-        self.vcd_file = vcd_file
+        self.vcd_file = vcd_file # If None, no waveforms are recorded (see SimulatorContext.start_tracing)
+        self.opened_vcd_streams: List[IO] = [] # Streams we opened ourselves (as opposed to the ones we got from the caller), closed in __exit__
         self.timescale = timescale
         self.context = None
         self.top_level = netlist.top_level
         self.netlist = netlist
+        self.outer_context: Optional[Simulator.SimulatorContext] = None # The simulation of the netlist that was active (in this thread) before this one
 
     def __enter__(self):
         assert self.context is None
-        assert self.top_level._impl.netlist.simulator_context is None, "Can't start multiple simulations on a single netlist"
-        if isinstance(self.vcd_file, (str, Path)):
-            self.vcd_stream = open(str(self.vcd_file), "w")
-        else:
-            self.vcd_stream = self.vcd_file
-        self.context = Simulator.SimulatorContext(self, self.vcd_stream, self.timescale)
-        self.top_level._impl.netlist.simulator_context = self.context
+        self.vcd_stream = self._open_vcd_file(self.vcd_file)
+        self.context = self.SimulatorContext(self, self.vcd_stream, self.timescale)
+        # Simulations of the same netlist can be nested: the innermost one is active until it's exited
+        self.outer_context = self.netlist.simulator_context
+        self.netlist.simulator_context = self.context
         Context.push(Context.simulation)
         # We put the top module back to the Module.Context stack as well. That way, anyone knows what the top level is and can query it.
         # This is particularly important to get to the active context (simulation that is) in cases where we have no idea, where in the
@@ -356,14 +828,26 @@ class Simulator(object):
         self.module_context = Module.Context(self.top_level._impl)
         self.module_context.__enter__()
 
-        self.current_event = self._get_event(0)
-        self.context._setup()
+        try:
+            self.current_event = self._get_event(0)
+            self.context._setup()
+        except BaseException:
+            # Setup can fail (unsupported constructs for instance): undo all of the above, so the caller is not left in simulation context
+            self.__exit__(*sys.exc_info())
+            raise
         return self.context
 
     def __exit__(self, exception_type, exception_value, traceback):
-        self.context._done()
+        try:
+            self.context._done()
+        finally:
+            self.netlist._remove_simulation(self.context)
+            for vcd_stream in self.opened_vcd_streams:
+                vcd_stream.close()
+            self.opened_vcd_streams = []
         self.context = None
-        self.top_level._impl.netlist.simulator_context = None
+        self.netlist.simulator_context = self.outer_context
+        self.outer_context = None
         self.module_context.__exit__(exception_type, exception_value, traceback)
         self.module_context = None
         old_context = Context.pop()
@@ -372,6 +856,27 @@ class Simulator(object):
 
     #TODO: test if we can safely enter and exit a simulator multiple times
 
+    def _get_trace_format(self, vcd_file: Optional[Union[IO,str]]) -> str:
+        if self.trace_format is not None:
+            return self.trace_format
+        if isinstance(vcd_file, (str, Path)) and str(vcd_file).endswith(".wave"):
+            return "wave"
+        return "vcd"
+
+    def _open_vcd_file(self, vcd_file: Optional[Union[IO,str]]) -> Optional[IO]:
+        if isinstance(vcd_file, (str, Path)):
+            # Files with a '.gz' extension are compressed
+            if self._get_trace_format(vcd_file) == "wave":
+                vcd_stream = open(str(vcd_file), "wb")
+            elif str(vcd_file).endswith(".gz"):
+                import gzip
+                vcd_stream = gzip.open(str(vcd_file), "wt")
+            else:
+                vcd_stream = open(str(vcd_file), "w")
+            self.opened_vcd_streams.append(vcd_stream)
+            return vcd_stream
+        return vcd_file
+
     @property
     def now(self) -> int:
         if self.current_event is None:
@@ -385,18 +890,10 @@ class Simulator(object):
     def _get_event(self, when: Optional[int] = None) -> 'Simulator.Event':
         if when is None:
             when = self.now
-        insert_idx = len(self.timeline)
-        # TODO: since it's an ordered list, bisection could be used for an O(log(n)) complexity search
-        for idx, entry in enumerate(self.timeline):
-            if entry.when == when:
-                return entry
-            if entry.when > when:
-                insert_idx = idx
-                break
-        # The exact time doesn't exist in the timeline yet, create a new entry...
-        ret_val = Simulator.Event(when, self.context)
-        self.timeline.insert(insert_idx, ret_val)
-        return ret_val
+        return self.timeline.get_event(when, self._create_event)
+
+    def _create_event(self, when: int) -> 'Simulator.Event':
+        return Simulator.Event(when, self.context)
 
     def log(self, *args, **kwargs):
         prefix = f"{self.now}:{self.delta}"
@@ -1,32 +1,41 @@
 from typing import Optional
+import threading
+
+class _ThreadStacks(threading.local):
+    # Every thread has its own stacks: simulations of the same netlist can run in several threads
+    def __init__(self):
+        self.stack = []
+        self.object_stacks = {}
 
 class StateStackElement(object):
-    _stack = []
-    _object_stacks = {}
+    _stacks = _ThreadStacks()
     
     def __init__(self):
         pass
     
     def __enter__(self) -> 'StateStackElement':
-        if self.__class__ not in self._object_stacks:
-            self._object_stacks[self.__class__] = []
-        self._object_stacks[self.__class__].append(self)
-        self._stack.append(self)
+        object_stacks = self._stacks.object_stacks
+        if self.__class__ not in object_stacks:
+            object_stacks[self.__class__] = []
+        object_stacks[self.__class__].append(self)
+        self._stacks.stack.append(self)
         return self
     
     def __exit__(self, exception_type, exception_value, traceback):
-        assert self._object_stacks[self.__class__][-1] is self
-        assert self._stack[-1] is self
-        self._stack.pop()
-        self._object_stacks[self.__class__].pop()
+        object_stacks = self._stacks.object_stacks
+        assert object_stacks[self.__class__][-1] is self
+        assert self._stacks.stack[-1] is self
+        self._stacks.stack.pop()
+        object_stacks[self.__class__].pop()
 
     @classmethod
     def top(cls) -> Optional['StateStackElement']:
-        if cls not in cls._object_stacks:
+        object_stacks = cls._stacks.object_stacks
+        if cls not in object_stacks:
             return None
-        if len(cls._object_stacks[cls]) == 0:
+        if len(object_stacks[cls]) == 0:
             return None
-        return cls._object_stacks[cls][-1]
+        return object_stacks[cls][-1]
 
 if __name__ == "__main__":
     class A(StateStackElement):
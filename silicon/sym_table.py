@@ -1,4 +1,4 @@
-from typing import Any, Optional, Dict, Sequence, FrozenSet, Iterator, Callable, Union
+from typing import Any, Optional, Dict, Sequence, FrozenSet, Iterator, Callable, Union, Tuple
 from weakref import WeakKeyDictionary, WeakValueDictionary
 
 from silicon.exceptions import SyntaxErrorException
@@ -50,7 +50,9 @@ class ScopeTable(object):
     """
 
     class Reserved(object):
-        pass
+        def __reduce__(self) -> str:
+            # There's only one of these, make sure it stays that way in loaded netlists
+            return "ScopeTable.reserved"
     reserved = Reserved()
     def __init__(self):
         self.hard_symbols: WeakValueDictionary[str, object] = WeakValueDictionary()
@@ -136,6 +138,42 @@ class ScopeTable(object):
         if old_obj in self.auto_symbols:
             self.add_auto_symbol(new_obj)
 
+    def get_symbols(self) -> Sequence[Tuple[str, Optional[str], object]]:
+        """
+        Returns all symbols as (kind, name, object) tuples, where kind is 'hard', 'soft' or 'auto'. Auto symbols have no name.
+        """
+        ret_val = []
+        ret_val += (("hard", name, obj) for name, obj in self.hard_symbols.items() if obj is not ScopeTable.reserved)
+        ret_val += (("soft", name, obj) for name, objs in self.soft_symbols.items() for obj in objs)
+        ret_val += (("auto", None, obj) for obj in self.auto_symbols)
+        return ret_val
+
+    def add_symbol(self, kind: str, name: Optional[str], obj: object) -> None:
+        """
+        Adds a symbol, as returned by get_symbols. Unlike add_hard_symbol or add_soft_symbol, this doesn't touch other symbols of the object.
+        """
+        if kind == "hard":
+            self.hard_symbols[name] = obj
+            try:
+                self.hard_names[obj].add(name)
+            except KeyError:
+                self.hard_names[obj] = OrderedSet((name,))
+        elif kind == "soft":
+            self._add_soft_symbol(obj, name)
+        else:
+            self.add_auto_symbol(obj)
+
+    def del_symbol(self, kind: str, name: Optional[str], obj: object) -> None:
+        """
+        Removes a symbol, as returned by get_symbols.
+        """
+        if kind == "hard":
+            self.del_hard_symbol(obj, name)
+        elif kind == "soft":
+            self.del_soft_symbol(obj, name)
+        else:
+            self.del_auto_symbol(obj)
+
     def is_reserved_name(self, name) -> bool:
         from .back_end import get_reserved_names
         return name in get_reserved_names()
@@ -0,0 +1,87 @@
+from typing import Dict, List, Callable, Any
+from heapq import heappush, heappop
+
+"""
+Timeline implementations for the Silicon simulator.
+
+A timeline holds all the Simulator.Event objects that are scheduled for some time in the future.
+The simulator needs three things from it:
+    1. Find (or create) the event for a given point in time
+    2. Remove and return the earliest event
+    3. Tell how many events are pending
+
+The original implementation was a sorted list, which made both (1) and (2) linear in the number
+of pending timestamps. That's fine for small testbenches, but large ones with many clock generators
+and wait-states schedule a lot of distinct timestamps. HeapTimeline is the default now, ListTimeline
+is kept around as a reference implementation (and for benchmarking).
+"""
+
+class Timeline(object):
+    """
+    Base class for all timeline implementations.
+
+    'factory' is called with a single 'when' argument if an event needs to be created for a point in time.
+    """
+    def get_event(self, when: int, factory: Callable[[int], Any]) -> Any:
+        raise NotImplementedError
+    def pop(self) -> Any:
+        """
+        Removes and returns the earliest event on the timeline
+        """
+        raise NotImplementedError
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+class ListTimeline(Timeline):
+    """
+    A timeline, implemented as a sorted list of events.
+
+    Both insertion and removal are O(n) in the number of pending timestamps.
+    """
+    def __init__(self):
+        self.events: List[Any] = []
+
+    def get_event(self, when: int, factory: Callable[[int], Any]) -> Any:
+        insert_idx = len(self.events)
+        for idx, entry in enumerate(self.events):
+            if entry.when == when:
+                return entry
+            if entry.when > when:
+                insert_idx = idx
+                break
+        # The exact time doesn't exist in the timeline yet, create a new entry...
+        ret_val = factory(when)
+        self.events.insert(insert_idx, ret_val)
+        return ret_val
+
+    def pop(self) -> Any:
+        return self.events.pop(0)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+class HeapTimeline(Timeline):
+    """
+    A timeline, implemented as a binary heap of timestamps, with a timestamp -> event index on the side.
+
+    Lookup of an existing event is O(1), insertion of a new timestamp and removal of the earliest are O(log(n)).
+    """
+    def __init__(self):
+        self.times: List[int] = []
+        self.events: Dict[int, Any] = {}
+
+    def get_event(self, when: int, factory: Callable[[int], Any]) -> Any:
+        try:
+            return self.events[when]
+        except KeyError:
+            pass
+        ret_val = factory(when)
+        self.events[when] = ret_val
+        heappush(self.times, when)
+        return ret_val
+
+    def pop(self) -> Any:
+        return self.events.pop(heappop(self.times))
+
+    def __len__(self) -> int:
+        return len(self.times)
@@ -0,0 +1,189 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import deque
+from heapq import heappush, heappop
+
+from .exceptions import SimulationException
+
+"""
+Time-windowed and triggered waveform dumping.
+
+By default, every net selected by SimulatorContext.dump_signals is traced for the whole simulation.
+SimulatorContext.dump_window and SimulatorContext.dump_on_trigger restrict that to windows of time:
+
+- dump_window(start_time, end_time) traces between the two points in time
+- dump_on_trigger(net, condition, pre_trigger, post_trigger) starts tracing when 'condition' becomes
+  true for the value of 'net'. The last 'pre_trigger' time units before the trigger are kept in an
+  in-memory history buffer, and are written to the trace file once (and only if) the trigger fires.
+
+Windows can overlap, tracing is on while any of them is open. Outside of windows, VCD files get a
+$dumpoff section, and tracing adds no overhead to the simulation, unless a trigger is armed: then
+the trigger net is watched and (if 'pre_trigger' is specified) value changes go to the history buffer.
+"""
+
+class _HistoryBuffer(object):
+    """
+    Keeps the value changes of the last 'length' time units in a ring buffer.
+
+    Changes that fall out of the buffer are folded into 'base_values', so that the buffer can
+    always be replayed from the state at its start.
+    """
+    def __init__(self, length: int, start_time: int, base_values: Dict[Any, Any]):
+        self.length = length
+        self.start_time = start_time
+        self.base_values = base_values
+        self.changes: deque = deque()
+
+    def _prune(self, now: int) -> None:
+        horizon = now - self.length
+        changes = self.changes
+        base_values = self.base_values
+        while changes and changes[0][0] < horizon:
+            when, var, value = changes.popleft()
+            base_values[var] = value
+        self.start_time = max(self.start_time, horizon)
+
+    def change(self, var: Any, when: int, value: Any) -> None:
+        changes = self.changes
+        changes.append((when, var, value))
+        if changes[0][0] < when - self.length:
+            self._prune(when)
+
+    def replay(self, writer: Any, now: int) -> None:
+        """
+        Writes the content of the buffer into 'writer', which must have dumping turned off.
+        """
+        self._prune(now)
+        base_values = self.base_values
+        changes = self.changes
+        while changes and changes[0][0] == self.start_time:
+            when, var, value = changes.popleft()
+            base_values[var] = value
+        # While dumping is off, changes only update the values the $dumpon section starts with
+        for var, value in base_values.items():
+            writer.change(var, self.start_time, value)
+        writer.dump_on(self.start_time)
+        for when, var, value in changes:
+            writer.change(var, when, value)
+
+class TraceControl(object):
+    """
+    Turns tracing on and off based on time windows and triggers. Created by SimulatorContext on demand.
+    """
+    _on = "on"
+    _history = "history"
+    _off = "off"
+
+    def __init__(self, sim_context: 'Simulator.SimulatorContext'):
+        self.sim_context = sim_context
+        # Tracing is on while there's at least one open window. The whole simulation starts out as one, which is closed once any control is set up.
+        self.open_windows = 1
+        self.mode = TraceControl._on
+        self.actions: List[Tuple[int, int, int]] = [] # A heap of (time, sequence number, change in open windows)
+        self.action_cnt = 0
+        self.history: Optional[_HistoryBuffer] = None
+        self.history_length = 0 # The longest 'pre_trigger' of all armed triggers
+        self.armed_triggers: List['TraceControl.Trigger'] = []
+        self._schedule(sim_context.now, -1)
+
+    class Trigger(object):
+        def __init__(self, trace_control: 'TraceControl', condition: Callable[[Any], bool], pre_trigger: int, post_trigger: Optional[int]):
+            self.trace_control = trace_control
+            self.condition = condition
+            self.pre_trigger = pre_trigger
+            self.post_trigger = post_trigger
+            self.fired_at: Optional[int] = None
+
+        def __call__(self, when: int, value: Any) -> None:
+            if self.fired_at is None and self.condition(value):
+                self.fired_at = when
+                self.trace_control._fire(self, when)
+
+    def _schedule(self, when: int, window_change: int) -> None:
+        heappush(self.actions, (when, self.action_cnt, window_change))
+        self.action_cnt += 1
+
+    def add_window(self, start_time: Optional[int], end_time: Optional[int]) -> None:
+        now = self.sim_context.now
+        start_time = now if start_time is None else max(start_time, now)
+        if end_time is not None and end_time <= start_time:
+            return
+        self._schedule(start_time, 1)
+        if end_time is not None:
+            self._schedule(end_time, -1)
+
+    def add_trigger(self, index: int, condition: Callable[[Any], bool], pre_trigger: int, post_trigger: Optional[int]) -> 'TraceControl.Trigger':
+        if pre_trigger < 0:
+            raise SimulationException(f"pre_trigger can't be negative")
+        trigger = TraceControl.Trigger(self, condition, pre_trigger, post_trigger)
+        self.armed_triggers.append(trigger)
+        self.sim_context.state_store.add_recorder(index, trigger)
+        self._update_history_length()
+        # Make sure the history buffer gets started
+        self._schedule(self.sim_context.now, 0)
+        return trigger
+
+    def _update_history_length(self) -> None:
+        self.history_length = max((trigger.pre_trigger for trigger in self.armed_triggers), default=0)
+        if self.history is not None:
+            self.history.length = self.history_length
+
+    def _fire(self, trigger: 'TraceControl.Trigger', when: int) -> None:
+        self.armed_triggers.remove(trigger)
+        self.open_windows += 1
+        if trigger.post_trigger is not None:
+            self._schedule(when + trigger.post_trigger, -1)
+        # The history buffer is only replayed for triggers that asked for it, and only as far back as they asked
+        if self.history is not None:
+            self.history.length = trigger.pre_trigger
+        self._set_mode(when, replay=trigger.pre_trigger > 0)
+        self._update_history_length()
+
+    def apply_scheduled(self, now: int) -> None:
+        """
+        Applies the window starts and ends up to 'now'. Called before any value changes at 'now' take effect.
+        """
+        actions = self.actions
+        while actions and actions[0][0] <= now:
+            when = actions[0][0]
+            # Apply everything that happens at the same time together, so windows that end where others start don't cause a gap
+            while actions and actions[0][0] == when:
+                self.open_windows += heappop(actions)[2]
+            self._set_mode(when)
+
+    def _get_target_mode(self) -> str:
+        if self.open_windows > 0:
+            return TraceControl._on
+        if self.history_length > 0:
+            return TraceControl._history
+        return TraceControl._off
+
+    def _set_mode(self, when: int, replay: bool = False) -> None:
+        new_mode = self._get_target_mode()
+        old_mode = self.mode
+        if new_mode == old_mode:
+            return
+        sim_context = self.sim_context
+        state_store = sim_context.state_store
+        writer = sim_context.vcd_writer
+        if old_mode == TraceControl._on:
+            writer.dump_off(when)
+        if new_mode == TraceControl._on:
+            if replay and self.history is not None:
+                self.history.replay(writer, when)
+            else:
+                # While dumping is off, changes only update the values the $dumpon section starts with
+                for vcd_var, value in state_store.get_vcd_values():
+                    writer.change(vcd_var, when, value)
+                writer.dump_on(when)
+            self.history = None
+            sim_context.trace_sink = writer
+            state_store.set_recording(True)
+        elif new_mode == TraceControl._history:
+            self.history = _HistoryBuffer(self.history_length, when, dict(state_store.get_vcd_values()))
+            sim_context.trace_sink = self.history
+            state_store.set_recording(True)
+        else:
+            self.history = None
+            sim_context.trace_sink = writer
+            state_store.set_recording(False)
+        self.mode = new_mode
@@ -0,0 +1,125 @@
+from typing import IO, List, Tuple, Any, Optional
+from io import StringIO
+from threading import Thread
+from queue import Queue
+from vcd import VCDWriter
+
+"""
+Waveform writing on a background thread.
+
+Normally every value change of a traced XNet is formatted and written to the VCD file right away,
+by the simulator itself. With background tracing enabled (Simulator(..., background_trace=True)),
+value changes are only collected into batches by the simulator. Full batches are handed to a writer
+thread through a bounded queue, and that thread does the formatting and the (potentially compressed)
+file I/O. The formatted text of a whole batch is written to the file in a single call, so compression
+(which doesn't need the GIL for large buffers) can overlap with the simulation.
+
+If the writer thread falls behind, the queue fills up and the simulator blocks until there's room
+in it again: memory use is bounded by 'queue_depth' * 'batch_size' value changes.
+"""
+
+_close_marker = None
+
+class BackgroundVCDWriter(object):
+    """
+    A drop-in replacement for the subset of VCDWriter that the simulator uses.
+
+    Errors in the writer thread (for instance invalid values) are re-raised in the simulator, the next
+    time a batch is handed over or when the writer is closed.
+    """
+    def __init__(self, vcd_stream: IO, *, batch_size: int = 4096, queue_depth: int = 16, **kwargs):
+        self.vcd_stream = vcd_stream
+        # The VCDWriter formats into this buffer, which is copied to 'vcd_stream' after every batch
+        self.buffer = StringIO()
+        self.writer = VCDWriter(self.buffer, **kwargs)
+        self.batch_size = batch_size
+        self.batch: List[Tuple[Any, int, Any]] = []
+        self.queue: Queue = Queue(maxsize=queue_depth)
+        self.error: Optional[BaseException] = None
+        self.closed = False
+        self.thread = Thread(target=self._write_batches, name="VCD writer", daemon=True)
+        self.thread.start()
+
+    def _write_batches(self) -> None:
+        queue = self.queue
+        change = self.writer.change
+        while True:
+            batch = queue.get()
+            try:
+                if batch is _close_marker:
+                    return
+                # After an error, keep draining the queue so the simulator never blocks on it
+                if self.error is None:
+                    for var, when, value in batch:
+                        change(var, when, value)
+                    self._write_buffer()
+            except BaseException as ex:
+                self.error = ex
+            finally:
+                queue.task_done()
+
+    def _write_buffer(self) -> None:
+        buffer = self.buffer
+        text = buffer.getvalue()
+        if len(text) > 0:
+            buffer.seek(0)
+            buffer.truncate()
+            self.vcd_stream.write(text)
+
+    def _raise_error(self) -> None:
+        if self.error is not None:
+            error = self.error
+            self.error = None
+            raise error
+
+    def _hand_over(self) -> None:
+        self._raise_error()
+        if len(self.batch) > 0:
+            # Blocks if the writer thread is behind: that's our back-pressure
+            self.queue.put(self.batch)
+            self.batch = []
+
+    def _drain(self) -> None:
+        """
+        Waits until the writer thread processed every value change so far.
+        """
+        self._hand_over()
+        self.queue.join()
+        self._raise_error()
+
+    def register_var(self, *args, **kwargs) -> Any:
+        # The underlying writer is not thread-safe, so it can only be touched here while the writer thread is idle
+        self._drain()
+        return self.writer.register_var(*args, **kwargs)
+
+    def dump_off(self, when: int) -> None:
+        self._drain()
+        self.writer.dump_off(when)
+
+    def dump_on(self, when: int) -> None:
+        self._drain()
+        self.writer.dump_on(when)
+
+    def change(self, var: Any, when: int, value: Any) -> None:
+        batch = self.batch
+        batch.append((var, when, value))
+        if len(batch) >= self.batch_size:
+            self._hand_over()
+
+    def flush(self) -> None:
+        # Called after every simulation tick: flushing the file that often would defeat batching, so only check for errors
+        self._raise_error()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._hand_over()
+        finally:
+            self.queue.put(_close_marker)
+            self.thread.join()
+        self._raise_error()
+        self.writer.close()
+        self._write_buffer()
+        self.vcd_stream.flush()
@@ -1,47 +1,114 @@
 from typing import Union, Sequence, Any, Optional, Iterable, Dict, List, Callable, IO, Sequence, Tuple, Generator, Set, Iterator
 from .exceptions import SyntaxErrorException, AdaptTypeError
+from .four_state import XValue
 from threading import RLock
+import threading
 import sys
 
-TSimEvent = Generator[Union[int, Sequence['Port']], int, int]
+TSimEvent = Generator[Union[int, Sequence['Port'], 'StaticSensitivity'], int, int]
+
+class StaticSensitivity(object):
+    """
+    A sensitivity list that doesn't change for the lifetime of a simulation.
+
+    Combinational primitives wait on the same set of ports forever. Instead of yielding
+    those ports every time, they can create one of these objects before their loop and
+    yield it (always the same object). The simulator resolves the XNets on the first yield
+    and keeps the generator on their fan-out lists permanently, so later yields are no-ops.
+
+    A generator that yielded a StaticSensitivity can't yield anything else afterwards.
+
+    If a 'wake_filter' is provided, the simulator calls it (once all value changes of the
+    delta cycle are applied) instead of resuming the generator directly. The generator is
+    only resumed if the filter returns True. The filter must only return False if resuming
+    the generator would not do anything.
+    """
+    def __init__(self, ports: Union['Port', Iterable['Port']], wake_filter: Optional[Callable[[], bool]] = None):
+        from .port import is_junction_base
+        if is_junction_base(ports):
+            ports = (ports, )
+        self.ports: Tuple['Port'] = tuple(ports)
+        self.wake_filter = wake_filter
+        self.xnets: Optional[Tuple['XNet']] = None # Filled in by the simulator on first use
 
 # Only purpose to provide an easy way to check if something is a NetValue in convert_to_junction
 class NetValue(object):
     pass
+class _ContextStack(threading.local):
+    # Every thread has its own stack: simulations of the same netlist can run in several threads
+    def __init__(self):
+        self.stack = []
+
 class Context(object):
-    stack = []
+    """
+    The phase (construction, elaboration, simulation or generation) of the current thread.
+
+    Listeners are notified of context changes, which they use to switch the behavior of junctions and
+    modules. Those objects are shared between threads, so all threads that are in a context at the
+    same time must be in the same one: it's fine to run several simulations in parallel threads, but
+    not to elaborate (or generate RTL) while a simulation is running in another thread. Entering a
+    conflicting context raises a SyntaxErrorException.
+    """
+    _thread = _ContextStack()
+    # The current context of every thread that has one
+    _thread_contexts: Dict[int, Any] = {}
+    # The context listeners were last notified of (the shared context of all threads)
+    _shared_context = None
     listeners = set()
+    # Simulations can run in several threads: a context change and the notification about it must not be interleaved with another one
+    lock = RLock()
 
     @staticmethod
     def register(callback: Callable):
-        Context.listeners.add(callback)
-        callback(Context.current())
+        with Context.lock:
+            Context.listeners.add(callback)
+            callback(Context._shared_context)
     @staticmethod
     def unregister(callback: Callable):
-        Context.listeners.remove(callback)
+        with Context.lock:
+            Context.listeners.remove(callback)
 
     @staticmethod
-    def push(context: Any):
-        notify = context != Context.current()
-        Context.stack.append(context)
-        if notify:
+    def _set_thread_context(context: Any) -> None:
+        thread_id = threading.get_ident()
+        if context is None:
+            Context._thread_contexts.pop(thread_id, None)
+        else:
+            Context._thread_contexts[thread_id] = context
+        # If other threads have a context, they share it: listeners stay on that one
+        shared_context = context
+        for other_context in Context._thread_contexts.values():
+            shared_context = other_context
+            if other_context != context:
+                break
+        if shared_context != Context._shared_context:
+            Context._shared_context = shared_context
             for callback in Context.listeners:
-                callback(context)
+                callback(shared_context)
+
+    @staticmethod
+    def push(context: Any):
+        with Context.lock:
+            thread_id = threading.get_ident()
+            for other_thread_id, other_context in Context._thread_contexts.items():
+                if other_thread_id != thread_id and other_context != context:
+                    raise SyntaxErrorException(f"Can't enter context {context} while another thread is in context {other_context}")
+            Context._thread.stack.append(context)
+            Context._set_thread_context(context)
 
     @staticmethod
     def pop() -> Any:
-        ret_val = Context.stack.pop()
-        new_context = Context.current()
-        if ret_val != new_context:
-            for callback in Context.listeners:
-                callback(new_context)
-        return ret_val
+        with Context.lock:
+            ret_val = Context._thread.stack.pop()
+            Context._set_thread_context(Context.current())
+            return ret_val
 
     @staticmethod
     def current() -> Any:
-        if len(Context.stack) == 0:
+        stack = Context._thread.stack
+        if len(stack) == 0:
             return None
-        return Context.stack[-1]
+        return stack[-1]
 
     construction = 1
     elaboration = 2
@@ -120,6 +187,9 @@ def convert_to_junction(thing: Any, type_hint: Optional['NetType']=None) -> Opti
     elif context == Context.simulation:
         if thing is None:
             return None
+        # Raw integers (and partially unknown integers in four-state simulation) are valid simulation values (of integer Numbers) already
+        if thing.__class__ is int or thing.__class__ is XValue:
+            return thing
         if hasattr(thing, "sim_value"):
             return thing.sim_value
         if is_net_value(thing):
@@ -0,0 +1,224 @@
+from typing import Any, Dict, List, Optional, Union, Sequence
+from array import array
+
+from .exceptions import SimulationException
+from .port import Junction
+
+"""
+In-memory waveform capture, for checking the behavior of a design after (or during) simulation.
+
+A WaveCapture records the value changes of a selected set of nets, straight from the simulator's
+value-change path: values are appended as raw integers into typed arrays, without any of the
+formatting of VCD tracing. After simulation, every captured net is available as NumPy arrays of
+change times and values, with vectorized queries for the value at any (set of) time(s) and for edges.
+This makes it possible to check properties over millions of transactions (latency distributions of
+a ReadyValid stream, for instance) without parsing VCD files or asserting inline in generators.
+
+Recording doesn't use NumPy: it is only needed for accessing the captured data.
+
+Usage:
+
+    with Simulator(netlist, None) as context:
+        capture = context.capture(top.clk, top.out.valid, top.out.ready)
+        context.simulate()
+    rising_clk = capture[top.clk].rising_edges()
+    transfers = rising_clk[(capture[top.out.valid].value_before(rising_clk) == 1) & (capture[top.out.ready].value_before(rising_clk) == 1)]
+"""
+
+class CapturedSignal(object):
+    """
+    The recorded value changes of a single net.
+
+    Integer nets that fit in 64 bits are stored in a compact typed array, unknown (None) values
+    recorded as 0 with a cleared 'known' flag. All other nets (enums, wide or fractional numbers)
+    are stored as Python objects, None standing for unknown values.
+    """
+    def __init__(self, junction: Junction):
+        from .number import is_number
+
+        self.junction = junction
+        net_type = junction.get_net_type()
+        self._times = array('q')
+        self._known = array('B')
+        self.is_integer = is_number(net_type) and net_type.precision == 0 and net_type.get_num_bits() < 64
+        self._values: Union[array, List[Any]] = array('q') if self.is_integer else []
+        self._cache: Optional[tuple] = None
+
+    def record(self, when: int, value: Any) -> None:
+        self._times.append(when)
+        if self.is_integer:
+            if value is None:
+                self._values.append(0)
+                self._known.append(0)
+            else:
+                self._values.append(value)
+                self._known.append(1)
+        else:
+            self._values.append(value)
+            self._known.append(value is not None)
+        self._cache = None
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def _get_arrays(self) -> tuple:
+        import numpy as np
+
+        if self._cache is None:
+            # These are copies: the recording arrays can't grow while their buffers are exported
+            times = np.array(self._times, dtype=np.int64)
+            known = np.array(self._known, dtype=bool)
+            if self.is_integer:
+                values = np.array(self._values, dtype=np.int64)
+            else:
+                values = np.empty(len(self._values), dtype=object)
+                values[:] = self._values
+            self._cache = (times, values, known)
+        return self._cache
+
+    @property
+    def times(self) -> 'np.ndarray':
+        """
+        The times of all value changes, in increasing order. The same time can appear multiple times for changes in different delta-steps.
+        """
+        return self._get_arrays()[0]
+
+    @property
+    def values(self) -> 'np.ndarray':
+        """
+        The values the net changed to, at the corresponding entries of 'times'.
+        """
+        return self._get_arrays()[1]
+
+    @property
+    def known(self) -> 'np.ndarray':
+        """
+        False for the entries of 'values' that are unknown (None).
+        """
+        return self._get_arrays()[2]
+
+    def _lookup(self, when: Any, side: str, default: Any) -> Any:
+        import numpy as np
+
+        times, values, known = self._get_arrays()
+        when_array = np.asarray(when)
+        positions = np.searchsorted(times, when_array, side=side) - 1
+        valid = positions >= 0
+        positions = np.maximum(positions, 0)
+        if len(values) == 0:
+            result = np.full(when_array.shape, default, dtype=object)
+        else:
+            result = values[positions]
+            valid &= known[positions]
+            if not valid.all():
+                if self.is_integer and default is not None:
+                    result = np.where(valid, result, default)
+                else:
+                    result = np.where(valid, result.astype(object), default)
+        if when_array.ndim == 0:
+            return result[()] if isinstance(result, np.ndarray) else result
+        return result
+
+    def value_at(self, when: Any, default: Any = None) -> Any:
+        """
+        Returns the value of the net at 'when' (a time or an array of times), after all changes at that time.
+
+        Unknown values, and values before the first recorded change are returned as 'default'.
+        If 'default' is None and there are such values in the result, the returned array has an object dtype.
+        """
+        return self._lookup(when, "right", default)
+
+    def value_before(self, when: Any, default: Any = None) -> Any:
+        """
+        Returns the value of the net just before 'when' (a time or an array of times), that is before any changes at that time.
+
+        This is the value a register samples on a clock edge at 'when'.
+        """
+        return self._lookup(when, "left", default)
+
+    def _window(self, start: Optional[int], end: Optional[int]) -> 'np.ndarray':
+        import numpy as np
+
+        times = self.times
+        mask = np.ones(len(times), dtype=bool)
+        if start is not None:
+            mask &= times >= start
+        if end is not None:
+            mask &= times <= end
+        return mask
+
+    def edges(self, from_value: Any = None, to_value: Any = None, start: Optional[int] = None, end: Optional[int] = None) -> 'np.ndarray':
+        """
+        Returns the times of the value changes between 'start' and 'end' (both inclusive).
+
+        If 'from_value' and/or 'to_value' is specified, only changes from and/or to that value are returned.
+        Changes from or to unknown values never match a specified 'from_value' or 'to_value'.
+        """
+        import numpy as np
+
+        times, values, known = self._get_arrays()
+        mask = self._window(start, end)
+        if to_value is not None:
+            mask &= known & (values == to_value)
+        if from_value is not None:
+            previous_matches = np.zeros(len(times), dtype=bool)
+            previous_matches[1:] = known[:-1] & (values[:-1] == from_value)
+            mask &= previous_matches
+        return times[mask]
+
+    def rising_edges(self, start: Optional[int] = None, end: Optional[int] = None) -> 'np.ndarray':
+        """
+        Returns the times of the 0->1 transitions of a single-bit net.
+        """
+        return self.edges(0, 1, start, end)
+
+    def falling_edges(self, start: Optional[int] = None, end: Optional[int] = None) -> 'np.ndarray':
+        """
+        Returns the times of the 1->0 transitions of a single-bit net.
+        """
+        return self.edges(1, 0, start, end)
+
+    def next_edge(self, after: int, from_value: Any = None, to_value: Any = None) -> Optional[int]:
+        """
+        Returns the time of the first matching value change (see 'edges') after (but not at) 'after', or None if there's none.
+        """
+        edges = self.edges(from_value, to_value, after + 1)
+        return int(edges[0]) if len(edges) > 0 else None
+
+class WaveCapture(object):
+    """
+    Records the value changes of a set of nets during simulation. Created by SimulatorContext.capture.
+
+    Captured nets are accessed by indexing with the junction (port or wire) or the name they were captured through.
+    """
+    def __init__(self, sim_context: 'Simulator.SimulatorContext', junctions: Sequence[Union[Junction, str]]):
+        self.sim_context = sim_context
+        self.signals: Dict[Union[Junction, str], CapturedSignal] = {}
+        state_store = sim_context.state_store
+        for junction in junctions:
+            if junction in self.signals:
+                continue
+            if isinstance(junction, str):
+                entry = sim_context.netlist.get_signal_index().lookup(junction)
+                if entry is None:
+                    raise SimulationException(f"Can't capture {junction}: no net with that name")
+                signal = CapturedSignal(entry.port)
+                index = entry.xnet.sim_index
+            else:
+                if junction.is_composite():
+                    raise SimulationException(f"Can't capture composite junction {junction}: capture its members individually", junction)
+                signal = CapturedSignal(junction)
+                index = junction._xnet.sim_index
+            self.signals[junction] = signal
+            # Like in a VCD file, start out with the current value of the net
+            signal.record(sim_context.now, state_store.values[index])
+            state_store.add_recorder(index, signal.record)
+
+    def __getitem__(self, junction: Union[Junction, str]) -> CapturedSignal:
+        return self.signals[junction]
+
+    def __contains__(self, junction: Union[Junction, str]) -> bool:
+        return junction in self.signals
+
+    def __len__(self) -> int:
+        return len(self.signals)
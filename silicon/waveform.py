@@ -0,0 +1,333 @@
+from typing import BinaryIO, IO, List, Dict, Tuple, Any, Optional, Union, Iterator, NamedTuple
+from bisect import bisect_right
+from heapq import merge
+from pathlib import Path
+import struct
+
+"""
+A compact binary waveform format, as an alternative to VCD.
+
+The simulator writes this format if the trace file has a '.wave' extension (or if trace_format='wave'
+is passed to Simulator). The file layout is:
+
+    header:  MAGIC, format version
+    blocks:  the value changes of a single signal each, appended as they fill up
+    footer:  timescale, signal table, block index
+    trailer: offset of the footer (8 bytes, little endian), MAGIC
+
+Every block holds up to 'block_size' consecutive value changes of one signal. Within a block, times
+are stored as differences from the previous change and integer values as (zig-zag encoded) differences
+from the previous integer value, all as variable length integers. The block index records the signal,
+the time range and the file location of every block, so WaveformReader can fetch the history of a
+single signal over a time window by reading only the blocks that overlap it.
+"""
+
+MAGIC = b"SILWAVE\0"
+VERSION = 1
+
+_tag_int = 0
+_tag_str = 1
+_tag_none = 2
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value >= 0x80:
+        buffer.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+def _write_str(buffer: bytearray, value: str) -> None:
+    encoded = value.encode("utf-8")
+    _write_varint(buffer, len(encoded))
+    buffer += encoded
+
+def _read_str(data: bytes, offset: int) -> Tuple[str, int]:
+    length, offset = _read_varint(data, offset)
+    return data[offset:offset+length].decode("utf-8"), offset + length
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if (value & 1) == 0 else -((value + 1) >> 1)
+
+class WaveformSignal(NamedTuple):
+    index: int
+    scope: str
+    name: str
+    var_type: str
+    size: Optional[int]
+
+class _BlockIndexEntry(NamedTuple):
+    first_time: int
+    last_time: int
+    offset: int
+    length: int
+    count: int
+
+class WaveformWriter(object):
+    """
+    Writes the binary waveform format. Implements the subset of VCDWriter that the simulator uses.
+
+    The variable handles returned by register_var are simply signal indices.
+    """
+    def __init__(self, stream: BinaryIO, *, timescale: str = "1ns", block_size: int = 1024, scope_sep: str = "."):
+        self.stream = stream
+        self.timescale = str(timescale)
+        self.block_size = block_size
+        self.scope_sep = scope_sep
+        self.signals: List[WaveformSignal] = []
+        self.pending: List[List[Tuple[int, Any]]] = [] # Value changes of every signal that are not yet written in a block
+        self.index: List[List[_BlockIndexEntry]] = [] # Blocks of every signal
+        self.offset = 0
+        self.closed = False
+        self._write(MAGIC + struct.pack("<I", VERSION))
+
+    def _write(self, data: bytes) -> None:
+        self.stream.write(data)
+        self.offset += len(data)
+
+    def register_var(self, scope: str, name: str, var_type: str, size: Optional[int] = None) -> int:
+        signal = len(self.signals)
+        self.signals.append(WaveformSignal(signal, scope, name, var_type, size))
+        self.pending.append([])
+        self.index.append([])
+        return signal
+
+    def change(self, var: int, when: int, value: Any) -> None:
+        pending = self.pending[var]
+        pending.append((when, value))
+        if len(pending) >= self.block_size:
+            self._write_block(var)
+
+    def dump_off(self, when: int) -> None:
+        # Like the $dumpoff section of VCD files: every signal is unknown until dumping is turned back on
+        for signal in range(len(self.signals)):
+            self.change(signal, when, None)
+
+    def dump_on(self, when: int) -> None:
+        # The simulator re-sends the value of every signal, nothing to do here
+        pass
+
+    def _write_block(self, signal: int) -> None:
+        changes = self.pending[signal]
+        self.pending[signal] = []
+        buffer = bytearray()
+        prev_time = changes[0][0]
+        prev_int = 0
+        for when, value in changes:
+            _write_varint(buffer, when - prev_time)
+            prev_time = when
+            if value.__class__ is int or value.__class__ is bool:
+                buffer.append(_tag_int)
+                _write_varint(buffer, _zigzag(value - prev_int))
+                prev_int = value
+            elif value is None:
+                buffer.append(_tag_none)
+            else:
+                buffer.append(_tag_str)
+                _write_str(buffer, str(value))
+        self.index[signal].append(_BlockIndexEntry(changes[0][0], changes[-1][0], self.offset, len(buffer), len(changes)))
+        self._write(bytes(buffer))
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        for signal, changes in enumerate(self.pending):
+            if len(changes) > 0:
+                self._write_block(signal)
+        footer = bytearray()
+        _write_str(footer, self.timescale)
+        _write_str(footer, self.scope_sep)
+        _write_varint(footer, len(self.signals))
+        for signal in self.signals:
+            _write_str(footer, signal.scope)
+            _write_str(footer, signal.name)
+            _write_str(footer, signal.var_type)
+            _write_varint(footer, signal.size if signal.size is not None else 0)
+            blocks = self.index[signal.index]
+            _write_varint(footer, len(blocks))
+            for block in blocks:
+                _write_varint(footer, block.first_time)
+                _write_varint(footer, block.last_time - block.first_time)
+                _write_varint(footer, block.offset)
+                _write_varint(footer, block.length)
+                _write_varint(footer, block.count)
+        footer_offset = self.offset
+        self._write(bytes(footer))
+        self._write(struct.pack("<Q", footer_offset) + MAGIC)
+        self.stream.flush()
+
+class WaveformReader(object):
+    """
+    Random access reader for the binary waveform format.
+
+    Only the footer is read when the file is opened. Value changes are read block-by-block, as needed.
+    """
+    def __init__(self, file: Union[str, Path, BinaryIO]):
+        if isinstance(file, (str, Path)):
+            self.stream = open(str(file), "rb")
+            self.owns_stream = True
+        else:
+            self.stream = file
+            self.owns_stream = False
+        stream = self.stream
+        stream.seek(0)
+        header = stream.read(len(MAGIC) + 4)
+        if header[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a waveform file")
+        version, = struct.unpack("<I", header[len(MAGIC):])
+        if version != VERSION:
+            raise ValueError(f"Unsupported waveform file version {version}")
+        stream.seek(-(8 + len(MAGIC)), 2)
+        trailer = stream.read(8 + len(MAGIC))
+        if trailer[8:] != MAGIC:
+            raise ValueError("Waveform file is truncated")
+        footer_offset, = struct.unpack("<Q", trailer[:8])
+        stream.seek(footer_offset)
+        footer = stream.read()
+        offset = 0
+        self.timescale, offset = _read_str(footer, offset)
+        self.scope_sep, offset = _read_str(footer, offset)
+        signal_cnt, offset = _read_varint(footer, offset)
+        self.signals: List[WaveformSignal] = []
+        self.index: List[List[_BlockIndexEntry]] = []
+        for signal in range(signal_cnt):
+            scope, offset = _read_str(footer, offset)
+            name, offset = _read_str(footer, offset)
+            var_type, offset = _read_str(footer, offset)
+            size, offset = _read_varint(footer, offset)
+            self.signals.append(WaveformSignal(signal, scope, name, var_type, size if size != 0 else None))
+            block_cnt, offset = _read_varint(footer, offset)
+            blocks = []
+            for _ in range(block_cnt):
+                first_time, offset = _read_varint(footer, offset)
+                duration, offset = _read_varint(footer, offset)
+                block_offset, offset = _read_varint(footer, offset)
+                length, offset = _read_varint(footer, offset)
+                count, offset = _read_varint(footer, offset)
+                blocks.append(_BlockIndexEntry(first_time, first_time + duration, block_offset, length, count))
+            self.index.append(blocks)
+        self.block_first_times: List[List[int]] = [[block.first_time for block in blocks] for blocks in self.index]
+        self.signals_by_name: Dict[str, WaveformSignal] = {self.get_full_name(signal): signal for signal in self.signals}
+
+    def __enter__(self) -> 'WaveformReader':
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.owns_stream:
+            self.stream.close()
+
+    def get_full_name(self, signal: WaveformSignal) -> str:
+        return f"{signal.scope}{self.scope_sep}{signal.name}" if signal.scope else signal.name
+
+    def get_signal(self, full_name: str) -> WaveformSignal:
+        """
+        Returns a signal by its fully qualified name, such as 'top.sub.net'
+        """
+        return self.signals_by_name[full_name]
+
+    def _read_block(self, block: _BlockIndexEntry) -> List[Tuple[int, Any]]:
+        self.stream.seek(block.offset)
+        data = self.stream.read(block.length)
+        changes = []
+        offset = 0
+        when = block.first_time
+        prev_int = 0
+        for _ in range(block.count):
+            time_delta, offset = _read_varint(data, offset)
+            when += time_delta
+            tag = data[offset]
+            offset += 1
+            if tag == _tag_int:
+                value_delta, offset = _read_varint(data, offset)
+                value = prev_int + _unzigzag(value_delta)
+                prev_int = value
+            elif tag == _tag_str:
+                value, offset = _read_str(data, offset)
+            else:
+                value = None
+            changes.append((when, value))
+        return changes
+
+    def iter_changes(self, signal: Union[WaveformSignal, str], start_time: Optional[int] = None, end_time: Optional[int] = None) -> Iterator[Tuple[int, Any]]:
+        """
+        Returns the (time, value) pairs of a signal between 'start_time' and 'end_time' (both inclusive).
+
+        If 'start_time' is given, the first pair is the value of the signal at 'start_time', that is the
+        last change at or before it. Only the blocks that overlap the time window are read.
+        """
+        if isinstance(signal, str):
+            signal = self.get_signal(signal)
+        blocks = self.index[signal.index]
+        if start_time is None:
+            first_block = 0
+        else:
+            # The last block that starts at or before 'start_time' holds the value at 'start_time'
+            first_block = max(bisect_right(self.block_first_times[signal.index], start_time) - 1, 0)
+        value_at_start = None
+        for block in blocks[first_block:]:
+            if end_time is not None and block.first_time > end_time:
+                break
+            for when, value in self._read_block(block):
+                if start_time is not None and when <= start_time:
+                    value_at_start = (when, value)
+                    continue
+                if value_at_start is not None:
+                    yield value_at_start
+                    value_at_start = None
+                if end_time is not None and when > end_time:
+                    return
+                yield when, value
+        if value_at_start is not None:
+            yield value_at_start
+
+    def get_changes(self, signal: Union[WaveformSignal, str], start_time: Optional[int] = None, end_time: Optional[int] = None) -> List[Tuple[int, Any]]:
+        """
+        The same as iter_changes, but returns a list.
+        """
+        return list(self.iter_changes(signal, start_time, end_time))
+
+    def convert_to_vcd(self, vcd_stream: IO) -> None:
+        """
+        Writes the content of the waveform file into a VCD file.
+        """
+        from vcd import VCDWriter
+        with VCDWriter(vcd_stream, timescale=self.timescale, scope_sep=self.scope_sep) as writer:
+            vcd_vars = [writer.register_var(signal.scope, signal.name, signal.var_type, size=signal.size) for signal in self.signals]
+            def tagged_changes(signal: WaveformSignal) -> Iterator[Tuple[int, Any, Any]]:
+                vcd_var = vcd_vars[signal.index]
+                for when, value in self.iter_changes(signal):
+                    yield when, vcd_var, value
+            # Merge the (lazily read) changes of all signals in time order. Within the same time, keep the order of the signals.
+            all_changes = merge(*(tagged_changes(signal) for signal in self.signals), key=lambda change: change[0])
+            for when, vcd_var, value in all_changes:
+                writer.change(vcd_var, when, value)
+
+def convert_to_vcd(waveform_file: Union[str, Path, BinaryIO], vcd_file: Union[str, Path, IO]) -> None:
+    """
+    Converts a binary waveform file into VCD
+    """
+    with WaveformReader(waveform_file) as reader:
+        if isinstance(vcd_file, (str, Path)):
+            with open(str(vcd_file), "w") as vcd_stream:
+                reader.convert_to_vcd(vcd_stream)
+        else:
+            reader.convert_to_vcd(vcd_file)
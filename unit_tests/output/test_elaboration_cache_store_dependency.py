@@ -0,0 +1 @@
+value = 2
@@ -0,0 +1,9 @@
+////////////////////////////////////////////////////////////////////////////////
+// top
+////////////////////////////////////////////////////////////////////////////////
+module top (
+);
+
+endmodule
+
+
@@ -0,0 +1,14 @@
+////////////////////////////////////////////////////////////////////////////////
+// Type definitions
+////////////////////////////////////////////////////////////////////////////////
+`define States__reset 3'h0
+`define States__idle 3'h1
+`define States__get_data 3'h2
+`define States__get_wait 3'h3
+`define States__get_first_data 3'h4
+`define States__send_data 3'h5
+
+
+
+
+
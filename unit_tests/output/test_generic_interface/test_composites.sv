@@ -0,0 +1,32 @@
+////////////////////////////////////////////////////////////////////////////////
+// top
+////////////////////////////////////////////////////////////////////////////////
+module top (
+	output logic [7:0] o
+);
+
+	logic [7:0] top_if_fwd;
+
+	mod mmm (
+		.mod_out_fwd(top_if_fwd)
+	);
+
+	assign o = top_if_fwd;
+endmodule
+
+
+////////////////////////////////////////////////////////////////////////////////
+// mod
+////////////////////////////////////////////////////////////////////////////////
+module mod (
+	output logic [7:0] mod_out_fwd
+);
+
+	logic [7:0] x;
+
+	assign x = 6'h2a;
+
+	assign mod_out_fwd = x;
+endmodule
+
+
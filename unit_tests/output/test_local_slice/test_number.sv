@@ -0,0 +1,13 @@
+////////////////////////////////////////////////////////////////////////////////
+// Top
+////////////////////////////////////////////////////////////////////////////////
+module Top (
+	output logic [4:0] out_a,
+	input logic in_c
+);
+
+	assign out_a = {1'h1, 4'(in_c)};
+
+endmodule
+
+
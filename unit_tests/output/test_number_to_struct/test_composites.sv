@@ -0,0 +1,15 @@
+////////////////////////////////////////////////////////////////////////////////
+// Top
+////////////////////////////////////////////////////////////////////////////////
+module Top (
+	input logic [23:0] in1,
+	output logic [7:0] outp_r,
+	output logic [7:0] outp_g,
+	output logic [7:0] outp_b
+);
+
+	assign {outp_r, outp_g, outp_b} = in1;
+
+endmodule
+
+
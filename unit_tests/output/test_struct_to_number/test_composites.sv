@@ -0,0 +1,16 @@
+////////////////////////////////////////////////////////////////////////////////
+// Top
+////////////////////////////////////////////////////////////////////////////////
+module Top (
+	input logic [7:0] in1_r,
+	input logic [7:0] in1_g,
+	input logic [7:0] in1_b,
+
+	output logic [23:0] outp
+);
+
+	assign outp = {in1_r, in1_g, in1_b};
+
+endmodule
+
+
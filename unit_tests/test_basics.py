@@ -250,6 +250,87 @@ def test_comb_loop_slice():
     with t.ExpectError(si.SyntaxErrorException):
         t.test.rtl_generation(top, inspect.currentframe().f_code.co_name)
 
+def test_deep_rank():
+    # Ranking used to recurse for every level of logic and gave up after 100 levels
+    class top(si.Module):
+        in_a = si.Input(si.Unsigned(8))
+        out_a = si.Output(si.Unsigned(8))
+
+        def body(self):
+            value = self.in_a
+            for _ in range(150):
+                value = ~value
+            self.out_a <<= value
+
+    with si.Netlist().elaborate() as netlist:
+        top()
+    # Every inverter is one rank deeper than its driver
+    assert sorted(netlist.rank_map.values()) == list(range(151))
+
+def test_long_wire_chain():
+    # XNets used to be built by recursing along the chain of wires
+    chain_length = sys.getrecursionlimit() + 100
+
+    class top(si.Module):
+        in_a = si.Input(si.Unsigned(8))
+        out_a = si.Output(si.Unsigned(8))
+
+        def body(self):
+            value = self.in_a
+            for idx in range(chain_length):
+                wire = si.Wire(si.Unsigned(8))
+                wire <<= value
+                setattr(self, f"w{idx}", wire)
+                value = wire
+            self.out_a <<= value
+
+    with si.Netlist().elaborate() as netlist:
+        dut = top()
+    # All the wires are on a single XNet
+    xnet = netlist.get_xnet_for_junction(dut.out_a)
+    for idx in (0, chain_length // 2, chain_length - 1):
+        assert netlist.get_xnet_for_junction(getattr(dut, f"w{idx}")) is xnet
+
+def test_comb_loop_report():
+    class top(si.Module):
+        in_a = si.Input(si.logic)
+        out_a = si.Output(si.logic)
+
+        def body(self):
+            self.w1 = si.Wire(si.logic)
+            self.w2 = si.Wire(si.logic)
+            self.w3 = si.Wire(si.logic)
+            self.w1 <<= self.w3 ^ self.in_a
+            self.w2 <<= ~self.w1
+            self.w3 <<= ~self.w2
+            self.out_a <<= self.w3
+
+    with pytest.raises(si.SyntaxErrorException) as exception_info:
+        with si.Netlist().elaborate():
+            top()
+    message = str(exception_info.value)
+    assert "Combinational loop found" in message
+    # All nets along the loop are listed
+    for name in ("top.w1", "top.w2", "top.w3"):
+        assert name in message
+
+def test_deep_comb_loop():
+    class top(si.Module):
+        in_a = si.Input(si.logic)
+        out_a = si.Output(si.logic)
+
+        def body(self):
+            self.loop_back = si.Wire(si.logic)
+            value = self.loop_back ^ self.in_a
+            for _ in range(150):
+                value = ~value
+            self.loop_back <<= value
+            self.out_a <<= value
+
+    with t.ExpectError(si.SyntaxErrorException):
+        with si.Netlist().elaborate():
+            top()
+
 def test_invalid_slice():
     class top(si.Module):
         in_a = si.Input(si.Unsigned(2))
@@ -805,7 +886,7 @@ def test_unsigned_cast(mode="sim"):
             for i in range(128,255):
                 self.i1 <<= i
                 yield 10
-                assert (self.os.sim_value.value) & 255 == i
+                assert int(self.os.sim_value) & 255 == i
             self.i1 <<= si.Unsigned(8)(-1)
             self.is1 <<= si.Signed(8)(255)
             self.i2 <<= 1
@@ -0,0 +1,217 @@
+#!/usr/bin/python3
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from typing import *
+
+from silicon import *
+from test_utils import *
+import inspect
+from io import StringIO
+
+class Counter(Module):
+    clk = ClkPort()
+    rst = RstPort()
+    en = Input(logic)
+    step = Input(Unsigned(4))
+    count = Output(Unsigned(8))
+    count_is_odd = Output(logic)
+    neg_count = Output(Unsigned(8))
+
+    def body(self):
+        next_count = Wire(Unsigned(8))
+        next_count <<= (self.count + self.step)[7:0]
+        self.count <<= Reg(Select(self.en, self.count, next_count))
+        self.count_is_odd <<= self.count[0]
+        self.neg_count <<= NegReg(self.count)
+
+stimulus = (
+    # rst, en, step
+    (1, 0, 1),
+    (1, 1, 1),
+    (0, 1, 1),
+    (0, 1, 3),
+    (0, 0, 3),
+    (0, 1, 7),
+    (0, 1, 7),
+    (0, 1, 15),
+    (0, 1, 15),
+    (1, 1, 15),
+    (0, 1, 2),
+)
+
+def test_cycle_sim_counter():
+    # Reference: event-driven simulation of the same design, sampling values after the falling edge settled
+    class tb(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.en = Wire(logic)
+            self.step = Wire(Unsigned(4))
+            self.count = Wire(Unsigned(8))
+            self.neg_count = Wire(Unsigned(8))
+            dut = Counter()
+            dut.en <<= self.en
+            dut.step <<= self.step
+            self.count <<= dut.count
+            self.neg_count <<= dut.neg_count
+            self.samples = []
+
+        def simulate(self) -> TSimEvent:
+            self.clk <<= 0
+            for rst, en, step in stimulus:
+                self.rst <<= rst
+                self.en <<= en
+                self.step <<= step
+                yield 4
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+                yield 1
+                self.samples.append((self.count.sim_value, self.neg_count.sim_value))
+
+    netlist, top = create_netlist(tb)
+    with Simulator(netlist, StringIO()) as context:
+        context.simulate()
+    expected = top.samples
+
+    netlist, top = create_netlist(Counter)
+    samples = []
+    with CycleSimulator(netlist, StringIO()) as context:
+        for rst, en, step in stimulus:
+            top.rst <<= rst
+            top.en <<= en
+            top.step <<= step
+            context.run_cycles(1)
+            samples.append((top.count.sim_value, top.neg_count.sim_value))
+        assert context.now == len(stimulus) * 10
+    assert samples == expected
+    assert samples[-1] == (2, 2)
+
+def get_value_changes(vcd: str) -> Dict[int, Set[str]]:
+    """
+    Returns the value changes of a VCD file by time. The order of the changes within the same time is not significant.
+    """
+    value_changes = {}
+    when = None
+    for line in vcd.split("$enddefinitions $end")[1].split("\n"):
+        line = line.strip()
+        if len(line) == 0 or line.startswith("$"):
+            continue
+        if line.startswith("#"):
+            when = int(line[1:])
+            value_changes[when] = set()
+        else:
+            value_changes[when].add(line)
+    return value_changes
+
+def test_cycle_sim_vcd():
+    # Reference: the same stimulus in the event-driven simulator, applied by the top level itself
+    class DrivenCounter(Counter):
+        def simulate(self) -> TSimEvent:
+            self.clk <<= 0
+            for rst, en, step in stimulus:
+                self.rst <<= rst
+                self.en <<= en
+                self.step <<= step
+                yield 5
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+                # The cycle-based simulator applies the next inputs after the falling edge, not together with it
+                yield 0
+
+    netlist, top = create_netlist(DrivenCounter)
+    vcd_stream = StringIO()
+    with Simulator(netlist, vcd_stream) as context:
+        context.dump_signals()
+        context.simulate()
+    expected = vcd_stream.getvalue()
+
+    netlist, top = create_netlist(Counter)
+    vcd_stream = StringIO()
+    with CycleSimulator(netlist, vcd_stream) as context:
+        context.dump_signals()
+        for rst, en, step in stimulus:
+            top.rst <<= rst
+            top.en <<= en
+            top.step <<= step
+            context.run_cycles(1)
+        assert top.count.sim_value == 2
+    vcd = vcd_stream.getvalue()
+    assert "$var wire 8" in vcd
+    assert get_value_changes(vcd) == get_value_changes(expected)
+
+def test_cycle_sim_latch():
+    class top(Module):
+        in_a = Input(logic)
+        latch = Input(logic)
+        out_a = Output(logic)
+
+        def body(self):
+            self.out_a <<= Latch(self.in_a, self.latch)
+
+    netlist, _ = create_netlist(top)
+    with ExpectError(SimulationException):
+        with CycleSimulator(netlist, StringIO()) as context:
+            context.run_cycles(1)
+    assert Context.current() is None
+    assert netlist.simulator_context is None
+
+def test_cycle_sim_async_reset():
+    class top(Module):
+        clk = ClkPort()
+        rst = RstPort()
+        in_a = Input(logic)
+        out_a = Output(logic)
+
+        def body(self):
+            reg = Reg(self.in_a)
+            reg.get_parent_module().sync_reset = False
+            self.out_a <<= reg
+
+    netlist, _ = create_netlist(top)
+    with ExpectError(SimulationException):
+        with CycleSimulator(netlist, StringIO()) as context:
+            context.run_cycles(1)
+    assert Context.current() is None
+    assert netlist.simulator_context is None
+
+def test_cycle_sim_multiple_clocks():
+    class top(Module):
+        clk1 = Input(logic)
+        clk2 = Input(logic)
+        in_a = Input(logic)
+        out_a = Output(logic)
+        out_b = Output(logic)
+
+        def body(self):
+            self.out_a <<= Reg(self.in_a, clock_port=self.clk1)
+            self.out_b <<= Reg(self.in_a, clock_port=self.clk2)
+
+    netlist, _ = create_netlist(top)
+    with ExpectError(SimulationException):
+        with CycleSimulator(netlist, StringIO()) as context:
+            context.run_cycles(1)
+    assert Context.current() is None
+    assert netlist.simulator_context is None
+
+def test_cycle_sim_test_bench():
+    class top(Module):
+        def body(self):
+            self.a = Wire(logic)
+
+        def simulate(self) -> TSimEvent:
+            self.a <<= 1
+            yield 10
+
+    netlist, _ = create_netlist(top)
+    with ExpectError(SimulationException):
+        with CycleSimulator(netlist, StringIO()) as context:
+            context.run_cycles(1)
+    assert Context.current() is None
+    assert netlist.simulator_context is None
+
+if __name__ == "__main__":
+    test_cycle_sim_counter()
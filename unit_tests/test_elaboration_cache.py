@@ -0,0 +1,191 @@
+#!/usr/bin/python3
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from typing import *
+
+from silicon import *
+from test_utils import *
+
+def test_elaboration_cache():
+    body_calls = []
+
+    class Stage(GenericModule):
+        clk = ClkPort()
+        rst = RstPort()
+        data_out = Output(Unsigned(8))
+
+        cache_elaboration = True
+
+        def construct(self, depth: int):
+            self.data_in = Input(Unsigned(8))
+            self.depth = depth
+
+        def body(self):
+            body_calls.append(self.depth)
+            value = self.data_in
+            for idx in range(self.depth):
+                value = Reg((value ^ (idx + 1))[7:0])
+            self.data_out <<= value
+
+    class top(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.data_in = Wire(Unsigned(8))
+            value = self.data_in
+            for idx in range(6):
+                setattr(self, f"u_stage{idx}", Stage(2 if idx % 2 else 3))
+                getattr(self, f"u_stage{idx}").data_in <<= value
+                value = getattr(self, f"u_stage{idx}").data_out
+            self.data_out = Wire(Unsigned(8))
+            self.data_out <<= value
+
+        def simulate(self) -> TSimEvent:
+            self.clk <<= 0
+            self.rst <<= 1
+            self.data_in <<= 0x5a
+            yield 5
+            self.rst <<= 0
+            for _ in range(20):
+                yield 5
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+
+    def elaborate():
+        body_calls.clear()
+        with Netlist().elaborate() as netlist:
+            dut = top()
+        rtl = StrStream()
+        netlist.generate(SystemVerilog(stream_class=rtl))
+        return netlist, dut, str(rtl)
+
+    netlist, dut, cached_rtl = elaborate()
+    # Only the first instance of each parameterization calls 'body', the rest are copies
+    assert sorted(body_calls) == [2, 3]
+    with ScopedAttr(Stage, "cache_elaboration", False):
+        _, _, rtl = elaborate()
+    assert len(body_calls) == 6
+    assert cached_rtl == rtl
+
+    # The copies are independent: the value ripples through all of them
+    with Simulator(netlist, None) as context:
+        context.simulate()
+    assert dut.data_out.sim_value == 0x5a ^ 0x03 ^ 0x03 ^ 0x03
+
+class CachedStage(GenericModule):
+    clk = ClkPort()
+    rst = RstPort()
+    data_in = Input(Unsigned(8))
+    data_out = Output(Unsigned(8))
+
+    def construct(self, mask: int):
+        self.mask = mask
+
+    def body(self):
+        self.data_out <<= Reg((self.data_in ^ self.mask)[7:0])
+
+class CachedTop(GenericModule):
+    def construct(self, stage_cnt: int):
+        self.stage_cnt = stage_cnt
+
+    def body(self):
+        self.clk = Wire(logic)
+        self.rst = Wire(logic)
+        self.data_in = Wire(Unsigned(8))
+        self.data_out = Wire(Unsigned(8))
+        value = self.data_in
+        for idx in range(self.stage_cnt):
+            stage = CachedStage(1 << idx)
+            stage.data_in <<= value
+            value = stage.data_out
+        self.data_out <<= value
+
+    def simulate(self) -> TSimEvent:
+        self.clk <<= 0
+        self.rst <<= 1
+        self.data_in <<= 0x50
+        yield 5
+        self.rst <<= 0
+        for _ in range(10):
+            yield 5
+            self.clk <<= 1
+            yield 5
+            self.clk <<= 0
+
+def test_elaboration_cache_store(tmp_path):
+    cache_dir = tmp_path / "cache"
+    dependency = tmp_path / "dependency.py"
+    dependency.write_text("value = 1\n")
+    cache = ElaborationCache(cache_dir, dependencies=(dependency, ))
+
+    def get_rtl(netlist: Netlist) -> str:
+        rtl = StrStream()
+        netlist.generate(SystemVerilog(stream_class=rtl))
+        return str(rtl)
+
+    netlist = cache.elaborate(CachedTop, 3)
+    assert "load" not in netlist.phase_times
+    assert len(tuple(cache_dir.iterdir())) == 1
+    loaded = cache.elaborate(CachedTop, 3)
+    assert "load" in loaded.phase_times
+    assert loaded.top_level is not netlist.top_level
+    assert get_rtl(loaded) == get_rtl(netlist)
+    with Simulator(loaded, None) as context:
+        context.simulate()
+    assert loaded.top_level.data_out.sim_value == 0x50 ^ 0x7
+
+    # Different parameters are different entries
+    assert cache.get_key(CachedTop, 4) != cache.get_key(CachedTop, 3)
+    assert "load" not in cache.elaborate(CachedTop, 4).phase_times
+    assert len(tuple(cache_dir.iterdir())) == 2
+
+    # A change in the sources invalidates the entry
+    dependency.write_text("value = 2\n")
+    assert cache.load(cache.get_key(CachedTop, 3)) is None
+    assert "load" not in cache.elaborate(CachedTop, 3).phase_times
+    assert "load" in cache.elaborate(CachedTop, 3).phase_times
+
+    # Local classes can't be found by name: these designs are elaborated every time
+    class top(Module):
+        def body(self):
+            self.data_out = Wire(Unsigned(8))
+            self.data_out <<= 3
+    assert cache.get_key(top) is None
+    assert "load" not in cache.elaborate(top).phase_times
+    assert len(tuple(cache_dir.iterdir())) == 2
+
+def test_elaboration_cache_deep_netlist(tmp_path):
+    import shutil
+    import threading
+
+    cache_dir = tmp_path / "cache"
+    with Netlist().elaborate() as netlist:
+        CachedTop(40)
+    # Too deep to be pickled within the default recursion limit
+    cache = ElaborationCache(cache_dir)
+    key = cache.get_key(CachedTop, 40)
+    assert not cache.store(key, netlist)
+    # With a deep stack, it can be stored. The process-wide settings are restored afterwards
+    recursion_limit = sys.getrecursionlimit()
+    stack_size = threading.stack_size()
+    deep_cache = ElaborationCache(cache_dir, dump_stack_size=ElaborationCache.deep_stack_size)
+    assert deep_cache.store(key, netlist)
+    assert deep_cache.load(key) is not None
+    assert sys.getrecursionlimit() == recursion_limit
+    assert threading.stack_size() == stack_size
+
+    # If the thread with the deep stack can't be started, the netlist is not stored. Keys don't need that thread
+    def start(self):
+        raise RuntimeError("can't start new thread")
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    with ScopedAttr(threading.Thread, "start", start):
+        assert deep_cache.get_key(CachedTop, 40) == key
+        assert not deep_cache.store(key, netlist)
+    assert not cache_dir.exists()
+    assert sys.getrecursionlimit() == recursion_limit
+
+if __name__ == "__main__":
+    test_elaboration_cache()
@@ -0,0 +1,174 @@
+#!/usr/bin/python3
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from typing import *
+
+from silicon import *
+from test_utils import *
+import inspect
+from io import StringIO
+
+class Accumulator(Module):
+    clk = ClkPort()
+    rst = RstPort()
+    en = Input(logic)
+    step = Input(Unsigned(4))
+    mask = Input(Unsigned(8))
+    acc = Output(Unsigned(8))
+    masked = Output(Unsigned(8))
+
+    def body(self):
+        next_acc = Wire(Unsigned(8))
+        next_acc <<= (self.acc + self.step)[7:0]
+        self.acc <<= Reg(Select(self.en, self.acc, next_acc))
+        self.masked <<= (self.acc & self.mask) ^ concat(self.step, self.acc[3:0])
+
+def lane_stimulus(lane: int, cycle: int) -> Tuple[int, int, int, int]:
+    # rst, en, step, mask
+    return (
+        1 if cycle < 2 or cycle == 7 + lane else 0,
+        0 if (cycle + lane) % 5 == 0 else 1,
+        (cycle * 3 + lane * 5) & 15,
+        (0xf0 >> lane) | lane,
+    )
+
+def test_lane_sim_matches_cycle_sim():
+    lane_cnt = 5
+    cycle_cnt = 20
+
+    # Reference: every lane simulated on its own
+    expected = []
+    for lane in range(lane_cnt):
+        netlist, top = create_netlist(Accumulator)
+        samples = []
+        with CycleSimulator(netlist, StringIO()) as context:
+            for cycle in range(cycle_cnt):
+                top.rst <<= lane_stimulus(lane, cycle)[0]
+                top.en <<= lane_stimulus(lane, cycle)[1]
+                top.step <<= lane_stimulus(lane, cycle)[2]
+                top.mask <<= lane_stimulus(lane, cycle)[3]
+                context.run_cycles(1)
+                samples.append((top.acc.sim_value, top.masked.sim_value))
+        expected.append(samples)
+
+    netlist, top = create_netlist(Accumulator)
+    lanes = [[] for _ in range(lane_cnt)]
+    with LaneSimulator(netlist, StringIO(), lane_cnt=lane_cnt) as context:
+        for cycle in range(cycle_cnt):
+            stimulus = tuple(zip(*(lane_stimulus(lane, cycle) for lane in range(lane_cnt))))
+            for port, values in zip((top.rst, top.en, top.step, top.mask), stimulus):
+                context.set_lanes(port, values)
+            context.run_cycles(1)
+            for lane in range(lane_cnt):
+                lanes[lane].append((top.acc.sim_value[lane], top.masked.sim_value[lane]))
+    assert lanes == expected
+
+def test_lane_sim_x_lanes():
+    netlist, top = create_netlist(Accumulator)
+    vcd_stream = StringIO()
+    with LaneSimulator(netlist, vcd_stream, lane_cnt=3, vcd_lane=2) as context:
+        context.dump_signals()
+        # Broadcast assignment sets all lanes
+        top.rst <<= 1
+        top.en <<= 1
+        top.mask <<= 0xff
+        context.set_lanes(top.step, (1, None, 2))
+        context.run_cycles(2)
+        top.rst <<= 0
+        context.run_cycles(3)
+        assert top.acc.sim_value == (3, None, 6)
+        assert top.masked.sim_value[1] is None
+        assert top.masked.sim_value[0] == 3 ^ 0x13
+    vcd = vcd_stream.getvalue()
+    # Lane 2 is recorded in the waveform: 'acc' goes through 2, 4 and 6
+    assert "b110 " in vcd
+
+class LaneAlu(Module):
+    clk = ClkPort()
+    rst = RstPort()
+    en = Input(logic)
+    op = Input(Unsigned(2))
+    a = Input(Unsigned(8))
+    b = Input(Signed(6))
+    shift = Input(Unsigned(3))
+    result = Output(Signed(20))
+    flags = Output(Unsigned(4))
+    narrow = Output(Signed(4))
+
+    def body(self):
+        self.result <<= Reg(Select(self.op, self.a - self.b, self.a * self.b, (self.a << self.shift) | ~self.a, default_port=-self.b + abs(self.b) + (self.a >> self.shift)), clock_en=self.en)
+        self.flags <<= concat(self.a < self.b, self.a == 3, self.b >= 0, self.a != self.shift)
+        self.narrow <<= cast(self.b, Signed(4))
+
+def alu_stimulus(lane: int, cycle: int) -> Tuple[int, int, int, int, int, int]:
+    # rst, en, op, a, b, shift
+    seed = (lane * 7919 + cycle * 104729) * 2654435761 >> 7
+    return (
+        1 if cycle == 0 else 0,
+        0 if seed % 7 == 0 else 1,
+        seed & 3,
+        3 if cycle == 5 else (seed >> 2) & 0xff,
+        ((seed >> 10) & 0x3f) - 32,
+        (seed >> 16) & 7,
+    )
+
+def test_lane_sim_alu():
+    lane_cnt = 6
+    cycle_cnt = 12
+
+    def ports(top):
+        return (top.rst, top.en, top.op, top.a, top.b, top.shift)
+
+    expected = []
+    for lane in range(lane_cnt):
+        netlist, top = create_netlist(LaneAlu)
+        samples = []
+        with CycleSimulator(netlist, StringIO()) as context:
+            for cycle in range(cycle_cnt):
+                for port, value in zip(ports(top), alu_stimulus(lane, cycle)):
+                    port <<= value
+                context.run_cycles(1)
+                samples.append((top.result.sim_value, top.flags.sim_value, top.narrow.sim_value))
+        expected.append(samples)
+
+    netlist, top = create_netlist(LaneAlu)
+    lanes = [[] for _ in range(lane_cnt)]
+    with LaneSimulator(netlist, StringIO(), lane_cnt=lane_cnt) as context:
+        for cycle in range(cycle_cnt):
+            stimulus = tuple(zip(*(alu_stimulus(lane, cycle) for lane in range(lane_cnt))))
+            for port, values in zip(ports(top), stimulus):
+                context.set_lanes(port, values)
+            context.run_cycles(1)
+            for lane in range(lane_cnt):
+                lanes[lane].append((top.result.sim_value[lane], top.flags.sim_value[lane], top.narrow.sim_value[lane]))
+    assert lanes == expected
+
+def test_lane_sim_x_bits():
+    netlist, top = create_netlist(LaneAlu)
+    vcd_stream = StringIO()
+    with LaneSimulator(netlist, vcd_stream, lane_cnt=2, vcd_lane=1) as context:
+        context.dump_signals()
+        top.b <<= 5
+        top.shift <<= 2
+        context.set_lanes(top.a, (7, None))
+        context.run_cycles(1)
+        assert top.flags.sim_value == (0b0011, None)
+    # Unknown bits are tracked individually: 'b >= 0' is known even if 'a' is not
+    assert "bxx1x " in vcd_stream.getvalue()
+
+def test_lane_sim_lane_count():
+    netlist, top = create_netlist(Accumulator)
+    with ExpectError(SimulationException):
+        with LaneSimulator(netlist, StringIO(), lane_cnt=2) as context:
+            context.set_lanes(top.step, (1, 2, 3))
+
+def test_lane_sim_lane_range():
+    netlist, top = create_netlist(Accumulator)
+    with ExpectError(SimulationException):
+        with LaneSimulator(netlist, StringIO(), lane_cnt=2) as context:
+            context.set_lanes(top.step, (1, 16))
+
+if __name__ == "__main__":
+    test_lane_sim_matches_cycle_sim()
@@ -4,6 +4,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent / ".."))
 
 from typing import *
+import os
 
 from silicon import *
 from test_utils import *
@@ -211,6 +212,1087 @@ def test_sim_concat():
 
     test.simulation(top, inspect.currentframe().f_code.co_name)
 
+def test_sim_no_self():
+    # Generators are registered with their module rank up-front, so there's no need for a parameter named 'self'
+    class Inverter(Module):
+        in_a = Input(Unsigned(8))
+        out_a = Output(Unsigned(8))
+
+        def simulate(this) -> TSimEvent:
+            while True:
+                yield this.in_a
+                this.out_a <<= None if this.in_a.sim_value is None else 255 - this.in_a.sim_value
+
+    class top(Module):
+        def body(this):
+            this.a = Wire(Unsigned(8))
+            inv1 = Inverter()
+            inv2 = Inverter()
+            inv1.in_a <<= this.a
+            inv2.in_a <<= inv1.out_a
+            this.b = Wire(Unsigned(8))
+            this.b <<= inv2.out_a
+            this.c = Wire(Unsigned(8))
+            this.c <<= inv1.out_a
+
+        def simulate(this) -> TSimEvent:
+            for i in range(0, 256, 17):
+                this.a <<= i
+                yield 10
+                assert this.b.sim_value == i
+                assert this.c.sim_value == 255 - i
+
+    test.simulation(top, inspect.currentframe().f_code.co_name)
+
+def test_sim_static_sensitivity():
+    class Adder(Module):
+        in_a = Input(Unsigned(8))
+        in_b = Input(Unsigned(8))
+        out_a = Output(Unsigned(9))
+
+        def construct(self):
+            self.wake_cnt = 0
+
+        def simulate(self) -> TSimEvent:
+            sensitivity = StaticSensitivity((self.in_a, self.in_b))
+            while True:
+                yield sensitivity
+                self.wake_cnt += 1
+                if self.in_a.sim_value is None or self.in_b.sim_value is None:
+                    self.out_a <<= None
+                else:
+                    self.out_a <<= self.in_a.sim_value + self.in_b.sim_value
+
+    class top(Module):
+        def body(self):
+            self.a = Wire(Unsigned(8))
+            self.b = Wire(Unsigned(8))
+            self.adder = Adder()
+            self.adder.in_a <<= self.a
+            self.adder.in_b <<= self.b
+            self.sum = Wire(Unsigned(9))
+            self.sum <<= self.adder.out_a
+
+        def simulate(self) -> TSimEvent:
+            for i in range(10):
+                self.a <<= i
+                self.b <<= 2*i+1
+                yield 10
+                assert self.sum.sim_value == 3*i+1
+            start_cnt = self.adder.wake_cnt
+            # No change on the inputs: no wake-up
+            self.a <<= 9
+            yield 10
+            assert self.adder.wake_cnt == start_cnt
+            self.b <<= 0
+            yield 10
+            assert self.adder.wake_cnt == start_cnt + 1
+            assert self.sum.sim_value == 9
+
+    test.simulation(top, inspect.currentframe().f_code.co_name)
+
+def test_sim_static_sensitivity_late():
+    from silicon.simulator import SimStateStore
+
+    class Follower(Module):
+        in_a = Input(Unsigned(8))
+        out_a = Output(Unsigned(8))
+
+        def simulate(self) -> TSimEvent:
+            # The static sensitivity is registered while the simulation runs, after the fan-out table is built
+            yield 5
+            sensitivity = StaticSensitivity(self.in_a)
+            while True:
+                self.out_a <<= self.in_a.sim_value
+                yield sensitivity
+
+    class top(Module):
+        def body(self):
+            self.a = Wire(Unsigned(8))
+            self.outs = []
+            for idx in range(8):
+                follower = Follower()
+                follower.in_a <<= self.a
+                out = Wire(Unsigned(8))
+                out <<= follower.out_a
+                setattr(self, f"out{idx}", out)
+                self.outs.append(out)
+
+        def simulate(self) -> TSimEvent:
+            for i in range(1, 4):
+                self.a <<= i
+                yield 10
+                for out in self.outs:
+                    assert out.sim_value == i
+
+    freeze_cnt = 0
+    freeze_static_fanout = SimStateStore.freeze_static_fanout
+    def counting_freeze(self):
+        nonlocal freeze_cnt
+        if self._static_listeners is not None:
+            freeze_cnt += 1
+        freeze_static_fanout(self)
+
+    with ScopedAttr(SimStateStore, "freeze_static_fanout", counting_freeze):
+        test.simulation(top, inspect.currentframe().f_code.co_name)
+    # Once at setup, and once for all the followers registering in the same delta cycle
+    assert freeze_cnt == 2
+
+def test_sim_static_sensitivity_mixed():
+    class Bad(Module):
+        in_a = Input(Unsigned(8))
+        out_a = Output(Unsigned(8))
+
+        def simulate(self) -> TSimEvent:
+            yield StaticSensitivity(self.in_a)
+            yield self.in_a
+
+    class top(Module):
+        def body(self):
+            self.a = Wire(Unsigned(8))
+            bad = Bad()
+            bad.in_a <<= self.a
+
+        def simulate(self) -> TSimEvent:
+            self.a <<= 1
+            yield 10
+
+    with ExpectError(SimulationException):
+        test.simulation(top, inspect.currentframe().f_code.co_name)
+
+def test_sim_compiled_cones():
+    class top(Module):
+        def body(self):
+            self.a = Wire(Unsigned(8))
+            self.b = Wire(Unsigned(8))
+            self.sel = Wire(logic)
+            self.and_ab = self.a & self.b
+            self.mixed = (self.and_ab | self.a) ^ ~self.b
+            self.result = Wire(Unsigned(8))
+            self.result <<= Select(self.sel, self.mixed, self.and_ab)
+            self.top_bits = Wire(Unsigned(4))
+            self.top_bits <<= self.result[7:4]
+
+        def simulate(self) -> TSimEvent:
+            cones = self._impl.netlist.simulator_context.cones
+            assert len(cones) == 1
+            # Every gate, the Select and the slice should be evaluated by the single cone
+            assert len(cones[0].members) >= 5
+            for a, b, sel in ((0x12, 0x34, 0), (0xf0, 0x3c, 1), (0xff, 0x00, 1), (0x5a, 0xa5, 0)):
+                self.a <<= a
+                self.b <<= b
+                self.sel <<= sel
+                yield 10
+                and_ab = a & b
+                mixed = ((and_ab | a) ^ ~b) & 0xff
+                out = and_ab if sel else mixed
+                assert self.and_ab.sim_value == and_ab
+                assert self.mixed.sim_value == mixed
+                assert self.result.sim_value == out
+                assert self.top_bits.sim_value == out >> 4
+
+    test.simulation(top, inspect.currentframe().f_code.co_name, compile_cones=True)
+
+def test_sim_compiled_cones_nested():
+    class top(Module):
+        def body(self):
+            self.a = Wire(Unsigned(8))
+            self.b = Wire(Unsigned(8))
+            self.c = Wire(Unsigned(8))
+            self.sel = Wire(Unsigned(4))
+            self.result = Select(selector_port = self.sel & 3, value_0 = self.a, value_1 = self.b, value_2 = self.c)
+
+        def simulate(self) -> TSimEvent:
+            self.a <<= 3
+            self.b <<= 5
+            self.c <<= 7
+            for sel, out in ((4, 3), (5, 5), (6, 7)):
+                self.sel <<= sel
+                yield 10
+                assert self.result.sim_value == out
+
+    class other(Module):
+        def body(self):
+            self.a = Wire(logic)
+
+    with Netlist().elaborate() as netlist:
+        top()
+    with Netlist().elaborate() as other_netlist:
+        other()
+    # Cones are compiled while another netlist is being simulated: the compiler must not touch simulation values
+    with Simulator(other_netlist, None):
+        with Simulator(netlist, None, compile_cones=True) as context:
+            assert len(context.cones) > 0
+            context.simulate()
+
+def test_sim_int_values():
+    class top(Module):
+        def body(self):
+            self.a = Wire(Unsigned(8))
+            self.b = Wire(Signed(8))
+            self.sum = Wire(Signed(10))
+            self.sum <<= self.a + self.b
+            self.lt = Wire(logic)
+            self.lt <<= self.a < self.b
+            self.inv = Wire(Unsigned(8))
+            self.inv <<= ~self.a
+            self.fract = Wire(Number(min_val=0, max_val=15, precision=2))
+
+        def simulate(self) -> TSimEvent:
+            self.fract <<= 2.25
+            for a, b in ((3, -5), (200, 100), (7, 7)):
+                self.a <<= a
+                self.b <<= b
+                yield 10
+                # Integer nets store raw ints
+                for net in (self.a, self.b, self.sum, self.lt, self.inv):
+                    assert type(net.sim_value) is int
+                assert self.sum.sim_value == a + b
+                assert self.lt.sim_value == int(a < b)
+                assert self.inv.sim_value == a ^ 0xff
+                # Junction operators still work on them
+                assert (self.a & self.b) == a & b
+                assert ~self.a == a ^ 0xff
+                # Fractional nets use Number.NetValue
+                assert isinstance(self.fract.sim_value, Number.NetValue)
+                assert float(self.fract.sim_value) == 2.25
+            self.a <<= None
+            yield 10
+            assert self.a.sim_value is None
+            assert self.sum.sim_value is None
+
+    test.simulation(top, inspect.currentframe().f_code.co_name)
+
+def test_sim_reg_wake_filter():
+    class Pair(Struct):
+        a = Unsigned(4)
+        b = logic
+
+    class top(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.clk_en = Wire(logic)
+            self.data = Wire(Unsigned(4))
+            self.pair_in = Wire(Pair)
+            self.pair_in.a <<= self.data
+            self.pair_in.b <<= self.data[0]
+            self.gated = Wire(Unsigned(4))
+            self.gated <<= Reg(self.data)
+            self.pair = Wire(Pair)
+            self.pair <<= Reg(self.pair_in)
+
+        def simulate(self, simulator) -> TSimEvent:
+            def clk():
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+                yield 5
+
+            self.clk <<= 0
+            self.rst <<= 1
+            self.clk_en <<= 0
+            self.data <<= 3
+            yield 5
+            yield from clk()
+            assert self.gated.sim_value == 0
+            self.rst <<= 0
+            # Clock enable is low: the register holds its value
+            for _ in range(10):
+                yield from clk()
+            assert self.gated.sim_value == 0
+            self.clk_en <<= 1
+            yield from clk()
+            assert self.gated.sim_value == 3
+            # Input doesn't change: the register has nothing to do
+            for _ in range(10):
+                yield from clk()
+            assert self.gated.sim_value == 3
+            assert self.pair.a.sim_value == 3
+            assert self.pair.b.sim_value == 1
+            self.data <<= 4
+            yield 1
+            yield from clk()
+            assert self.gated.sim_value == 4
+            assert self.pair.a.sim_value == 4
+            assert self.pair.b.sim_value == 0
+            # Input changing with the clock edge results in X
+            self.data <<= 5
+            self.clk <<= 1
+            yield 5
+            self.clk <<= 0
+            yield 5
+            assert self.gated.sim_value is None
+            yield from clk()
+            assert self.gated.sim_value == 5
+            activation_counts = simulator.context.get_activation_counts()
+            # The registers don't wake up on falling edges, or while they're disabled or idle
+            for activation_cnt in activation_counts.values():
+                assert activation_cnt <= 8
+
+    test.simulation(top, inspect.currentframe().f_code.co_name)
+
+def test_sim_register_bank():
+    class Pair(Struct):
+        a = Unsigned(4)
+        b = logic
+
+    class top(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.clk_en = Wire(logic)
+            self.data = Wire(Unsigned(4))
+            self.pair_in = Wire(Pair)
+            self.pair_in.a <<= self.data
+            self.pair_in.b <<= self.data[0]
+            self.count = Wire(Unsigned(4))
+            self.count <<= Reg((self.count + 1)[3:0])
+            self.gated = Wire(Unsigned(4))
+            self.gated <<= Reg(self.data)
+            self.neg = Wire(Unsigned(4))
+            self.neg <<= NegReg(self.data)
+            self.with_reset_value = Wire(Unsigned(4))
+            self.with_reset_value <<= Reg(self.data, reset_value_port=5)
+            self.pair = Wire(Pair)
+            self.pair <<= Reg(self.pair_in)
+
+        def simulate(self) -> TSimEvent:
+            self.clk <<= 0
+            self.rst <<= 1
+            self.clk_en <<= 1
+            for cycle in range(20):
+                if cycle == 3:
+                    self.rst <<= 0
+                self.clk_en <<= int(cycle % 3 != 0)
+                # Change the data together with the clock edge sometimes to get X-es
+                if cycle % 5 == 4:
+                    self.data <<= cycle & 15
+                yield 5
+                self.clk <<= 1
+                if cycle % 5 != 4:
+                    self.data <<= cycle & 15
+                yield 5
+                self.clk <<= 0
+                trace.append(tuple(net.sim_value for net in (self.count, self.gated, self.neg, self.with_reset_value, self.pair.a, self.pair.b)))
+
+    traces = []
+    for bank_registers in (False, True):
+        trace = []
+        with Netlist().elaborate() as netlist:
+            top()
+        with Simulator(netlist, None, bank_registers=bank_registers) as context:
+            context.simulate()
+            if bank_registers:
+                assert len(context.register_banks) == 2
+        traces.append(trace)
+    assert traces[0] == traces[1]
+    # Make sure the test actually exercises something
+    assert any(None in values for values in traces[0])
+    assert traces[0][-1][0] is not None
+
+def test_sim_four_state():
+    from io import StringIO
+
+    class top(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.hi = Wire(Unsigned(4))
+            self.lo = Wire(Unsigned(4))
+            self.data_bus = Wire(Unsigned(8))
+            self.data_bus <<= concat(self.hi, self.lo)
+            self.lo_slice = Wire(Unsigned(4))
+            self.lo_slice <<= self.data_bus[3:0]
+            self.hi_slice = Wire(Unsigned(4))
+            self.hi_slice <<= self.data_bus[7:4]
+            self.masked = Wire(Unsigned(8))
+            self.masked <<= self.data_bus & 0x0f
+            self.ored = Wire(Unsigned(8))
+            self.ored <<= self.data_bus | 0xf0
+            self.inverted = Wire(Unsigned(8))
+            self.inverted <<= ~self.data_bus
+            self.wide = Wire(Unsigned(12))
+            self.wide <<= self.data_bus
+            self.registered = Wire(Unsigned(8))
+            self.registered <<= Reg(self.data_bus)
+
+        def simulate(self) -> TSimEvent:
+            self.clk <<= 0
+            self.rst <<= 0
+            self.lo <<= 5
+            yield 5
+            self.clk <<= 1
+            yield 5
+            trace.append(tuple((net.sim_value, net.four_state_sim_value) for net in (self.data_bus, self.lo_slice, self.hi_slice, self.masked, self.ored, self.inverted, self.wide, self.registered)))
+            self.hi <<= 3
+            yield 5
+            self.clk <<= 0
+            yield 5
+            self.clk <<= 1
+            yield 5
+            trace.append(tuple((net.sim_value, net.four_state_sim_value) for net in (self.data_bus, self.registered)))
+
+    def run(**kwargs):
+        with Netlist().elaborate() as netlist:
+            top()
+        with Simulator(netlist, vcd_stream, **kwargs) as context:
+            if vcd_stream is not None:
+                context.dump_signals()
+            context.simulate()
+        return trace
+
+    # Without four-state simulation, a single unknown bit makes the whole value unknown
+    trace = []
+    vcd_stream = None
+    assert run() == [
+        ((None, None), (None, None), (None, None), (None, None), (None, None), (None, None), (None, None), (None, None)),
+        ((0x35, 0x35), (0x35, 0x35))
+    ]
+    expected = [
+        ((None, XValue(0x05, 0xf0)), (5, 5), (None, XValue(0, 0x0f)), (5, 5), (0xf5, 0xf5), (None, XValue(0x0a, 0xf0)), (None, XValue(0x005, 0x0f0)), (None, XValue(0x05, 0xf0))),
+        ((0x35, 0x35), (0x35, 0x35))
+    ]
+    for kwargs in ({}, {"compile_cones": True}, {"bank_registers": True}):
+        trace = []
+        vcd_stream = StringIO()
+        vcd_stream.close = lambda: None # Keep the content around for the checks below
+        assert run(four_state=True, **kwargs) == expected
+        vcd = vcd_stream.getvalue()
+        assert "bxxxx0101 " in vcd
+        assert "bxxxx1010 " in vcd
+
+def test_sim_two_state():
+    class top(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.hi = Wire(Unsigned(4))
+            self.lo = Wire(Unsigned(4))
+            self.data_bus = Wire(Unsigned(8))
+            self.data_bus <<= concat(self.hi, self.lo)
+            self.ored = Wire(Unsigned(8))
+            self.ored <<= self.data_bus | 0xf0
+            self.inverted = Wire(Unsigned(8))
+            self.inverted <<= ~self.data_bus
+            self.summed = Wire(Unsigned(9))
+            self.summed <<= self.data_bus + self.lo
+            self.registered = Wire(Unsigned(4))
+            self.registered <<= Reg(self.lo)
+
+        def simulate(self) -> TSimEvent:
+            # Nets start with their default value and the combinational logic is evaluated before anything changes
+            trace.append(tuple(net.sim_value for net in (self.data_bus, self.ored, self.inverted, self.summed, self.registered)))
+            yield 1
+            trace.append(tuple(net.sim_value for net in (self.data_bus, self.ored, self.inverted, self.summed, self.registered)))
+            self.clk <<= 0
+            self.rst <<= 0
+            self.lo <<= 5
+            yield 5
+            self.clk <<= 1
+            yield 5
+            trace.append(tuple(net.sim_value for net in (self.data_bus, self.ored, self.inverted, self.summed, self.registered)))
+            self.clk <<= 0
+            self.hi <<= 3
+            yield 5
+            # An input, changing together with the clock
+            self.clk <<= 1
+            self.lo <<= 7
+            yield 5
+            trace.append(tuple(net.sim_value for net in (self.data_bus, self.ored, self.inverted, self.summed, self.registered)))
+
+    def run(**kwargs):
+        with Netlist().elaborate() as netlist:
+            top()
+        with Simulator(netlist, None, **kwargs) as context:
+            context.simulate()
+        return trace
+
+    trace = []
+    assert run() == [
+        (None, None, None, None, None),
+        (None, None, None, None, None),
+        (None, None, None, None, 5),
+        (0x37, 0xf7, 0xc8, 0x3e, None)
+    ]
+    expected = [
+        (0, 0, 0, 0, 0),
+        (0, 0xf0, 0xff, 0, 0),
+        (0x05, 0xf5, 0xfa, 0x0a, 5),
+        (0x37, 0xf7, 0xc8, 0x3e, 5)
+    ]
+    for kwargs in ({}, {"compile_cones": True}, {"bank_registers": True}):
+        trace = []
+        assert run(two_state=True, **kwargs) == expected
+
+    # Unknown values are not allowed in two-state simulation
+    class top_with_x(Module):
+        def body(self):
+            self.a = Wire(Unsigned(8))
+            self.b = Wire(Unsigned(8))
+            self.b <<= self.a & 0x0f
+
+        def simulate(self) -> TSimEvent:
+            self.a <<= 1
+            yield 10
+            self.a <<= None
+            yield 10
+
+    with Netlist().elaborate() as netlist:
+        top_with_x()
+    with ExpectError(SimulationException):
+        netlist.simulate(None, two_state=True)
+    with ExpectError(SimulationException):
+        Simulator(netlist, None, four_state=True, two_state=True)
+
+def test_sim_no_trace():
+    from io import StringIO
+    vcd_stream = StringIO()
+    vcd_stream.close = lambda: None # Keep the content around for the checks below
+
+    class top(Module):
+        def body(self):
+            self.a = Wire(Unsigned(8))
+            self.b = Wire(Unsigned(9))
+            self.b <<= (self.a + 1)[7:0]
+
+        def simulate(self, simulator) -> TSimEvent:
+            self.a <<= 1
+            yield 10
+            assert self.b.sim_value == 2
+            context = simulator.context
+            assert context.vcd_writer is None
+            with ExpectError(SimulationException):
+                context.dump_signals()
+            # Turn tracing on mid-simulation for some of the nets
+            context.start_tracing(vcd_stream)
+            context.dump_signals("b")
+            self.a <<= 2
+            yield 10
+            assert self.b.sim_value == 3
+
+    with Netlist().elaborate() as netlist:
+        top()
+    netlist.simulate(None)
+    vcd = vcd_stream.getvalue()
+    assert " b " in vcd
+    assert " a " not in vcd
+    assert "#10" in vcd
+
+def without_date(vcd: str) -> str:
+    return "\n".join(line for line in vcd.split("\n") if not line.startswith("$date"))
+
+def test_sim_background_trace():
+    import gzip
+    from io import StringIO
+    from silicon.trace_writer import BackgroundVCDWriter
+
+    class top(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.a = Wire(Unsigned(8))
+            self.b = Wire(Unsigned(8))
+            self.b <<= Reg(self.a ^ self.b)
+
+        def simulate(self) -> TSimEvent:
+            self.clk <<= 0
+            self.rst <<= 1
+            for cycle in range(100):
+                if cycle == 2:
+                    self.rst <<= 0
+                self.a <<= (cycle * 37) & 0xff
+                yield 5
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+
+    def run(vcd_file, **kwargs):
+        with Netlist().elaborate() as netlist:
+            top()
+        with Simulator(netlist, vcd_file, **kwargs) as context:
+            context.dump_signals()
+            context.simulate()
+
+    def new_stream():
+        vcd_stream = StringIO()
+        vcd_stream.close = lambda: None # Keep the content around for the checks below
+        return vcd_stream
+
+    # The output of the background writer is the same as the one written directly
+    expected = new_stream()
+    run(expected)
+    expected = without_date(expected.getvalue())
+    assert "#995" in expected
+    vcd_stream = new_stream()
+    run(vcd_stream, background_trace=True)
+    assert without_date(vcd_stream.getvalue()) == expected
+
+    # Compressed output
+    output_dir = Path("output") / "test_sim_background_trace"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    vcd_file = output_dir / "test_sim_background_trace.vcd.gz"
+    run(vcd_file, background_trace=True)
+    with gzip.open(vcd_file, "rt") as compressed:
+        assert without_date(compressed.read()) == expected
+
+    # Small batches and a short queue, so the simulator has to wait for the writer thread
+    vcd_stream = new_stream()
+    writer = BackgroundVCDWriter(vcd_stream, batch_size=2, queue_depth=1, timescale="1ns")
+    var = writer.register_var("top", "x", "wire", size=8)
+    for when in range(1000):
+        writer.change(var, when, when & 0xff)
+    writer.close()
+    assert "#999\nb11100111 " in vcd_stream.getvalue()
+
+    # Errors in the writer thread show up in the simulator
+    writer = BackgroundVCDWriter(new_stream(), batch_size=2, timescale="1ns")
+    var = writer.register_var("top", "x", "wire", size=8)
+    with ExpectError(ValueError):
+        writer.change(var, 0, "not a value")
+        writer.change(var, 1, 1)
+        writer.close()
+
+def test_sim_waveform():
+    from io import StringIO
+    from silicon.waveform import WaveformWriter
+
+    class top(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.a = Wire(Signed(8))
+            self.b = Wire(Signed(8))
+            self.b <<= Reg(self.a)
+
+        def simulate(self) -> TSimEvent:
+            self.clk <<= 0
+            self.rst <<= 1
+            for cycle in range(100):
+                if cycle == 2:
+                    self.rst <<= 0
+                self.a <<= ((cycle * 37) & 0xff) - 128
+                yield 5
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+
+    def run(vcd_file, **kwargs):
+        with Netlist().elaborate() as netlist:
+            top()
+        with Simulator(netlist, vcd_file, **kwargs) as context:
+            context.dump_signals()
+            context.simulate()
+
+    output_dir = Path("output") / "test_sim_waveform"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    vcd_file = output_dir / "test_sim_waveform.vcd"
+    wave_file = output_dir / "test_sim_waveform.wave"
+    run(vcd_file)
+    run(wave_file)
+
+    with WaveformReader(wave_file) as reader:
+        a = reader.get_signal("top.a")
+        assert a.size == 8
+        changes = reader.get_changes(a)
+        assert len(changes) == 100
+        assert changes[0] == (0, -128)
+        assert changes[1] == (10, 37 - 128)
+        # A time window starts with the value at its start
+        assert reader.get_changes("top.a", 15, 30) == [(10, 37 - 128), (20, 74 - 128), (30, 111 - 128)]
+        assert reader.get_changes("top.a", 20, 20) == [(20, 74 - 128)]
+        assert reader.get_changes("top.a", 995) == [(990, ((99 * 37) & 0xff) - 128)]
+        assert reader.get_changes("top.b", 990, 990) == [(985, ((98 * 37) & 0xff) - 128)]
+
+    # Converting to VCD gives the same result as tracing to VCD directly
+    converted = StringIO()
+    convert_to_vcd(wave_file, converted)
+    with open(vcd_file, "rt") as expected:
+        assert without_date(converted.getvalue()) == without_date(expected.read())
+
+    # Small blocks, so windowed reads have to find the right block in the index
+    output_dir = Path("output") / "test_sim_waveform"
+    with open(output_dir / "small_blocks.wave", "wb") as stream:
+        writer = WaveformWriter(stream, block_size=3)
+        var = writer.register_var("top", "x", "wire", size=32)
+        for when in range(1000):
+            writer.change(var, when * 2, when * when - 500)
+        writer.close()
+    with WaveformReader(output_dir / "small_blocks.wave") as reader:
+        assert len(reader.index[0]) == 334
+        assert reader.get_changes("top.x", 1001, 1006) == [(1000, 500 * 500 - 500), (1002, 501 * 501 - 500), (1004, 502 * 502 - 500), (1006, 503 * 503 - 500)]
+        assert len(reader.get_changes("top.x")) == 1000
+
+def test_sim_wave_capture():
+    import numpy as np
+
+    class top(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.a = Wire(Unsigned(8))
+            self.b = Wire(Unsigned(8))
+            self.b <<= Reg(self.a)
+
+        def simulate(self) -> TSimEvent:
+            self.clk <<= 0
+            self.rst <<= 1
+            for cycle in range(100):
+                if cycle == 2:
+                    self.rst <<= 0
+                self.a <<= (cycle * 37) & 0xff
+                yield 5
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+
+    with Netlist().elaborate() as netlist:
+        dut = top()
+    with Simulator(netlist, None) as context:
+        capture = context.capture(dut.clk, dut.a, dut.b)
+        context.simulate()
+
+    clk = capture[dut.clk]
+    a = capture[dut.a]
+    b = capture[dut.b]
+    assert dut.rst not in capture
+    rising_clk = clk.rising_edges()
+    assert np.array_equal(rising_clk, np.arange(5, 1000, 10))
+    assert np.array_equal(clk.falling_edges(start=101, end=130), np.array([110, 120, 130]))
+    assert a.values.dtype == np.int64
+    assert len(a) == 101 # The initial (unknown) value and the 100 assignments
+    # The register samples 'a' on every rising clock edge once out of reset
+    sampled = rising_clk[rising_clk > 20]
+    assert np.array_equal(b.value_at(sampled), a.value_before(sampled))
+    assert np.array_equal(b.value_before(sampled[1:]), a.value_before(sampled[:-1]))
+    # Until the first clock edge, the register output is unknown
+    assert b.value_at(0) is None
+    assert b.value_at(0, default=-1) == -1
+    assert b.value_at(5) == 0
+    assert list(b.value_at(np.array([0, 5]), default=-1)) == [-1, 0]
+    assert list(b.value_at(np.array([0, 5]))) == [None, 0]
+    assert not b.known[0]
+    assert a.value_at(1000) == (99 * 37) & 0xff
+    assert clk.next_edge(5, 0, 1) == 15
+    assert clk.next_edge(995, 0, 1) is None
+    assert a.next_edge(10, to_value=(3 * 37) & 0xff) == 30
+
+def test_sim_dump_window():
+    class top(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.a = Wire(Unsigned(8))
+            self.b = Wire(Unsigned(8))
+            self.b <<= Reg(self.a)
+
+        def simulate(self) -> TSimEvent:
+            for cycle in range(100):
+                self.a <<= cycle
+                self.clk <<= 0
+                yield 5
+                self.clk <<= 1
+                yield 5
+
+    def run(vcd_file, setup, **kwargs):
+        with Netlist().elaborate() as netlist:
+            top()
+        with Simulator(netlist, vcd_file, **kwargs) as context:
+            context.dump_signals()
+            setup(context)
+            context.simulate()
+            return context
+
+    def get_timestamps(vcd_file):
+        with open(vcd_file, "rt") as vcd:
+            return [int(line[1:]) for line in vcd if line.startswith("#")]
+
+    output_dir = Path("output") / "test_sim_dump_window"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Time windows
+    vcd_file = output_dir / "window.vcd"
+    context = run(vcd_file, lambda context: (context.dump_window(100, 200), context.dump_window(300, 320)))
+    assert get_timestamps(vcd_file) == [0] + list(range(100, 200, 5)) + [200] + [300, 305, 310, 315, 320]
+    # Outside of the windows, there are no tracing hooks
+    assert "set_value" not in context.state_store.__dict__
+    wave_file = output_dir / "window.wave"
+    run(wave_file, lambda context: context.dump_window(100, 200))
+    with WaveformReader(wave_file) as reader:
+        # The window starts with the values at its start, followed by the changes at that time
+        assert reader.get_changes("top.a") == [(0, None), (100, 9)] + [(time, time // 10) for time in range(100, 200, 10)] + [(200, None)]
+
+    # A trigger, with the history before it
+    vcd_file = output_dir / "trigger.vcd"
+    run(vcd_file, lambda context: context.dump_on_trigger(context.netlist.top_level.a, lambda value: value == 50, pre_trigger=30, post_trigger=20))
+    assert get_timestamps(vcd_file) == [0, 470, 475, 480, 485, 490, 495, 500, 505, 510, 515, 520]
+    with open(vcd_file, "rt") as vcd:
+        content = vcd.read()
+    assert "$dumpoff" in content and "$dumpon" in content
+    for trace_format, kwargs in (("wave", {}), ("vcd", {"background_trace": True})):
+        trace_file = output_dir / f"trigger_{trace_format}.{trace_format}"
+        run(trace_file, lambda context: context.dump_on_trigger(context.netlist.top_level.a, lambda value: value == 50, pre_trigger=30, post_trigger=20), **kwargs)
+        if trace_format == "wave":
+            with WaveformReader(trace_file) as reader:
+                assert reader.get_changes("top.a") == [(0, None), (470, 47), (480, 48), (490, 49), (500, 50), (510, 51), (520, None)]
+        else:
+            with open(trace_file, "rt") as vcd:
+                assert without_date(vcd.read()) == without_date(content)
+
+    # A trigger that never fires: nothing gets written after the start
+    vcd_file = output_dir / "no_trigger.vcd"
+    run(vcd_file, lambda context: context.dump_on_trigger(context.netlist.top_level.a, lambda value: value == 200, pre_trigger=30))
+    assert get_timestamps(vcd_file) == [0]
+
+    # Without a pre-trigger history, the window starts at the trigger
+    vcd_file = output_dir / "trigger_now.vcd"
+    run(vcd_file, lambda context: context.dump_on_trigger(context.netlist.top_level.a, lambda value: value == 98))
+    assert get_timestamps(vcd_file) == [0, 980, 985, 990, 995]
+
+    with ExpectError(SimulationException):
+        run(None, lambda context: context.dump_window(100, 200))
+
+def test_sim_signal_index():
+    class Leaf(Module):
+        data_in = Input(Unsigned(8))
+        data_out = Output(Unsigned(8))
+
+        def body(self):
+            self.data_out <<= (self.data_in + 1)[7:0]
+
+    class Mid(Module):
+        data_in = Input(Unsigned(8))
+        data_out = Output(Unsigned(8))
+
+        def body(self):
+            self.u_leaf = Leaf()
+            self.u_leaf.data_in <<= self.data_in
+            self.data_out <<= self.u_leaf.data_out
+
+    class top(Module):
+        def body(self):
+            self.a = Wire(Unsigned(8))
+            self.u_mid1 = Mid()
+            self.u_mid2 = Mid()
+            self.u_mid1.data_in <<= self.a
+            self.u_mid2.data_in <<= self.u_mid1.data_out
+            self.result = Wire(Unsigned(8))
+            self.result <<= self.u_mid2.data_out
+
+        def simulate(self) -> TSimEvent:
+            for value in range(10):
+                self.a <<= value
+                yield 10
+
+    with Netlist().elaborate() as netlist:
+        top()
+    index = netlist.get_signal_index()
+    assert netlist.get_signal_index() is index
+
+    def names(entries):
+        return [entry.full_name for entry in entries]
+
+    assert names(index.glob("top.u_mid1.u_leaf.data_*")) == ["top.u_mid1.u_leaf.data_in", "top.u_mid1.u_leaf.data_out"]
+    assert set(names(index.glob("top.*.data_in"))) == {"top.u_mid1.data_in", "top.u_mid2.data_in"}
+    assert set(names(index.glob("top.**.data_out"))) == {"top.u_mid1.data_out", "top.u_mid2.data_out", "top.u_mid1.u_leaf.data_out", "top.u_mid2.u_leaf.data_out"}
+    assert set(names(index.glob("top.u_mid?.u_leaf.data_?n"))) == {"top.u_mid1.u_leaf.data_in", "top.u_mid2.u_leaf.data_in"}
+    assert names(index.glob("top.u_nothing.*")) == []
+    assert set(names(index.match("data_in", max_depth=2))) == {"top.u_mid1.data_in", "top.u_mid2.data_in"}
+    assert set(entry.depth for entry in index.match("data_")) == {2, 3}
+    assert set(names(index.glob("top.**.*", max_depth=1))) == {"top.a", "top.result", "top.u_mid1_data_out"}
+    entry = index.lookup("top.u_mid2.u_leaf.data_in")
+    assert entry.xnet is index.lookup("top.u_mid1.data_out").xnet
+    assert index.lookup("top.u_mid2.nothing") is None
+
+    # The same selections, for tracing and for capturing
+    output_dir = Path("output") / "test_sim_signal_index"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with Simulator(netlist, output_dir / "test_sim_signal_index.wave") as context:
+        context.dump_signals(signal_glob="top.**.data_out", max_depth=2)
+        capture = context.capture("top.u_mid2.u_leaf.data_out")
+        context.simulate()
+    assert len(capture["top.u_mid2.u_leaf.data_out"]) == 11
+    with WaveformReader(output_dir / "test_sim_signal_index.wave") as reader:
+        assert set(reader.get_full_name(signal) for signal in reader.signals) == {"top.u_mid1.data_out", "top.u_mid2.data_out"}
+        assert reader.get_changes("top.u_mid2.data_out", 90) == [(90, 11)]
+    with ExpectError(SimulationException):
+        with Simulator(netlist, None) as context:
+            context.capture("top.u_mid3.data_out")
+
+def test_sim_snapshot():
+    import pytest
+    if not hasattr(os, "fork"):
+        pytest.skip("snapshots need os.fork")
+    settings = {"step": 1}
+
+    class top(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.step = Wire(Unsigned(8))
+            self.rst = Wire(logic)
+            self.acc = Wire(Unsigned(8))
+            self.acc <<= Reg((self.acc + self.step)[7:0], reset_value_port=0, reset_port=self.rst)
+
+        def simulate(self) -> TSimEvent:
+            self.clk <<= 0
+            self.rst <<= 1
+            for cycle in range(20):
+                if cycle == 1:
+                    self.rst <<= 0
+                self.step <<= settings["step"]
+                yield 5
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+
+    def run_variant(context, step, vcd_file = None):
+        settings["step"] = step
+        if vcd_file is not None:
+            context.start_tracing(vcd_file)
+            context.dump_signals()
+        context.simulate()
+        return context.now, dut.acc.sim_value
+
+    def fail(context):
+        raise ValueError("failed variant")
+
+    output_dir = Path("output") / "test_sim_snapshot"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with Netlist().elaborate() as netlist:
+        dut = top()
+    with Simulator(netlist, None) as context:
+        context.simulate(100)
+        assert dut.acc.sim_value == 9
+        snapshot = context.snapshot()
+        assert snapshot.run(run_variant, 1) == (200, 19)
+        assert snapshot.run(run_variant, 3, output_dir / "variant.vcd") == (200, 37) # The step of the cycle the snapshot was taken in was already set
+        with ExpectError(ValueError):
+            snapshot.run(fail)
+        # Variants don't change the state of the parent
+        assert settings["step"] == 1
+        assert dut.acc.sim_value == 9
+        settings["step"] = 3
+        context.simulate()
+        assert dut.acc.sim_value == 37
+        with ExpectError(SimulationException):
+            snapshot.run(run_variant, 1)
+    with open(output_dir / "variant.vcd", "r") as vcd:
+        lines = vcd.read().split("\n")
+    assert "#100" in lines
+    assert "#95" not in lines
+
+def test_sim_shared_netlist():
+    from io import StringIO
+    import threading
+
+    class top(Module):
+        def body(self):
+            self.clk = Wire(logic)
+            self.rst = Wire(logic)
+            self.step = Wire(Unsigned(8))
+            self.acc = Wire(Unsigned(8))
+            self.acc <<= Reg((self.acc + self.step)[7:0], reset_value_port=0, reset_port=self.rst)
+
+        def simulate(self) -> TSimEvent:
+            # Every simulator of the netlist can get a different stimulus
+            step = get_simulator(self).step
+            self.clk <<= 0
+            self.rst <<= 1
+            for cycle in range(50):
+                if cycle == 1:
+                    self.rst <<= 0
+                self.step <<= step
+                yield 5
+                self.clk <<= 1
+                yield 5
+                self.clk <<= 0
+
+    def run(step, vcd_stream = None):
+        simulator = Simulator(netlist, vcd_stream)
+        simulator.step = step
+        with simulator as context:
+            if vcd_stream is not None:
+                context.dump_signals()
+            context.simulate()
+            activation_counts[step] = context.get_activation_counts()
+            return dut.acc.sim_value
+
+    activation_counts = {}
+    with Netlist().elaborate() as netlist:
+        dut = top()
+    # One after the other
+    assert run(1) == 49
+    assert run(2) == 98
+    assert run(3) == (49 * 3) & 0xff
+    # Nested
+    outer = Simulator(netlist, None)
+    outer.step = 3
+    with outer as context:
+        context.simulate(100)
+        assert dut.acc.sim_value == 27
+        assert run(1) == 49
+        assert dut.acc.sim_value == 27
+        context.simulate()
+        assert dut.acc.sim_value == (49 * 3) & 0xff
+        # The nested simulation didn't count towards the activations of the outer one
+        assert context.get_activation_counts() == activation_counts[3]
+    # In parallel threads
+    streams = {step: StringIO() for step in range(1, 5)}
+    results = {}
+    def run_thread(step):
+        results[step] = run(step, streams[step])
+    threads = tuple(threading.Thread(target=run_thread, args=(step,)) for step in streams.keys())
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {step: (49 * step) & 0xff for step in streams.keys()}
+    reference = StringIO()
+    run(4, reference)
+    assert without_date(streams[4].getvalue()) == without_date(reference.getvalue())
+    assert netlist.simulator_context is None
+
+def test_sim_context_threads():
+    import threading
+
+    class top(Module):
+        def body(self):
+            self.a = Wire(Unsigned(8))
+            self.b = Wire(Unsigned(8))
+            self.b <<= (self.a + 1)[7:0]
+
+    class other(Module):
+        def body(self):
+            self.a = Wire(logic)
+
+    with Netlist().elaborate() as netlist:
+        dut = top()
+    results = {}
+    def run_thread():
+        # Every thread has a context of its own, but elaboration can't overlap a simulation in another thread
+        results["context"] = Context.current()
+        try:
+            with Netlist().elaborate():
+                other()
+        except SyntaxErrorException:
+            results["elaboration"] = "failed"
+        results["after"] = Context.current()
+    with Simulator(netlist, None) as context:
+        thread = threading.Thread(target=run_thread)
+        thread.start()
+        thread.join()
+        assert Context.current() == Context.simulation
+        dut.a <<= 3
+        context.simulate()
+        assert dut.b.sim_value == 4
+    assert results == {"context": None, "elaboration": "failed", "after": None}
+    assert Context.current() is None
+    # Once the simulation is done, elaborating in a thread works again
+    thread = threading.Thread(target=run_thread)
+    results.clear()
+    thread.start()
+    thread.join()
+    assert results == {"context": None, "after": None}
+
 if __name__ == "__main__":
     #test_sim_gates()
     test_sim_counter()
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / ".."))
+
+from typing import *
+
+from silicon import *
+from silicon.timeline import ListTimeline, HeapTimeline
+from test_utils import *
+import inspect
+
+class _Event(object):
+    def __init__(self, when: int):
+        self.when = when
+
+def _check_timeline(timeline):
+    times = (50, 10, 30, 10, 20, 50, 0, 40)
+    events = {}
+    for when in times:
+        event = timeline.get_event(when, _Event)
+        assert events.setdefault(when, event) is event
+    assert len(timeline) == len(events)
+    popped = []
+    while len(timeline) > 0:
+        popped.append(timeline.pop().when)
+    assert popped == sorted(events.keys())
+
+def test_list_timeline():
+    _check_timeline(ListTimeline())
+
+def test_heap_timeline():
+    _check_timeline(HeapTimeline())
+
+def _sim_timeline(timeline, test_name: str) -> Tuple[int, Sequence[int]]:
+    class ClkGen(GenericModule):
+        clk = Output(logic)
+        def construct(self, period: int):
+            self.period = period
+            self.toggle_cnt = 0
+        def simulate(self) -> TSimEvent:
+            self.clk <<= 0
+            for _ in range(20):
+                yield self.period
+                self.clk <<= ~self.clk
+                self.toggle_cnt += 1
+
+    class top(Module):
+        def body(self):
+            self.gens = tuple(ClkGen(period) for period in (7, 3, 11, 5, 3))
+            self.clks = tuple(gen.clk for gen in self.gens)
+
+    with Netlist().elaborate() as netlist:
+        top_inst = top()
+    output_dir = Path("output") / test_name
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with Simulator(netlist, output_dir / f"{test_name}.vcd", timeline=timeline) as context:
+        end_time = context.simulate()
+    return end_time, tuple(gen.toggle_cnt for gen in top_inst.gens)
+
+def test_sim_list_vs_heap_timeline():
+    list_result = _sim_timeline(ListTimeline(), "test_sim_list_timeline")
+    heap_result = _sim_timeline(HeapTimeline(), "test_sim_heap_timeline")
+    assert list_result == heap_result
+    assert list_result == (11*20, (20, )*5)
+
+if __name__ == "__main__":
+    test_heap_timeline()
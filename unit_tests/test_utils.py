@@ -1,5 +1,5 @@
-from silicon import SystemVerilog, File, Build, Netlist, Optional
-from typing import IO, Callable, Any
+from silicon import SystemVerilog, File, Build, Netlist, Module, Optional
+from typing import IO, Callable, Any, Tuple
 import pytest
 from pathlib import Path
 import re
@@ -107,7 +107,8 @@ class test(Build):
         end_time: Optional[int] = None,
         timescale='1ns',
         signal_pattern: str = ".",
-        add_unnamed_scopes: bool = False
+        add_unnamed_scopes: bool = False,
+        compile_cones: bool = False
     ):
         if test_name is None:
             test_name = top_class.__name__.lower()
@@ -123,7 +124,8 @@ class test(Build):
             end_time = end_time,
             timescale = timescale,
             signal_pattern = signal_pattern,
-            add_unnamed_scopes = add_unnamed_scopes
+            add_unnamed_scopes = add_unnamed_scopes,
+            compile_cones = compile_cones
         )
         print(f"Simulation results saved into {Path(vcd_filename).absolute()}")
         test_diff = ""
@@ -169,3 +171,9 @@ class ExpectError(object):
 # a lower-case letter preceded by an underscore. So MyClass becomes my_class
 def decammelize_name(name: str) -> str:
     return re.sub( '(?<!^)(?=[A-Z])', '_', name).lower()
+
+# Elaborate an instance of top_class in a fresh netlist, returning both
+def create_netlist(top_class: Callable) -> Tuple[Netlist, Module]:
+    with Netlist().elaborate() as netlist:
+        top = top_class()
+    return netlist, top